@@ -1,7 +1,12 @@
+import asyncio
 import json
 import logging
-from typing import Any, Dict, List, Optional
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
 from backend.core.llm.base import BaseLLMProvider
+from backend.core.llm.cache import LLMResponseCache, response_cache_key
+from backend.core.llm.parsing import parse_json_response
+from backend.core.serialization import dumps, loads
 from backend.tools.registry.registry import ToolRegistry
 
 logger = logging.getLogger(__name__)
@@ -25,15 +30,176 @@ Output Format:
   "rationale": "One sentence explaining choice"
 }}"""
 
+# The template has a single placeholder; split it once so building the prompt is
+# plain concatenation rather than a str.format parse per rebuild.
+_PROMPT_HEAD, _PROMPT_TAIL = (
+    part.replace("{{", "{").replace("}}", "}")
+    for part in EXECUTOR_SYSTEM_PROMPT.split("{tool_definitions}")
+)
+
+SelectionKey = Tuple[str, str, int]
+
 class ExecutorAgent:
     """
     Tactical agent responsible for converting task steps into tool invocations.
     Stateless reasoning component focused on tool selection and parameterization.
     """
+
+    # Upper bound on remembered (step, context, registry version) selections
+    SELECTION_CACHE_SIZE = 256
     
-    def __init__(self, llm_client: BaseLLMProvider, registry: ToolRegistry):
+    def __init__(
+        self,
+        llm_client: BaseLLMProvider,
+        registry: ToolRegistry,
+        response_cache: Optional[LLMResponseCache] = None
+    ):
         self.llm = llm_client
         self.registry = registry
+        # Optional on-disk second level, shared across controllers/processes
+        self.response_cache = response_cache
+        self._system_prompt: Optional[str] = None
+        self._system_prompt_version: Optional[int] = None
+        self._selection_cache: "OrderedDict[SelectionKey, Dict[str, Any]]" = OrderedDict()
+
+    def get_system_prompt(self) -> str:
+        """
+        Return the formatted system prompt, rebuilding it only when the
+        registry has changed since the last build.
+        """
+        version = self.registry.version
+        if self._system_prompt is None or self._system_prompt_version != version:
+            self._system_prompt = (
+                _PROMPT_HEAD
+                + self.registry.get_tool_definitions_json()
+                + _PROMPT_TAIL
+            )
+            self._system_prompt_version = version
+        return self._system_prompt
+
+    @staticmethod
+    def build_user_prompt(step_description: str, context: Optional[Dict[str, Any]] = None) -> str:
+        """Build the per-step portion of the selection prompt."""
+        return "Task Step: " + step_description + "\nContext: " + dumps(context or {})
+
+    def _selection_key(self, step_description: str, context: Optional[Dict[str, Any]]) -> SelectionKey:
+        return (step_description, dumps(context or {}), self.registry.version)
+
+    def _cached_selection(self, key: SelectionKey) -> Optional[Dict[str, Any]]:
+        selection = self._selection_cache.get(key)
+        if selection is None:
+            return None
+        self._selection_cache.move_to_end(key)
+        return dict(selection)
+
+    def _remember_selection(self, key: SelectionKey, selection: Dict[str, Any]) -> None:
+        # "none" answers and parse failures are not cached so they get retried
+        tool_name = selection.get("tool")
+        if not tool_name or tool_name == "none":
+            return
+        self._selection_cache[key] = dict(selection)
+        self._selection_cache.move_to_end(key)
+        if len(self._selection_cache) > self.SELECTION_CACHE_SIZE:
+            self._selection_cache.popitem(last=False)
+
+    def _response_cache_key(self, user_prompt: str) -> str:
+        # The system prompt embeds the tool definitions, so it fingerprints them
+        return response_cache_key(
+            str(getattr(self.llm, "model", "")),
+            self.get_system_prompt(),
+            user_prompt
+        )
+
+    async def _lookup_selection(self, key: SelectionKey, user_prompt: str) -> Optional[Dict[str, Any]]:
+        return (await self._lookup_selections([key], [user_prompt]))[0]
+
+    async def _lookup_selections(
+        self,
+        keys: List[SelectionKey],
+        user_prompts: List[str]
+    ) -> List[Optional[Dict[str, Any]]]:
+        """
+        Cached selection (or None) per key: memory first, then a single
+        on-disk lookup for everything memory missed.
+        """
+        selections = [self._cached_selection(key) for key in keys]
+        if self.response_cache is None:
+            return selections
+        response_keys = {
+            index: self._response_cache_key(user_prompts[index])
+            for index, selection in enumerate(selections)
+            if selection is None
+        }
+        if not response_keys:
+            return selections
+        stored = await asyncio.to_thread(self.response_cache.get_many, list(response_keys.values()))
+        for index, response_key in response_keys.items():
+            value = stored.get(response_key)
+            if value is not None:
+                selection = loads(value)
+                self._remember_selection(keys[index], selection)
+                selections[index] = selection
+        return selections
+
+    async def _store_selection(self, key: SelectionKey, user_prompt: str, selection: Dict[str, Any]) -> None:
+        await self._store_selections([key], [user_prompt], [selection])
+
+    async def _store_selections(
+        self,
+        keys: List[SelectionKey],
+        user_prompts: List[str],
+        selections: List[Dict[str, Any]]
+    ) -> None:
+        """Remember selections in memory and persist the cacheable ones in one write."""
+        items = []
+        for key, user_prompt, selection in zip(keys, user_prompts, selections):
+            self._remember_selection(key, selection)
+            if self.response_cache is not None and key in self._selection_cache:
+                items.append((self._response_cache_key(user_prompt), dumps(selection)))
+        if items:
+            await asyncio.to_thread(self.response_cache.set_many, items)
+
+    async def select_tool(self, step_description: str, context: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """
+        Ask the LLM to choose a tool for the step and return the parsed selection.
+        Identical step/context pairs are answered from cache while the
+        registry is unchanged.
+        """
+        key = self._selection_key(step_description, context)
+        user_prompt = self.build_user_prompt(step_description, context)
+        cached = await self._lookup_selection(key, user_prompt)
+        if cached is not None:
+            return cached
+        response = await self.llm.generate(user_prompt, system_prompt=self.get_system_prompt())
+        selection = self._parse_response(response)
+        await self._store_selection(key, user_prompt, selection)
+        return selection
+
+    async def select_tools_batch(self, steps: List[Tuple[str, Optional[Dict[str, Any]]]]) -> List[Dict[str, Any]]:
+        """
+        Select tools for independent steps in a single batched provider call.
+        All prompts share the cached system prefix; results follow input order.
+        Steps with a cached selection are left out of the provider call.
+        """
+        if not steps:
+            return []
+        keys = [self._selection_key(description, context) for description, context in steps]
+        prompts = [self.build_user_prompt(description, context) for description, context in steps]
+        selections = await self._lookup_selections(keys, prompts)
+        misses = [index for index, selection in enumerate(selections) if selection is None]
+        if misses:
+            responses = await self.llm.generate_batch(
+                [prompts[index] for index in misses],
+                system_prompt=self.get_system_prompt()
+            )
+            for index, response in zip(misses, responses):
+                selections[index] = self._parse_response(response)
+            await self._store_selections(
+                [keys[index] for index in misses],
+                [prompts[index] for index in misses],
+                [selections[index] for index in misses]
+            )
+        return selections  # type: ignore[return-value]
 
     async def execute_step(self, step_description: str, context: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """
@@ -42,24 +208,29 @@ class ExecutorAgent:
         Returns:
             A dict containing the execution result, tool used, and status.
         """
-        tool_defs = self.registry.get_tool_definitions()
-        
-        prompt = EXECUTOR_SYSTEM_PROMPT.format(
-            tool_definitions=json.dumps(tool_defs, indent=2)
-        )
-        
-        user_prompt = f"Task Step: {step_description}\nContext: {json.dumps(context or {})}"
-        
-        full_prompt = f"{prompt}\n\n{user_prompt}"
-        
-        response = await self.llm.generate(full_prompt)
-        selection = self._parse_response(response)
-        
+        selection = await self.select_tool(step_description, context)
+        return await self._execute_selection(step_description, selection)
+
+    async def execute_steps_batch(self, steps: List[Tuple[str, Optional[Dict[str, Any]]]]) -> List[Dict[str, Any]]:
+        """
+        Process independent steps together: one batched selection call, then
+        concurrent tool execution. Results follow input order.
+        """
+        selections = await self.select_tools_batch(steps)
+        return list(await asyncio.gather(*(
+            self._execute_selection(description, selection)
+            for (description, _), selection in zip(steps, selections)
+        )))
+
+    async def _execute_selection(self, step_description: str, selection: Dict[str, Any]) -> Dict[str, Any]:
+        """Invoke the tool chosen by a parsed selection."""
         tool_name = selection.get("tool")
         params = selection.get("params", {})
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Executor selected tool %s for step: %s", tool_name, step_description)
         
         if tool_name == "none" or not tool_name:
-            logger.warning(f"Executor could not find a tool for step: {step_description}")
+            logger.warning("Executor could not find a tool for step: %s", step_description)
             return {
                 "status": "FAILED",
                 "error": f"No suitable tool found: {selection.get('rationale', 'Unknown reason')}",
@@ -75,7 +246,7 @@ class ExecutorAgent:
                 "params": params
             }
         except Exception as e:
-            logger.error(f"Execution failed for tool {tool_name}: {str(e)}")
+            logger.error("Execution failed for tool %s: %s", tool_name, e)
             return {
                 "status": "FAILED",
                 "error": str(e),
@@ -86,13 +257,8 @@ class ExecutorAgent:
     def _parse_response(self, response: str) -> Dict[str, Any]:
         """Extract JSON from LLM response."""
         try:
-            if "```json" in response:
-                response = response.split("```json")[1].split("```")[0].strip()
-            elif "```" in response:
-                response = response.split("```")[1].split("```")[0].strip()
-            
-            return json.loads(response)
-        except (json.JSONDecodeError, IndexError):
+            return parse_json_response(response)
+        except json.JSONDecodeError:
             # Fallback if LLM fails to provide valid JSON
-            logger.error(f"Failed to parse LLM response in Executor: {response}")
+            logger.error("Failed to parse LLM response in Executor: %s", response)
             return {"tool": "none", "rationale": "Invalid response format from LLM"}
@@ -1,8 +1,10 @@
 import json
 import logging
+from collections import deque
 from typing import Any, Dict, List, Optional, Set
 from backend.memory.working_state import WorkingStateManager
 from backend.core.llm.base import BaseLLMProvider
+from backend.core.llm.parsing import parse_json_response
 
 logger = logging.getLogger(__name__)
 
@@ -106,14 +108,8 @@ Decompose this goal into concrete sub-tasks. Output JSON only."""
     def _parse_response(self, response: str) -> Dict[str, Any]:
         """Extract JSON from LLM response."""
         try:
-            # Handle potential markdown fencing
-            if "```json" in response:
-                response = response.split("```json")[1].split("```")[0].strip()
-            elif "```" in response:
-                response = response.split("```")[1].split("```")[0].strip()
-            
-            return json.loads(response)
-        except (json.JSONDecodeError, IndexError) as e:
+            return parse_json_response(response)
+        except json.JSONDecodeError as e:
             raise InvalidPlanError(f"Failed to parse LLM response as JSON: {str(e)}")
 
     def _validate_plan(self, plan: Dict[str, Any]) -> None:
@@ -125,37 +121,30 @@ Decompose this goal into concrete sub-tasks. Output JSON only."""
         if not tasks:
             raise InvalidPlanError("Plan contains no tasks")
 
-        task_ids = {str(t.get("id")) for t in tasks}
-        
-        # Check for cycles
-        adj = {str(t.get("id")): [str(d) for d in t.get("dependencies", [])] for t in tasks}
-        
-        # Verify all dependencies exist
-        for tid, deps in adj.items():
+        # Kahn's algorithm: a single pass builds in-degrees and the reverse
+        # adjacency (dependency -> dependents) while checking dependencies exist.
+        deps_by_task = {str(t.get("id")): [str(d) for d in t.get("dependencies", [])] for t in tasks}
+        in_degree: Dict[str, int] = {}
+        dependents: Dict[str, List[str]] = {tid: [] for tid in deps_by_task}
+        for tid, deps in deps_by_task.items():
             for dep in deps:
-                if dep not in task_ids:
+                if dep not in dependents:
                     raise InvalidPlanError(f"Task {tid} depends on non-existent task {dep}")
-
-        # Cycle detection using DFS
-        visited = set()
-        path = set()
-
-        def has_cycle(v: str) -> bool:
-            visited.add(v)
-            path.add(v)
-            for neighbor in adj.get(v, []):
-                if neighbor not in visited:
-                    if has_cycle(neighbor):
-                        return True
-                elif neighbor in path:
-                    return True
-            path.remove(v)
-            return False
-
-        for tid in task_ids:
-            if tid not in visited:
-                if has_cycle(tid):
-                    raise InvalidPlanError("Plan contains circular dependencies")
+                dependents[dep].append(tid)
+            in_degree[tid] = len(deps)
+
+        queue = deque(tid for tid, degree in in_degree.items() if degree == 0)
+        visited = 0
+        while queue:
+            tid = queue.popleft()
+            visited += 1
+            for child in dependents[tid]:
+                in_degree[child] -= 1
+                if in_degree[child] == 0:
+                    queue.append(child)
+
+        if visited < len(deps_by_task):
+            raise InvalidPlanError("Plan contains circular dependencies")
 
     def _is_valid_dag(self, plan: Dict[str, Any]) -> bool:
         """Utility method for checking DAG status (reuses validation logic)."""
@@ -1,8 +1,11 @@
 import os
+from contextlib import asynccontextmanager
 from time import perf_counter
 
-from fastapi import APIRouter, FastAPI, HTTPException
+from fastapi import APIRouter, FastAPI, Request
+from fastapi.openapi.utils import get_openapi
 from fastapi.responses import PlainTextResponse
+from pydantic import TypeAdapter
 
 from backend.api.models import (
     TaskRequest,
@@ -11,11 +14,41 @@ from backend.api.models import (
     VoiceTTSRequest,
     VoiceWakeWordRequest,
 )
+from backend.core.config.settings import get_settings
 from backend.core.controller import ECFController
+from backend.core.llm.provider import OpenAIProvider
 from backend.core.observability.logging import metrics_collector
 from backend.tools.voice import VoiceSTTTool, VoiceTTSTool, VoiceWakeWordTool
 
-app = FastAPI(title="JARVISv4 API", version="0.1.0")
+# Adapters build their serializer once; handlers reuse the bound dump for tool kwargs.
+_STT_DUMP = TypeAdapter(VoiceSTTRequest).dump_python
+_TTS_DUMP = TypeAdapter(VoiceTTSRequest).dump_python
+_WAKE_WORD_DUMP = TypeAdapter(VoiceWakeWordRequest).dump_python
+
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Voice tools are stateless wrappers; build them once per process.
+    # ECFController stays per-request because it tracks per-task state, but
+    # it borrows the process-wide settings and LLM client (connection pool).
+    settings = get_settings()
+    app.state.settings = settings
+    app.state.llm = OpenAIProvider(
+        model=settings.llm_model,
+        api_key=settings.llm_api_key,
+        base_url=settings.llm_base_url
+    )
+    app.state.voice_stt = VoiceSTTTool()
+    app.state.voice_tts = VoiceTTSTool()
+    app.state.voice_wake_word = VoiceWakeWordTool()
+    try:
+        yield
+    finally:
+        await app.state.llm.close()
+
+
+app = FastAPI(title="JARVISv4 API", version="0.1.0", lifespan=lifespan)
 router = APIRouter()
 
 
@@ -24,24 +57,29 @@ async def metrics() -> str:
     return metrics_collector.get_prometheus_metrics()
 
 
+_HEALTH_OK = {"status": "ok"}
+
+
 @router.get("/healthz")
 async def healthz() -> dict:
-    return {"status": "ok"}
+    return _HEALTH_OK
 
 
 @router.post("/v1/tasks", response_model=TaskResponse)
-async def create_task(payload: TaskRequest) -> TaskResponse:
-    if not payload.goal.strip():
-        raise HTTPException(status_code=400, detail="goal must be non-empty")
-
+async def create_task(payload: TaskRequest, request: Request) -> TaskResponse:
     start_time = perf_counter()
     success = False
-    controller = ECFController()
+    controller = ECFController(
+        settings=request.app.state.settings,
+        llm=request.app.state.llm
+    )
     try:
         task_id = await controller.run_task(payload.goal)
-        error = controller.last_error if controller.state.value == "FAILED" else None
-        success = controller.state.value != "FAILED"
+        failed = controller.failed
+        error = controller.last_error if failed else None
+        success = not failed
     finally:
+        await controller.aclose()
         elapsed = perf_counter() - start_time
         metrics_collector.increment_requests(
             success=success,
@@ -53,29 +91,44 @@ async def create_task(payload: TaskRequest) -> TaskResponse:
 
 
 @router.post("/voice/stt")
-async def voice_stt(payload: VoiceSTTRequest) -> dict:
-    tool = VoiceSTTTool()
-    params = payload.model_dump(exclude_none=True)
-    return await tool.execute(**params)
+async def voice_stt(payload: VoiceSTTRequest, request: Request) -> dict:
+    params = _STT_DUMP(payload, exclude_none=True)
+    return await request.app.state.voice_stt.execute(**params)
 
 
 @router.post("/voice/tts")
-async def voice_tts(payload: VoiceTTSRequest) -> dict:
-    tool = VoiceTTSTool()
-    params = payload.model_dump(exclude_none=True)
-    return await tool.execute(**params)
+async def voice_tts(payload: VoiceTTSRequest, request: Request) -> dict:
+    params = _TTS_DUMP(payload, exclude_none=True)
+    return await request.app.state.voice_tts.execute(**params)
 
 
 @router.post("/voice/wake_word")
-async def voice_wake_word(payload: VoiceWakeWordRequest) -> dict:
-    tool = VoiceWakeWordTool()
-    params = payload.model_dump(exclude_none=True)
-    return await tool.execute(**params)
+async def voice_wake_word(payload: VoiceWakeWordRequest, request: Request) -> dict:
+    params = _WAKE_WORD_DUMP(payload, exclude_none=True)
+    return await request.app.state.voice_wake_word.execute(**params)
 
 
 app.include_router(router)
-api_prefix = os.getenv("API_PREFIX", "").strip()
+api_prefix = os.getenv("API_PREFIX", "").strip().rstrip("/")
 if api_prefix:
     if not api_prefix.startswith("/"):
         api_prefix = f"/{api_prefix}"
-    app.include_router(router, prefix=api_prefix)
\ No newline at end of file
+    # Serve the same router under the prefix via a single Mount instead of
+    # registering every route a second time.
+    app.mount(api_prefix, router)
+
+    # Mounts are invisible to FastAPI's schema generator, so document the
+    # prefixed paths from a schema-only copy of the router.
+    _prefixed_schema_router = APIRouter()
+    _prefixed_schema_router.include_router(router, prefix=api_prefix)
+
+    def _openapi() -> dict:
+        if app.openapi_schema is None:
+            app.openapi_schema = get_openapi(
+                title=app.title,
+                version=app.version,
+                routes=app.routes + _prefixed_schema_router.routes,
+            )
+        return app.openapi_schema
+
+    app.openapi = _openapi
@@ -1,29 +1,35 @@
 from typing import Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
-class TaskRequest(BaseModel):
-    goal: str = Field(..., min_length=1)
+class _ApiModel(BaseModel):
+    # Request/response payloads are immutable value objects; unknown fields are rejected.
+    model_config = ConfigDict(extra="forbid", frozen=True)
 
 
-class TaskResponse(BaseModel):
+class TaskRequest(_ApiModel):
+    # Requires at least one non-whitespace character so blank goals fail validation.
+    goal: str = Field(..., min_length=1, pattern=r"\S")
+
+
+class TaskResponse(_ApiModel):
     task_id: str
     state: str
     error: Optional[str] = None
 
 
-class VoiceSTTRequest(BaseModel):
+class VoiceSTTRequest(_ApiModel):
     audio_file_path: str = Field(..., min_length=1)
     model: Optional[str] = None
     language: Optional[str] = None
 
 
-class VoiceTTSRequest(BaseModel):
+class VoiceTTSRequest(_ApiModel):
     text: str = Field(..., min_length=1)
     voice: Optional[str] = None
 
 
-class VoiceWakeWordRequest(BaseModel):
+class VoiceWakeWordRequest(_ApiModel):
     audio_file_path: str = Field(..., min_length=1)
-    threshold: Optional[float] = None
\ No newline at end of file
+    threshold: Optional[float] = None
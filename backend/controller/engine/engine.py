@@ -4,8 +4,9 @@ Ported core execution logic from JARVISv3 workflow engine for linear workflow ex
 """
 import logging
 import asyncio
+from collections import defaultdict
 from typing import Dict, Any, Optional, List
-from .types import WorkflowNode, WorkflowState, TaskContext, NodeStatus, NodeType
+from .types import WorkflowNode, WorkflowState, TaskContext, TaskContextPool, NodeStatus, NodeType
 from ..nodes.base import BaseNode
 
 logger = logging.getLogger(__name__)
@@ -13,15 +14,37 @@ logger = logging.getLogger(__name__)
 class WorkflowEngine:
     """Main workflow engine for deterministic task orchestration."""
     
-    def __init__(self):
+    def __init__(self, max_parallel: Optional[int] = None):
         self.nodes: Dict[str, Any] = {}
         self.state: Optional[WorkflowState] = None
         self.node_results: Dict[str, Any] = {}
+        # Reverse adjacency (dependency -> dependents) and in-degrees, maintained
+        # incrementally so scheduling never rescans every node.
+        self._dependents: Dict[str, List[str]] = defaultdict(list)
+        self._in_degree: Dict[str, int] = {}
+        # Cached topological levels (see _execution_levels); reset by add_node
+        self._levels: Optional[List[List[str]]] = None
+        # Per-workflow node context (see execute_workflow); reused for nodes that
+        # run alone in their wave to avoid allocating one per node on chains.
+        self._current_context: Optional[TaskContext] = None
+        # Recycled contexts for nodes running concurrently within a wave
+        self.context_pool = TaskContextPool()
+        # Optional cap on concurrently executing nodes within a wave (rate-limit safety)
+        self.max_parallel = max_parallel
+        self._semaphore = asyncio.Semaphore(max_parallel) if max_parallel else None
         
     def add_node(self, node: Any):
         """Add a node to the workflow registry."""
+        if node.id in self.nodes:
+            for dep in getattr(self.nodes[node.id], "dependencies", ()):
+                self._dependents[dep].remove(node.id)
         self.nodes[node.id] = node
-        logger.info(f"Added node {node.id} to workflow")
+        dependencies = getattr(node, "dependencies", ())
+        for dep in dependencies:
+            self._dependents[dep].append(node.id)
+        self._in_degree[node.id] = len(dependencies)
+        self._levels = None
+        logger.debug("Added node %s to workflow", node.id)
         
     def get_node(self, node_id: str) -> Optional[Any]:
         """Retrieve a node by its ID."""
@@ -38,7 +61,10 @@ class WorkflowEngine:
         """
         if not isinstance(context, TaskContext):
             raise TypeError(f"Context must be TaskContext, got {type(context).__name__}")
+        return await self._execute_node_with_context(node_id, context)
 
+    async def _execute_node_with_context(self, node_id: str, context: TaskContext) -> Dict[str, Any]:
+        """Execute a node against an already-validated context."""
         node = self.get_node(node_id)
         if not node:
             raise ValueError(f"Node {node_id} not found in engine")
@@ -57,10 +83,13 @@ class WorkflowEngine:
         Execute an ordered list of nodes sequentially.
         Preserves existing interface for backward compatibility.
         """
+        if not isinstance(context, TaskContext):
+            raise TypeError(f"Context must be TaskContext, got {type(context).__name__}")
+
         self.node_results = {}
         for node_id in node_ids:
-            logger.info(f"Executing node {node_id} in sequence")
-            await self.execute_node(node_id, context)
+            logger.info("Executing node %s in sequence", node_id)
+            await self._execute_node_with_context(node_id, context)
         
         return self.node_results
 
@@ -82,21 +111,21 @@ class WorkflowEngine:
             workflow_id=context.data.get("workflow_id", "default_workflow"),
             start_time=start_time
         )
+        # One node context per workflow, carrying the caller's infrastructure
+        self._current_context = TaskContext(
+            memory_store=context.memory_store,
+            tool_registry=context.tool_registry
+        )
         
         try:
-            # Find starting nodes (nodes with no dependencies)
-            start_nodes = [node_id for node_id, node in self.nodes.items() 
-                          if not node.dependencies]
-            
-            if not start_nodes:
+            levels = self._execution_levels()
+            if not levels:
                 raise ValueError("No starting nodes found in workflow")
             
-            # For linear execution, use the first start node and follow dependencies
-            if len(start_nodes) == 1:
-                await self._execute_linear_workflow(start_nodes[0])
-            else:
-                # Multiple start nodes - execute in dependency order
-                await self._execute_linear_workflow_with_dependencies(start_nodes)
+            # Levels are precomputed, so execution is a straight walk: chains run
+            # one node at a time and wider levels run as concurrent waves.
+            for level in levels:
+                await self._execute_wave(level)
             
             # Complete workflow
             final_result = {
@@ -115,7 +144,7 @@ class WorkflowEngine:
             
         except Exception as e:
             error_msg = str(e) or type(e).__name__
-            logger.error(f"Workflow failed: {error_msg}")
+            logger.error("Workflow failed: %s", error_msg)
             if self.state:
                 self.state.status = NodeStatus.FAILED
             
@@ -126,88 +155,122 @@ class WorkflowEngine:
                 "execution_time": 0.0
             }
 
-    async def _execute_linear_workflow(self, start_node_id: str):
-        """Execute workflow linearly from start node following dependencies."""
-        current_node_id = start_node_id
-        executed_nodes = set()
-        
-        while current_node_id and current_node_id not in executed_nodes:
-            await self._execute_single_node(current_node_id)
-            executed_nodes.add(current_node_id)
-            
-            # Find next node in dependency chain
-            next_nodes = [nid for nid, node in self.nodes.items() 
-                         if current_node_id in node.dependencies]
-            
-            if next_nodes:
-                # For linear execution, take the first next node
-                current_node_id = next_nodes[0]
-            else:
-                current_node_id = None
-
-    async def _execute_linear_workflow_with_dependencies(self, start_nodes: List[str]):
-        """Execute workflow handling multiple start nodes with dependency ordering."""
-        # Simple topological sort for linear execution
-        executed = set()
-        pending = set(start_nodes)
-        
-        while pending:
-            # Execute all nodes that have their dependencies satisfied
-            ready_nodes = []
-            for node_id in list(pending):
-                node = self.nodes[node_id]
-                if all(dep in executed for dep in node.dependencies):
-                    ready_nodes.append(node_id)
-                    pending.remove(node_id)
-            
-            # Execute ready nodes in order
-            for node_id in ready_nodes:
-                await self._execute_single_node(node_id)
-                executed.add(node_id)
-                # Add dependent nodes to pending
-                dependent_nodes = [nid for nid, node in self.nodes.items() 
-                                 if node_id in node.dependencies and nid not in executed]
-                pending.update(dependent_nodes)
+    def _execution_levels(self) -> List[List[str]]:
+        """
+        Return the workflow's topological levels, computed once per node set.
+        Kahn's algorithm over the reverse adjacency: a node joins the level
+        after its last dependency.
+
+        Raises:
+            ValueError: If some nodes can never be scheduled because they sit
+                on a cycle or depend on a node that does not exist.
+        """
+        if self._levels is None:
+            remaining = dict(self._in_degree)
+            level = [node_id for node_id, degree in remaining.items() if degree == 0]
+            levels: List[List[str]] = []
+            while level:
+                levels.append(level)
+                next_level = []
+                for node_id in level:
+                    for dependent in self._dependents.get(node_id, ()):
+                        remaining[dependent] -= 1
+                        if remaining[dependent] == 0:
+                            next_level.append(dependent)
+                level = next_level
+            # With no level at all, execute_workflow reports "No starting nodes"
+            scheduled = sum(len(level) for level in levels)
+            if levels and scheduled < len(self.nodes):
+                placed = {node_id for level in levels for node_id in level}
+                unscheduled = sorted(node_id for node_id in self.nodes if node_id not in placed)
+                raise ValueError(
+                    "Workflow nodes can never run (dependency cycle or unknown dependency): "
+                    + ", ".join(unscheduled)
+                )
+            self._levels = levels
+        return self._levels
+
+    async def _execute_wave(self, node_ids: List[str]):
+        """
+        Execute mutually independent nodes concurrently with state tracking.
+        Completed/failed bookkeeping happens after every node has settled, in
+        wave order, so state is deterministic regardless of finish order.
+        """
+        shared_context = len(node_ids) == 1
+        outcomes = await asyncio.gather(
+            *(self._run_node(node_id, shared_context) for node_id in node_ids),
+            return_exceptions=True
+        )
+
+        first_error: Optional[BaseException] = None
+        for node_id, outcome in zip(node_ids, outcomes):
+            if isinstance(outcome, BaseException):
+                if self.state:
+                    self.state.failed_nodes.append(node_id)
+                if first_error is None:
+                    first_error = outcome
+            elif self.state:
+                self.state.completed_nodes.append(node_id)
+
+        if self.state:
+            self.state.current_node = None
+            self.state.status = NodeStatus.FAILED if first_error else NodeStatus.COMPLETED
+        if first_error is not None:
+            raise first_error
 
     async def _execute_single_node(self, node_id: str):
         """Execute a single node with state tracking."""
+        await self._execute_wave([node_id])
+
+    async def _run_node(self, node_id: str, shared_context: bool = False):
+        """Execute one node and store its result, honouring max_parallel."""
+        if self._semaphore is None:
+            return await self._invoke_node(node_id, shared_context)
+        async with self._semaphore:
+            return await self._invoke_node(node_id, shared_context)
+
+    async def _invoke_node(self, node_id: str, shared_context: bool = False):
+        """Run a node's execute() with the per-node context and record its result."""
         if self.state:
             self.state.current_node = node_id
             self.state.status = NodeStatus.RUNNING
-        
-        try:
-            # Execute the node
-            node = self.get_node(node_id)
-            if not node:
-                raise ValueError(f"Node {node_id} not found in engine")
-            
-            if hasattr(node, "execute"):
-                result = await node.execute(self._create_node_context(node_id), self.node_results)
-                self.node_results[node_id] = result
-            else:
-                raise TypeError(f"Node {node_id} is not an executable node instance")
-            
-            # Update state on success
-            if self.state:
-                self.state.completed_nodes.append(node_id)
-                self.state.status = NodeStatus.COMPLETED
-                
-        except Exception as e:
-            # Update state on failure
-            if self.state:
-                self.state.failed_nodes.append(node_id)
-                self.state.status = NodeStatus.FAILED
-            raise e
-        finally:
-            if self.state:
-                self.state.current_node = None
-
-    def _create_node_context(self, node_id: str) -> TaskContext:
-        """Create a context for the current node execution."""
-        # For now, return a minimal context - this could be enhanced later
-        # to include node-specific information
-        return TaskContext(
-            memory_store=None,  # Will be set by caller
-            tool_registry=None,  # Will be set by caller
-            data={"node_id": node_id, "node_type": self.nodes[node_id].type}
-        )
\ No newline at end of file
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Executing node %s (shared_context=%s)", node_id, shared_context)
+
+        node = self.get_node(node_id)
+        if not node:
+            raise ValueError(f"Node {node_id} not found in engine")
+
+        if not hasattr(node, "execute"):
+            raise TypeError(f"Node {node_id} is not an executable node instance")
+
+        if shared_context:
+            result = await node.execute(self._shared_node_context(node_id, node.type), self.node_results)
+        else:
+            # Concurrent siblings each borrow a pooled context for the call
+            base = self._workflow_context()
+            with self.context_pool.acquire(
+                memory_store=base.memory_store,
+                tool_registry=base.tool_registry,
+                data={"node_id": node_id, "node_type": node.type}
+            ) as context:
+                result = await node.execute(context, self.node_results)
+        self.node_results[node_id] = result
+        return result
+
+    def _workflow_context(self) -> TaskContext:
+        """Return the workflow's context, creating an empty one if needed."""
+        if self._current_context is None:
+            self._current_context = TaskContext(memory_store=None)
+        return self._current_context
+
+    def _shared_node_context(self, node_id: str, node_type: Any) -> TaskContext:
+        """
+        Reuse the workflow's context for a node running alone, with fresh
+        per-node data so nothing one node stores leaks into the next (or
+        into a previous node's result that kept a reference to it).
+        Only safe when no sibling node is running concurrently.
+        """
+        base = self._workflow_context()
+        base.data = {"node_id": node_id, "node_type": node_type}
+        return base
@@ -1,51 +1,131 @@
 """
 Shared types and models for the JARVISv4 controller engine.
 """
-from enum import Enum
-from typing import Dict, Any, Optional, List
-from pydantic import BaseModel, Field, ConfigDict
+from collections import deque
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field
+from enum import IntEnum
+from typing import Deque, Dict, Any, Iterator, Optional, List
 from datetime import datetime, UTC
 
-class NodeStatus(str, Enum):
+class NodeStatus(IntEnum):
     """Status of a workflow node"""
-    PENDING = "pending"
-    RUNNING = "running"
-    COMPLETED = "completed"
-    FAILED = "failed"
-    SKIPPED = "skipped"
+    PENDING = 0
+    RUNNING = 1
+    COMPLETED = 2
+    FAILED = 3
+    SKIPPED = 4
 
-class NodeType(str, Enum):
+    def to_wire(self) -> str:
+        """Legacy lowercase string used in JSON payloads."""
+        return _STATUS_WIRE[self]
+
+    @classmethod
+    def from_wire(cls, value: str) -> "NodeStatus":
+        return _STATUS_FROM_WIRE[value]
+
+class NodeType(IntEnum):
     """Types of workflow nodes"""
-    ROUTER = "router"
-    CONTEXT_BUILDER = "context_builder"
-    LLM_WORKER = "llm_worker"
-    TOOL_CALL = "tool_call"
-    END = "end"
+    ROUTER = 0
+    CONTEXT_BUILDER = 1
+    LLM_WORKER = 2
+    TOOL_CALL = 3
+    END = 4
+
+    def to_wire(self) -> str:
+        """Legacy lowercase string used in JSON payloads."""
+        return _TYPE_WIRE[self]
+
+    @classmethod
+    def from_wire(cls, value: str) -> "NodeType":
+        return _TYPE_FROM_WIRE[value]
 
-class WorkflowNode(BaseModel):
+# Wire names indexed by enum value (values are contiguous from 0)
+_STATUS_WIRE = tuple(member.name.lower() for member in NodeStatus)
+_STATUS_FROM_WIRE = {name: NodeStatus(index) for index, name in enumerate(_STATUS_WIRE)}
+_TYPE_WIRE = tuple(member.name.lower() for member in NodeType)
+_TYPE_FROM_WIRE = {name: NodeType(index) for index, name in enumerate(_TYPE_WIRE)}
+
+@dataclass(slots=True)
+class WorkflowNode:
     """Definition of a single workflow node"""
     id: str
     type: NodeType
     description: str
-    dependencies: List[str] = []
+    dependencies: List[str] = field(default_factory=list)
     conditions: Optional[Dict[str, Any]] = None
 
-class WorkflowState(BaseModel):
+    def to_dict(self) -> Dict[str, Any]:
+        """Plain-dict form with the legacy string node type."""
+        data = asdict(self)
+        data["type"] = self.type.to_wire()
+        return data
+
+@dataclass(slots=True)
+class WorkflowState:
     """Current state of a workflow execution"""
     workflow_id: str
     status: NodeStatus = NodeStatus.PENDING
     current_node: Optional[str] = None
-    completed_nodes: List[str] = Field(default_factory=list)
-    failed_nodes: List[str] = Field(default_factory=list)
-    start_time: datetime = Field(default_factory=lambda: datetime.now(UTC))
+    completed_nodes: List[str] = field(default_factory=list)
+    failed_nodes: List[str] = field(default_factory=list)
+    start_time: datetime = field(default_factory=lambda: datetime.now(UTC))
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Plain-dict form with the legacy string status and ISO start time."""
+        data = asdict(self)
+        data["status"] = self.status.to_wire()
+        data["start_time"] = self.start_time.isoformat()
+        return data
 
-class TaskContext(BaseModel):
+@dataclass(slots=True)
+class TaskContext:
     """
     Standard execution context for workflow nodes.
     Carries infrastructure (memory, tools) and shared data payload.
+    Internal-only, so a slotted dataclass rather than a validated model.
     """
-    model_config = ConfigDict(arbitrary_types_allowed=True)
+    memory_store: Any  # Memory store instance
+    tool_registry: Optional[Any] = None  # Tool registry instance
+    data: Dict[str, Any] = field(default_factory=dict)  # Shared working data payload
+
+
+class TaskContextPool:
+    """
+    Bounded free list of TaskContext instances.
+    Contexts are handed out via acquire() and reset on return, so callers must
+    not keep a reference past the ``with`` block.
+    """
+
+    def __init__(self, max_size: int = 64):
+        self.max_size = max_size
+        self._free: Deque[TaskContext] = deque()
+
+    def __len__(self) -> int:
+        return len(self._free)
+
+    @contextmanager
+    def acquire(
+        self,
+        memory_store: Any = None,
+        tool_registry: Optional[Any] = None,
+        data: Optional[Dict[str, Any]] = None
+    ) -> Iterator[TaskContext]:
+        """Yield a context populated with the given infrastructure and data."""
+        context = self._free.pop() if self._free else TaskContext(memory_store=None)
+        context.memory_store = memory_store
+        context.tool_registry = tool_registry
+        if data:
+            context.data.update(data)
+        try:
+            yield context
+        finally:
+            self.release(context)
 
-    memory_store: Any = Field(description="Memory store instance")
-    tool_registry: Optional[Any] = Field(default=None, description="Tool registry instance")
-    data: Dict[str, Any] = Field(default_factory=dict, description="Shared working data payload")
+    def release(self, context: TaskContext) -> None:
+        """Reset a context and keep it for reuse while the pool has room."""
+        context.data.clear()
+        context.memory_store = None
+        context.tool_registry = None
+        if len(self._free) < self.max_size:
+            self._free.append(context)
@@ -7,6 +7,9 @@ from ..engine.types import NodeType
 
 class BaseNode(ABC):
     """Abstract base class for all workflow nodes."""
+
+    # ``dependencies`` is optional; the engine reads it with getattr(..., ())
+    __slots__ = ("id", "type", "description", "dependencies")
     
     def __init__(self, id: str, node_type: NodeType, description: str):
         self.id = id
@@ -1,6 +1,9 @@
 """
 Node implementation that executes a provided callable.
 """
+import asyncio
+import functools
+import inspect
 from typing import Any, Dict, Callable
 from .base import BaseNode
 from ..engine.types import NodeType, TaskContext
@@ -8,16 +11,31 @@ from ..engine.types import NodeType, TaskContext
 class CallableNode(BaseNode):
     """
     A node that executes a provided Python function.
+    Whether the function is a coroutine is resolved once at construction.
+    Blocking sync functions can opt in to ``run_in_executor`` so they run on
+    the default thread pool instead of the event loop.
     """
+
+    __slots__ = ("func", "run_in_executor", "_is_coro")
     
-    def __init__(self, id: str, node_type: NodeType, description: str, func: Callable):
+    def __init__(
+        self,
+        id: str,
+        node_type: NodeType,
+        description: str,
+        func: Callable,
+        run_in_executor: bool = False
+    ):
         super().__init__(id, node_type, description)
         self.func = func
+        self.run_in_executor = run_in_executor
+        self._is_coro = inspect.iscoroutinefunction(func)
 
     async def execute(self, context: TaskContext, results: Dict[str, Any]) -> Dict[str, Any]:
         """Invoke the stored callable."""
-        import asyncio
-        if asyncio.iscoroutinefunction(self.func):
+        if self._is_coro:
             return await self.func(context, results)
-        else:
-            return self.func(context, results)
+        if self.run_in_executor:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(None, functools.partial(self.func, context, results))
+        return self.func(context, results)
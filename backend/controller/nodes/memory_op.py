@@ -10,6 +10,8 @@ class MemoryWriteNode(BaseNode):
     """
     A node that writes content to the memory store.
     """
+
+    __slots__ = ()
     
     def __init__(self, id: str, description: str):
         super().__init__(id, NodeType.TOOL_CALL, description)
@@ -28,15 +30,14 @@ class MemoryWriteNode(BaseNode):
         if not store:
             raise ValueError("memory_store not found in context")
             
-        content = context.data.get("content")
-        if not content:
-            raise ValueError("content not found in context.data")
-            
-        item_id = context.data.get("item_id")
-        if not item_id:
-            raise ValueError("item_id not found in context.data")
+        data = context.data
+        content = data.get("content")
+        item_id = data.get("item_id")
+        if not content or not item_id:
+            missing = "content" if not content else "item_id"
+            raise ValueError(f"{missing} not found in context.data")
             
-        metadata = context.data.get("metadata", {})
+        metadata = data.get("metadata", {})
         
         item = MemoryItem(
             id=item_id,
@@ -55,6 +56,8 @@ class MemoryReadNode(BaseNode):
     """
     A node that reads content from the memory store.
     """
+
+    __slots__ = ()
     
     def __init__(self, id: str, description: str):
         super().__init__(id, NodeType.TOOL_CALL, description)
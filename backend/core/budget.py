@@ -1,12 +1,35 @@
 import sqlite3
 import logging
+import threading
+import time
 from datetime import datetime, UTC
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Iterable, Optional, Tuple
 from .config.settings import Settings
 
 logger = logging.getLogger(__name__)
 
+
+# Enforcement levels resolved once per service; unknown values behave like "log"
+_ENFORCE_NONE, _ENFORCE_LOG, _ENFORCE_BLOCK = 0, 1, 2
+_ENFORCEMENT_LEVELS = {"none": _ENFORCE_NONE, "log": _ENFORCE_LOG, "block": _ENFORCE_BLOCK}
+_OVER_LIMIT_MESSAGES = (
+    "",
+    "Budget limit exceeded for category '%s': current %.4f + cost %.4f exceeds limit %.4f",
+    "Budget blocked for category '%s': current %.4f + cost %.4f exceeds limit %.4f",
+)
+
+_CREATE_EVENTS_SQL = """
+    CREATE TABLE IF NOT EXISTS {table} (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        timestamp_ms INTEGER NOT NULL,
+        category TEXT NOT NULL,
+        cost REAL NOT NULL,
+        item_id TEXT
+    )
+"""
+
+
 class BudgetService:
     """
     BudgetService ports the high-maturity Budget Service from v2 to JARVISv4.
@@ -16,23 +39,95 @@ class BudgetService:
         self.settings = settings
         self.db_path = settings.budget_db_path
         self.enforcement_level = settings.budget_enforcement_level
+        self._enforce = _ENFORCEMENT_LEVELS.get(self.enforcement_level, _ENFORCE_LOG)
         self.limits = settings.budget_limits or {}
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
         self._init_db()
 
     def _init_db(self):
-        """Initialize the budget database schema."""
+        """Initialize the budget database schema and the shared write connection."""
         Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
-        with sqlite3.connect(self.db_path) as conn:
-            conn.execute("""
-                CREATE TABLE IF NOT EXISTS budget_events (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    timestamp TEXT NOT NULL,
-                    category TEXT NOT NULL,
-                    cost REAL NOT NULL,
-                    item_id TEXT
-                )
+        # Autocommit connection reused for every write; WAL + synchronous=NORMAL
+        # (the default, see Settings.sqlite_synchronous) turns each insert into
+        # a WAL append instead of a full fsync.
+        self._conn = sqlite3.connect(self.db_path, isolation_level=None, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        synchronous = self.settings.sqlite_synchronous.upper()
+        if synchronous not in ("OFF", "NORMAL", "FULL", "EXTRA"):
+            raise ValueError(f"Unsupported SQLite synchronous level: {synchronous}")
+        self._conn.execute(f"PRAGMA synchronous={synchronous}")
+        self._conn.execute("PRAGMA busy_timeout=5000")
+        self._conn.execute("PRAGMA temp_store=MEMORY")
+        columns = {row[1] for row in self._conn.execute("PRAGMA table_info(budget_events)")}
+        if "timestamp" in columns and "timestamp_ms" not in columns:
+            self._migrate_timestamp_ms()
+        self._conn.execute(_CREATE_EVENTS_SQL.format(table="budget_events"))
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_budget_cat_ts ON budget_events(category, timestamp_ms)"
+        )
+        # Per-day rollup kept current by trigger, so loading a day's totals is
+        # one row per category rather than a scan of that day's events.
+        has_rollup = self._conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type='table' AND name='budget_daily'"
+        ).fetchone()
+        if not has_rollup:
+            self._conn.execute("BEGIN")
+            try:
+                self._conn.execute("""
+                    CREATE TABLE budget_daily (
+                        category TEXT NOT NULL,
+                        date TEXT NOT NULL,
+                        total REAL NOT NULL,
+                        PRIMARY KEY (category, date)
+                    )
+                """)
+                # Backfill from events recorded before the rollup existed
+                self._conn.execute("""
+                    INSERT INTO budget_daily (category, date, total)
+                    SELECT category, date(timestamp_ms / 1000, 'unixepoch'), SUM(cost)
+                    FROM budget_events GROUP BY category, date(timestamp_ms / 1000, 'unixepoch')
+                """)
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+            self._conn.execute("COMMIT")
+        self._conn.execute("""
+            CREATE TRIGGER IF NOT EXISTS trg_budget_daily AFTER INSERT ON budget_events
+            BEGIN
+                INSERT INTO budget_daily (category, date, total)
+                VALUES (NEW.category, date(NEW.timestamp_ms / 1000, 'unixepoch'), NEW.cost)
+                ON CONFLICT(category, date) DO UPDATE SET total = total + excluded.total;
+            END
+        """)
+
+    def _migrate_timestamp_ms(self) -> None:
+        """Rewrite a legacy budget_events table (ISO text timestamps) to epoch milliseconds."""
+        logger.info("Migrating budget_events in %s to timestamp_ms", self.db_path)
+        self._conn.execute("BEGIN")
+        try:
+            # Dropping the legacy table also drops its index and rollup trigger;
+            # both are recreated against the new table by _init_db.
+            self._conn.execute(_CREATE_EVENTS_SQL.format(table="budget_events_new"))
+            self._conn.execute("""
+                INSERT INTO budget_events_new (id, timestamp_ms, category, cost, item_id)
+                SELECT id, CAST(ROUND((julianday(timestamp) - 2440587.5) * 86400000) AS INTEGER),
+                       category, cost, item_id
+                FROM budget_events
             """)
-            conn.commit()
+            self._conn.execute("DROP TABLE budget_events")
+            self._conn.execute("ALTER TABLE budget_events_new RENAME TO budget_events")
+        except Exception:
+            self._conn.execute("ROLLBACK")
+            raise
+        self._conn.execute("COMMIT")
+
+    def close(self) -> None:
+        """Close the shared database connection."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
 
     def check_availability(self, category: str, cost: float) -> bool:
         """
@@ -45,7 +140,8 @@ class BudgetService:
         Returns:
             bool: True if the action is allowed, False if blocked.
         """
-        if self.enforcement_level == "none":
+        enforce = self._enforce
+        if enforce == _ENFORCE_NONE:
             return True
 
         limit = self.limits.get(category, 0.0)
@@ -54,17 +150,11 @@ class BudgetService:
             return True
 
         current_spend = self._get_current_spend(category)
-        is_within = (current_spend + cost) <= limit
-
-        if not is_within:
-            if self.enforcement_level == "block":
-                logger.warning(f"Budget blocked for category '{category}': current {current_spend:.4f} + cost {cost:.4f} exceeds limit {limit:.4f}")
-                return False
-            elif self.enforcement_level == "log":
-                logger.warning(f"Budget limit exceeded for category '{category}': current {current_spend:.4f} + cost {cost:.4f} exceeds limit {limit:.4f}")
-                return True
-        
-        return True
+        if current_spend + cost <= limit:
+            return True
+
+        logger.warning(_OVER_LIMIT_MESSAGES[enforce], category, current_spend, cost, limit)
+        return enforce != _ENFORCE_BLOCK
 
     def record_spend(self, category: str, cost: float, item_id: Optional[str] = None):
         """
@@ -75,12 +165,34 @@ class BudgetService:
             cost: The actual cost incurred.
             item_id: Optional identifier for the item/action that caused the cost.
         """
-        with sqlite3.connect(self.db_path) as conn:
-            conn.execute(
-                "INSERT INTO budget_events (timestamp, category, cost, item_id) VALUES (?, ?, ?, ?)",
-                (datetime.now(UTC).isoformat(), category, cost, item_id)
+        with self._lock:
+            self._conn.execute(
+                "INSERT INTO budget_events (timestamp_ms, category, cost, item_id) VALUES (?, ?, ?, ?)",
+                (int(time.time() * 1000), category, cost, item_id)
             )
-            conn.commit()
+
+    def record_spend_many(self, rows: Iterable[Tuple[str, float, Optional[str]]]):
+        """
+        Log several consumption events in a single transaction.
+        
+        Args:
+            rows: (category, cost, item_id) tuples; all share one timestamp.
+        """
+        timestamp_ms = int(time.time() * 1000)
+        params = [(timestamp_ms, category, cost, item_id) for category, cost, item_id in rows]
+        if not params:
+            return
+        with self._lock:
+            self._conn.execute("BEGIN")
+            try:
+                self._conn.executemany(
+                    "INSERT INTO budget_events (timestamp_ms, category, cost, item_id) VALUES (?, ?, ?, ?)",
+                    params
+                )
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+            self._conn.execute("COMMIT")
 
     def get_status(self) -> Dict[str, Any]:
         """
@@ -93,15 +205,21 @@ class BudgetService:
         # Get all categories from events or limits
         all_categories = set(self.limits.keys())
         
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.execute("SELECT category, SUM(cost) FROM budget_events GROUP BY category")
-            rows = cursor.fetchall()
-            for row in rows:
-                all_categories.add(row[0])
+        today = datetime.now(UTC).date().isoformat()
+        with self._lock:
+            rows = self._conn.execute("SELECT DISTINCT category FROM budget_daily").fetchall()
+            # One query for today's totals instead of a lookup per category
+            spends = dict(self._conn.execute(
+                "SELECT category, total FROM budget_daily WHERE date = ?",
+                (today,)
+            ).fetchall())
+        for row in rows:
+            all_categories.add(row[0])
 
+        limits = self.limits
         for cat in all_categories:
-            spend = self._get_current_spend(cat)
-            limit = self.limits.get(cat, 0.0)
+            spend = spends.get(cat, 0.0)
+            limit = limits.get(cat, 0.0)
             status[cat] = {
                 "spend": spend,
                 "limit": limit,
@@ -110,13 +228,15 @@ class BudgetService:
         return status
 
     def _get_current_spend(self, category: str) -> float:
-        """Calculate total spend for the category in the current daily period."""
-        # Simple daily reset: sum costs for today (UTC)
+        """
+        Return total spend for the category in the current daily period (UTC).
+        Read from the budget_daily rollup by primary key on every call, so
+        spend recorded by other processes sharing the database is included.
+        """
         today = datetime.now(UTC).date().isoformat()
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.execute(
-                "SELECT SUM(cost) FROM budget_events WHERE category = ? AND timestamp >= ?",
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT total FROM budget_daily WHERE category = ? AND date = ?",
                 (category, today)
-            )
-            row = cursor.fetchone()
-            return row[0] if row and row[0] else 0.0
+            ).fetchone()
+        return row[0] if row else 0.0
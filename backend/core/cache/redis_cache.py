@@ -2,22 +2,31 @@
 
 from __future__ import annotations
 
-import json
-from typing import Any, Optional, Protocol
+from typing import Any, Dict, List, Optional, Protocol
 
-import redis
+from redis.asyncio import Redis as AsyncRedis
+
+from backend.core.serialization import dumps_bytes, loads
 
 
 class KeyValueClient(Protocol):
-    def get(self, key: str) -> Optional[str]:
+    async def get(self, key: str) -> Optional[bytes]:
+        ...
+
+    async def setex(self, key: str, ttl_seconds: int, value: bytes) -> None:
         ...
 
-    def setex(self, key: str, ttl_seconds: int, value: str) -> None:
+    def pipeline(self, transaction: bool = True) -> Any:
         ...
 
 
 class RedisCache:
-    """Minimal Redis-backed cache for JSON-serializable payloads."""
+    """Minimal Redis-backed cache for JSON-serializable payloads.
+
+    Uses the asyncio Redis client so cache round-trips never block the event
+    loop; batch helpers pipeline N keys into a single round-trip. Payloads
+    are stored as raw JSON bytes, so the client skips response decoding.
+    """
 
     def __init__(
         self,
@@ -27,17 +36,44 @@ class RedisCache:
     ):
         self.redis_url = redis_url
         self.default_ttl_seconds = default_ttl_seconds
-        self.client = client or redis.Redis.from_url(redis_url, decode_responses=True)
+        self.client = client or AsyncRedis.from_url(redis_url)
 
-    def get_json(self, key: str) -> Optional[Any]:
-        value = self.client.get(key)
+    @staticmethod
+    def _decode(value: Any) -> Optional[Any]:
         if value is None:
             return None
         if not isinstance(value, (str, bytes, bytearray)):
             return None
-        return json.loads(value)
+        return loads(value)
+
+    async def get_json(self, key: str) -> Optional[Any]:
+        return self._decode(await self.client.get(key))
 
-    def set_json(self, key: str, value: Any, ttl_seconds: Optional[int] = None) -> None:
+    async def set_json(self, key: str, value: Any, ttl_seconds: Optional[int] = None) -> None:
         ttl = ttl_seconds if ttl_seconds is not None else self.default_ttl_seconds
-        payload = json.dumps(value)
-        self.client.setex(key, ttl, payload)
\ No newline at end of file
+        await self.client.setex(key, ttl, dumps_bytes(value))
+
+    async def mget_json(self, keys: List[str]) -> List[Optional[Any]]:
+        """Fetch several keys in one pipelined round-trip; misses come back as None."""
+        if not keys:
+            return []
+        async with self.client.pipeline(transaction=False) as pipe:
+            for key in keys:
+                pipe.get(key)
+            values = await pipe.execute()
+        return [self._decode(value) for value in values]
+
+    async def mset_json(self, items: Dict[str, Any], ttl_seconds: Optional[int] = None) -> None:
+        """Store several payloads with a shared TTL in one pipelined round-trip."""
+        if not items:
+            return
+        ttl = ttl_seconds if ttl_seconds is not None else self.default_ttl_seconds
+        async with self.client.pipeline(transaction=False) as pipe:
+            for key, value in items.items():
+                pipe.setex(key, ttl, dumps_bytes(value))
+            await pipe.execute()
+
+    async def close(self) -> None:
+        close = getattr(self.client, "aclose", None)
+        if close is not None:
+            await close()
@@ -1 +1 @@
-from .settings import Settings, load_settings
+from .settings import Settings, get_settings, load_settings, reload_settings
@@ -1,5 +1,8 @@
+import ast
+import json
 import os
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 from dotenv import load_dotenv
@@ -31,6 +34,15 @@ class Settings:
     budget_limits: Optional[dict] = None  # Dict of category: limit
     budget_db_path: Path = Path("data/budget.db")
 
+    # SQLite durability for trace/budget stores (WAL mode): NORMAL or FULL
+    sqlite_synchronous: str = "NORMAL"
+
+    # Reuse plans of previously completed identical goals (skips planner LLM call)
+    plan_cache_enabled: bool = False
+
+    # Persist executor tool selections on disk for this long (0 disables)
+    llm_cache_ttl_seconds: int = 0
+
     # Search Settings
     search_bing_api_key: Optional[str] = None
     search_tavily_api_key: Optional[str] = None
@@ -45,6 +57,25 @@ class Settings:
     api_host: str = "127.0.0.1"
     api_port: int = 8000
 
+def _parse_budget_limits(raw: Optional[str]) -> dict:
+    """
+    Parse BUDGET_LIMITS as a JSON object.
+    Python dict literals (single quotes) are still accepted via
+    ast.literal_eval for existing .env files; nothing is evaluated.
+    """
+    if not raw or not raw.strip():
+        return {}
+    try:
+        limits = json.loads(raw)
+    except json.JSONDecodeError:
+        try:
+            limits = ast.literal_eval(raw)
+        except (ValueError, SyntaxError) as exc:
+            raise ValueError(f"BUDGET_LIMITS is not a valid JSON object: {raw!r}") from exc
+    if not isinstance(limits, dict):
+        raise ValueError(f"BUDGET_LIMITS must be a JSON object, got {type(limits).__name__}")
+    return limits
+
 def load_settings(env_file: Optional[Path] = None, override_environ: bool = False) -> Settings:
     """Load settings from environment variables and optional env file."""
     if env_file:
@@ -65,8 +96,11 @@ def load_settings(env_file: Optional[Path] = None, override_environ: bool = Fals
         privacy_salt=os.environ.get("PRIVACY_SALT", "v4-salt-static"),
         privacy_redaction_level=os.environ.get("PRIVACY_REDACTION_LEVEL", "partial"),
         budget_enforcement_level=os.environ.get("BUDGET_ENFORCEMENT_LEVEL", "log"),
-        budget_limits=eval(os.environ.get("BUDGET_LIMITS", "{}")),  # Using eval for simplicity in parsing dict from env
+        budget_limits=_parse_budget_limits(os.environ.get("BUDGET_LIMITS")),
         budget_db_path=Path(os.environ.get("BUDGET_DB_PATH", "data/budget.db")),
+        sqlite_synchronous=os.environ.get("SQLITE_SYNCHRONOUS", "NORMAL").upper(),
+        plan_cache_enabled=os.environ.get("PLAN_CACHE_ENABLED", "false").lower() == "true",
+        llm_cache_ttl_seconds=int(os.environ.get("LLM_CACHE_TTL_SECONDS", "0")),
         search_bing_api_key=os.environ.get("SEARCH_BING_API_KEY"),
         search_tavily_api_key=os.environ.get("SEARCH_TAVILY_API_KEY"),
         search_google_api_key=os.environ.get("SEARCH_GOOGLE_API_KEY"),
@@ -76,3 +110,16 @@ def load_settings(env_file: Optional[Path] = None, override_environ: bool = Fals
         api_host=os.environ.get("API_HOST", "127.0.0.1"),
         api_port=int(os.environ.get("API_PORT", "8000"))
     )
+
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """
+    Return process-wide settings, loaded from the environment on first use.
+    load_settings() stays uncached for callers that need a fresh read.
+    """
+    return load_settings()
+
+def reload_settings() -> Settings:
+    """Drop the cached settings (e.g. after env changes in tests) and reload."""
+    get_settings.cache_clear()
+    return get_settings()
@@ -1,28 +1,67 @@
+import copy
 import logging
 import asyncio
-import json
 import time
 from datetime import datetime
 from enum import Enum
-from typing import Any, Dict, List, Optional, Tuple
+from functools import lru_cache
+from collections import Counter, OrderedDict
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
 from pathlib import Path
 
 from backend.core.config.settings import Settings, load_settings
+from backend.core.serialization import loads
+from backend.core.llm.base import BaseLLMProvider
+from backend.core.llm.cache import LLMResponseCache
 from backend.core.llm.provider import OpenAIProvider
 from backend.memory.working_state import WorkingStateManager
+from backend.memory.plan_cache import PlanCache
 from backend.agents.planner.planner import PlannerAgent, InvalidPlanError
-from backend.agents.executor.executor import ExecutorAgent, EXECUTOR_SYSTEM_PROMPT
+from backend.agents.executor.executor import ExecutorAgent
 from backend.tools.registry.registry import ToolRegistry
 from backend.tools.web_search import WebSearchTool
 from backend.tools.text_output import TextOutputTool
 from backend.tools.voice import VoiceSTTTool, VoiceTTSTool, VoiceWakeWordTool
-from backend.memory.stores.trace_store import TraceStore
+from backend.memory.stores.artifact_store import ArtifactStore
+from backend.memory.stores.trace_store import shared_storage_worker
 from backend.controller.engine.engine import WorkflowEngine
 from backend.controller.engine.types import TaskContext, NodeType
 from backend.controller.nodes.base import BaseNode
 
 logger = logging.getLogger(__name__)
 
+# (description, tool) of the fixed voice lifecycle steps, in execution order
+_VOICE_STEP_META = (
+    ("Detect wake word from captured audio", "voice_wake_word"),
+    ("Transcribe captured audio to text", "voice_stt"),
+    ("Agent execution (deterministic text output)", "text_output"),
+    ("Synthesize speech from agent output", "voice_tts")
+)
+
+
+@lru_cache(maxsize=64)
+def _archive_step_tool_names(path: str, mtime_ns: int, size: int) -> Tuple[Optional[str], ...]:
+    """
+    Tool names of an archive's completed steps, keyed on the file's mtime and
+    size so a rewritten archive is parsed again. Replay only compares tool
+    names, so the rest of the parsed archive is dropped straight away.
+    """
+    completed_steps = loads(Path(path).read_bytes()).get("completed_steps", [])
+    return tuple(
+        step.get("tool_name") if isinstance(step, dict) else None
+        for step in completed_steps
+    )
+
+
+def _completion_timing(start_ns: int, started_at: str) -> Dict[str, Any]:
+    """Timestamp fields for a node result, read from the clocks once at completion."""
+    return {
+        "started_at": started_at,
+        "completed_at": datetime.now().isoformat(),
+        "duration_ms_wall": (time.monotonic_ns() - start_ns) / 1e6
+    }
+
+
 class SimpleToolNode(BaseNode):
     """Simple node that executes a single tool with predefined parameters."""
     
@@ -43,9 +82,27 @@ class SimpleToolNode(BaseNode):
         self.dependencies = dependencies or []
         self.executor = executor
     
+    def _build_result(
+        self,
+        start_ns: int,
+        started_at: str,
+        status: str,
+        tool_name: Optional[str] = None,
+        tool_params: Optional[dict] = None,
+        **fields: Any
+    ) -> dict:
+        """Node result dict shared by every execute() exit path."""
+        return {
+            "tool_name": tool_name or self.tool_name,
+            "tool_params": tool_params or self.tool_params,
+            "status": status,
+            **fields,
+            **_completion_timing(start_ns, started_at)
+        }
+
     async def execute(self, context: TaskContext, results: dict) -> dict:
         """Execute the tool and return the result."""
-        start_wall = time.monotonic()
+        start_ns = time.monotonic_ns()
         started_at = datetime.now().isoformat()
         if self.executor:
             try:
@@ -53,41 +110,18 @@ class SimpleToolNode(BaseNode):
                     "tool": self.tool_name,
                     "params": self.tool_params
                 })
-                end_wall = time.monotonic()
-                tool_name = result.get("tool") or self.tool_name
-                tool_params = result.get("params") or self.tool_params
-                status = result.get("status", "SUCCESS")
-                error = result.get("error")
-                if status == "FAILED":
-                    return {
-                        "tool_name": tool_name,
-                        "tool_params": tool_params,
-                        "status": "FAILED",
-                        "error": error or "tool execution failed",
-                        "started_at": started_at,
-                        "completed_at": datetime.now().isoformat(),
-                        "duration_ms_wall": (end_wall - start_wall) * 1000
-                    }
-                return {
-                    "result": result,
-                    "tool_name": tool_name,
-                    "tool_params": tool_params,
-                    "status": "SUCCESS",
-                    "started_at": started_at,
-                    "completed_at": datetime.now().isoformat(),
-                    "duration_ms_wall": (end_wall - start_wall) * 1000
-                }
+                tool_name = result.get("tool")
+                tool_params = result.get("params")
+                if result.get("status", "SUCCESS") == "FAILED":
+                    return self._build_result(
+                        start_ns, started_at, "FAILED", tool_name, tool_params,
+                        error=result.get("error") or "tool execution failed"
+                    )
+                return self._build_result(
+                    start_ns, started_at, "SUCCESS", tool_name, tool_params, result=result
+                )
             except Exception as exc:
-                end_wall = time.monotonic()
-                return {
-                    "status": "FAILED",
-                    "error": str(exc),
-                    "tool": self.tool_name,
-                    "params": self.tool_params,
-                    "started_at": started_at,
-                    "completed_at": datetime.now().isoformat(),
-                    "duration_ms_wall": (end_wall - start_wall) * 1000
-                }
+                return self._build_result(start_ns, started_at, "FAILED", error=str(exc))
         tool = self.registry.get_tool(self.tool_name)
         if not tool:
             raise Exception(f"Tool {self.tool_name} not found in registry")
@@ -95,30 +129,13 @@ class SimpleToolNode(BaseNode):
         # Execute the tool with the predefined parameters
         try:
             result = await tool.execute(**self.tool_params)
-            end_wall = time.monotonic()
-            return {
-                "node_id": self.id,
-                "tool_name": self.tool_name,
-                "tool_params": self.tool_params,
-                "result": result,
-                "status": "SUCCESS",
-                "started_at": started_at,
-                "completed_at": datetime.now().isoformat(),
-                "duration_ms_wall": (end_wall - start_wall) * 1000
-            }
+            return self._build_result(
+                start_ns, started_at, "SUCCESS", node_id=self.id, result=result
+            )
         except Exception as e:
-            end_wall = time.monotonic()
-            return {
-                "node_id": self.id,
-                "tool_name": self.tool_name,
-                "tool_params": self.tool_params,
-                "result": None,
-                "status": "FAILED",
-                "error": str(e),
-                "started_at": started_at,
-                "completed_at": datetime.now().isoformat(),
-                "duration_ms_wall": (end_wall - start_wall) * 1000
-            }
+            return self._build_result(
+                start_ns, started_at, "FAILED", node_id=self.id, result=None, error=str(e)
+            )
 
 class ControllerState(Enum):
     INITIALIZING = "INITIALIZING"
@@ -141,7 +158,8 @@ class ECFController:
         self,
         settings: Optional[Settings] = None,
         llm_timeout_seconds: Optional[float] = None,
-        llm_max_retries: Optional[int] = None
+        llm_max_retries: Optional[int] = None,
+        llm: Optional[BaseLLMProvider] = None
     ):
         self.settings = settings or load_settings()
         self.state = ControllerState.INITIALIZING
@@ -149,25 +167,55 @@ class ECFController:
         
         # Initialize Infrastructure
         self.registry = ToolRegistry()
-        provider_kwargs: Dict[str, Any] = {
-            "model": self.settings.llm_model,
-            "api_key": self.settings.llm_api_key,
-            "base_url": self.settings.llm_base_url
-        }
-        if llm_timeout_seconds is not None:
-            provider_kwargs["timeout"] = llm_timeout_seconds
-        if llm_max_retries is not None:
-            provider_kwargs["max_retries"] = llm_max_retries
-        self.llm = OpenAIProvider(**provider_kwargs)
+        # A caller-supplied provider (e.g. one per API process) is shared with
+        # other controllers, so only a provider built here is closed by aclose.
+        self._owns_llm = llm is None
+        if llm is None:
+            provider_kwargs: Dict[str, Any] = {
+                "model": self.settings.llm_model,
+                "api_key": self.settings.llm_api_key,
+                "base_url": self.settings.llm_base_url
+            }
+            if llm_timeout_seconds is not None:
+                provider_kwargs["timeout"] = llm_timeout_seconds
+            if llm_max_retries is not None:
+                provider_kwargs["max_retries"] = llm_max_retries
+            llm = OpenAIProvider(**provider_kwargs)
+        self.llm = llm
         self.state_manager = WorkingStateManager(
             base_path=self.settings.working_storage_path
         )
         trace_db_path = Path(self.settings.working_storage_path) / "traces.db"
-        self.trace_store = TraceStore(str(trace_db_path))
+        # Trace inserts are committed on a background thread so the event
+        # loop never waits on SQLite; task entry points flush before returning.
+        # The writer is shared by every controller on the same database and
+        # stops when idle, so a controller that is never closed leaks nothing.
+        self._storage_worker = shared_storage_worker(
+            str(trace_db_path),
+            synchronous=self.settings.sqlite_synchronous
+        )
+        self.trace_store = self._storage_worker.store
+        # Trace writes of the current run that failed; see trace_error
+        self._trace_errors: List[BaseException] = []
+        # Large tool results go to content-addressed files; trace rows keep the hash
+        self.artifact_store = ArtifactStore(
+            Path(self.settings.working_storage_path) / "artifacts"
+        )
+        self.plan_cache: Optional[PlanCache] = None
+        if self.settings.plan_cache_enabled:
+            self.plan_cache = PlanCache(
+                str(Path(self.settings.working_storage_path) / "plan_cache.db")
+            )
         
         # Initialize Agents
         self.planner = PlannerAgent(self.llm, self.state_manager)
-        self.executor = ExecutorAgent(self.llm, self.registry)
+        response_cache: Optional[LLMResponseCache] = None
+        if self.settings.llm_cache_ttl_seconds > 0:
+            response_cache = LLMResponseCache(
+                str(Path(self.settings.working_storage_path) / "llm_cache.db"),
+                ttl_seconds=self.settings.llm_cache_ttl_seconds
+            )
+        self.executor = ExecutorAgent(self.llm, self.registry, response_cache=response_cache)
         
         # Register Default Tools
         self.registry.register_tool(WebSearchTool(self.settings))
@@ -178,45 +226,84 @@ class ECFController:
         
         # Initialize Workflow Engine
         self.workflow_engine = WorkflowEngine()
+        self._task_state_cache: "OrderedDict[str, Tuple[Tuple[int, int], Dict[str, Any]]]" = OrderedDict()
         
         logger.info("ECFController initialized and READY.")
 
-    def list_task_summaries(self) -> List[Dict[str, Any]]:
-        """Read-only enumeration of task summaries from disk."""
-        summaries: List[Dict[str, Any]] = []
+    @property
+    def failed(self) -> bool:
+        """True when the controller halted in the FAILED state."""
+        return self.state is ControllerState.FAILED
+
+    @property
+    def trace_error(self) -> Optional[BaseException]:
+        """
+        First trace write of the latest run that failed to commit, if any.
+        The task outcome stands either way; the failure is also logged.
+        """
+        return self._trace_errors[0] if self._trace_errors else None
+
+    # Parsed task files kept for repeated supervisor/analytics passes
+    TASK_STATE_CACHE_SIZE = 256
 
-        active_ids = self.state_manager.list_active_task_ids()
-        for task_id in active_ids:
+    def _read_task_file(self, path: Path, loader: Callable[[], Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Return the parsed task file at ``path``, reusing the previous parse
+        while the file's (mtime, size) is unchanged. Each call gets its own
+        copy, so callers may mutate the result.
+        """
+        stat = path.stat()
+        version = (stat.st_mtime_ns, stat.st_size)
+        key = str(path)
+        cached = self._task_state_cache.get(key)
+        if cached is not None and cached[0] == version:
+            self._task_state_cache.move_to_end(key)
+            return copy.deepcopy(cached[1])
+        state = loader()
+        self._task_state_cache[key] = (version, state)
+        self._task_state_cache.move_to_end(key)
+        if len(self._task_state_cache) > self.TASK_STATE_CACHE_SIZE:
+            self._task_state_cache.popitem(last=False)
+        return copy.deepcopy(state)
+
+    def _iter_task_states(self) -> Iterator[Tuple[str, str, Dict[str, Any], str]]:
+        """Yield (task_id, lifecycle, state, source_path) for every readable task file."""
+        for task_id in self.state_manager.list_active_task_ids():
+            task_path = self.state_manager.base_path / f"{task_id}.json"
             try:
-                state = self.state_manager.load_task(task_id)
+                state = self._read_task_file(
+                    task_path,
+                    lambda: self.state_manager.load_task(task_id)
+                )
             except Exception as exc:
-                logger.warning(f"Skipping task {task_id}: {exc}")
+                logger.warning("Skipping task %s: %s", task_id, exc)
                 continue
-            summaries.append({
-                "task_id": task_id,
-                "lifecycle": "ACTIVE",
-                "status": state.get("status"),
-                "completed_steps": len(state.get("completed_steps", [])),
-                "next_steps": len(state.get("next_steps", [])),
-                "has_current_step": bool(state.get("current_step")),
-                "source_path": str(self.settings.working_storage_path / f"{task_id}.json")
-            })
+            yield task_id, "ACTIVE", state, str(self.settings.working_storage_path / f"{task_id}.json")
 
         for archived_path in self.state_manager.list_archived_task_paths():
             try:
-                state = json.loads(archived_path.read_text())
+                state = self._read_task_file(
+                    archived_path,
+                    lambda: loads(archived_path.read_bytes())
+                )
             except Exception as exc:
-                logger.warning(f"Skipping archived task {archived_path}: {exc}")
+                logger.warning("Skipping archived task %s: %s", archived_path, exc)
                 continue
-            task_id = state.get("task_id", archived_path.stem)
+            yield state.get("task_id", archived_path.stem), "ARCHIVED", state, str(archived_path)
+
+    def list_task_summaries(self) -> List[Dict[str, Any]]:
+        """Read-only enumeration of task summaries from disk."""
+        summaries: List[Dict[str, Any]] = []
+
+        for task_id, lifecycle, state, source_path in self._iter_task_states():
             summaries.append({
                 "task_id": task_id,
-                "lifecycle": "ARCHIVED",
+                "lifecycle": lifecycle,
                 "status": state.get("status"),
                 "completed_steps": len(state.get("completed_steps", [])),
                 "next_steps": len(state.get("next_steps", [])),
                 "has_current_step": bool(state.get("current_step")),
-                "source_path": str(archived_path)
+                "source_path": source_path
             })
 
         def _sort_key(item: Dict[str, Any]) -> tuple:
@@ -227,33 +314,19 @@ class ECFController:
 
     def summarize_task_outcomes(self) -> Dict[str, Any]:
         """Read-only analytics derived from on-disk ACTIVE + ARCHIVED task artifacts."""
-        totals: Dict[str, int] = {}
-        failed_by_cause: Dict[str, int] = {}
-        total_count = 0
-
-        summaries = self.list_task_summaries()
-        for summary in summaries:
-            source_path = summary.get("source_path")
-            if not source_path:
-                continue
-            try:
-                state = json.loads(Path(source_path).read_text())
-            except Exception as exc:
-                logger.warning(f"Skipping task analytics for {source_path}: {exc}")
-                continue
-
-            total_count += 1
-            status = state.get("status") or "unknown"
-            totals[status] = totals.get(status, 0) + 1
-
-            if status == "FAILED":
-                failure_cause = state.get("failure_cause") or "unknown"
-                failed_by_cause[failure_cause] = failed_by_cause.get(failure_cause, 0) + 1
+        # Each task file is parsed once, shared with list_task_summaries
+        states = [state for _, _, state, _ in self._iter_task_states()]
+        totals = Counter(state.get("status") or "unknown" for state in states)
+        failed_by_cause = Counter(
+            state.get("failure_cause") or "unknown"
+            for state in states
+            if (state.get("status") or "unknown") == "FAILED"
+        )
 
         return {
-            "total": total_count,
-            "by_status": totals,
-            "failed_by_cause": failed_by_cause
+            "total": len(states),
+            "by_status": dict(totals),
+            "failed_by_cause": dict(failed_by_cause)
         }
 
     async def orchestrate_task_batch(
@@ -269,14 +342,19 @@ class ECFController:
 
         settings = self.settings
         for goal in goals[:max_tasks]:
-            controller = ECFController(settings=settings)
-            task_id = await controller.run_task(goal)
-            task_ids.append(task_id)
+            # Each goal gets a fresh controller for isolated state, but all of
+            # them reuse this controller's LLM client and its connection pool.
+            controller = ECFController(settings=settings, llm=self.llm)
+            try:
+                task_id = await controller.run_task(goal)
+                task_ids.append(task_id)
 
-            await controller.supervisor_resume_stalled_tasks(
-                min_age_seconds=min_stall_age_seconds,
-                max_tasks=1
-            )
+                await controller.supervisor_resume_stalled_tasks(
+                    min_age_seconds=min_stall_age_seconds,
+                    max_tasks=1
+                )
+            finally:
+                await controller.aclose()
             analytics = controller.summarize_task_outcomes()
             failed_total = sum(analytics.get("failed_by_cause", {}).values())
 
@@ -311,33 +389,31 @@ class ECFController:
         """Resume eligible ACTIVE tasks older than min_age_seconds (deterministic order)."""
         resumed: List[str] = []
 
-        summaries = self.list_task_summaries()
-        for summary in summaries:
+        # Only ACTIVE files can be eligible, and the age check needs just a
+        # stat, so files are parsed only once they are old enough.
+        for task_path, stat_result in self.state_manager.iter_active_task_paths():
             if len(resumed) >= max_tasks:
                 break
-            if summary.get("lifecycle") != "ACTIVE":
-                continue
-            status = summary.get("status")
-            if status != "IN_PROGRESS":
-                continue
-            if summary.get("has_current_step"):
-                continue
 
-            source_path = summary.get("source_path")
-            if not source_path:
+            age_seconds = time.time() - stat_result.st_mtime
+            if age_seconds < min_age_seconds:
                 continue
 
+            task_id = task_path.stem
             try:
-                mtime = Path(source_path).stat().st_mtime
+                state = self._read_task_file(
+                    task_path,
+                    lambda: self.state_manager.load_task(task_id)
+                )
             except FileNotFoundError:
                 continue
-
-            age_seconds = time.time() - mtime
-            if age_seconds < min_age_seconds:
+            except Exception as exc:
+                logger.warning("Skipping task %s: %s", task_id, exc)
                 continue
 
-            task_id = summary.get("task_id")
-            if not task_id:
+            if state.get("status") != "IN_PROGRESS":
+                continue
+            if state.get("current_step"):
                 continue
 
             await self.resume_task(task_id)
@@ -345,27 +421,29 @@ class ECFController:
 
         return resumed
 
-    async def _execute_remaining_steps(self, task_id: str, goal: str, max_steps: Optional[int] = None) -> int:
+    async def _execute_remaining_steps(
+        self,
+        task_id: str,
+        goal: str,
+        max_steps: Optional[int] = None,
+        use_executor: bool = True
+    ) -> int:
         """Execute remaining steps for an existing task state using WorkflowEngine."""
         # Use WorkflowEngine to execute the remaining steps
-        executed_steps = await self._execute_with_workflow_engine(task_id, goal, max_steps)
-        return executed_steps
-
-    async def _select_tool_for_step(self, step_description: str, goal: str, task_id: str) -> Dict[str, Any]:
-        tool_defs = self.registry.get_tool_definitions()
-        prompt = EXECUTOR_SYSTEM_PROMPT.format(
-            tool_definitions=json.dumps(tool_defs, indent=2)
-        )
-        user_prompt = (
-            f"Task Step: {step_description}\n"
-            f"Context: {json.dumps({'task_id': task_id, 'goal': goal})}"
+        executed_steps = await self._execute_with_workflow_engine(
+            task_id, goal, max_steps, use_executor=use_executor
         )
-        full_prompt = f"{prompt}\n\n{user_prompt}"
-        response = await self.llm.generate(full_prompt)
-        return self.executor._parse_response(response)
+        return executed_steps
 
     async def resume_task(self, task_id: str, max_steps: Optional[int] = None) -> str:
         """Resume execution of an existing task using on-disk state."""
+        self._trace_errors.clear()
+        try:
+            return await self._resume_task(task_id, max_steps=max_steps)
+        finally:
+            await self._flush_traces()
+
+    async def _resume_task(self, task_id: str, max_steps: Optional[int] = None) -> str:
         self.last_error = None
         task_state = self.state_manager.load_task(task_id)
         status = task_state.get("status")
@@ -388,14 +466,16 @@ class ECFController:
                 })
                 logger.info(
                     "Re-queued in-flight step for deterministic resume: "
-                    f"task_id={task_id} description={step_description}"
+                    "task_id=%s description=%s",
+                    task_id,
+                    step_description
                 )
             else:
                 raise ValueError(f"Cannot resume task {task_id} with incomplete current_step")
 
         goal = task_state.get("goal", "")
         self.state = ControllerState.EXECUTING
-        logger.info(f"Resuming task {task_id} with status {status}")
+        logger.info("Resuming task %s with status %s", task_id, status)
 
         await self._execute_remaining_steps(task_id, goal, max_steps=max_steps)
 
@@ -403,13 +483,12 @@ class ECFController:
             task_state = self.state_manager.load_task(task_id)
             if not task_state.get("next_steps"):
                 self.state = ControllerState.ARCHIVING
-                logger.info(f"Transitioning to {self.state.value}")
-                self.state_manager.update_task(task_id, {"status": "COMPLETED"})
-                self.state_manager.archive_task(task_id)
+                logger.info("Transitioning to %s", self.state.value)
+                self.state_manager.finalize_task(task_id, {"status": "COMPLETED"}, current=task_state)
                 self.state = ControllerState.COMPLETED
-                logger.info(f"Task {task_id} COMPLETED and ARCHIVED.")
+                logger.info("Task %s COMPLETED and ARCHIVED.", task_id)
         else:
-            logger.error(f"Task {task_id} halted in FAILED state.")
+            logger.error("Task %s halted in FAILED state.", task_id)
 
         return task_id
 
@@ -420,13 +499,20 @@ class ECFController:
         Returns:
             task_id: The ID of the processed task.
         """
+        self._trace_errors.clear()
+        try:
+            return await self._run_task(goal)
+        finally:
+            await self._flush_traces()
+
+    async def _run_task(self, goal: str) -> str:
         task_id: Optional[str] = None
         self.last_error = None
         
         try:
             # PHASE 1: PLANNING
             self.state = ControllerState.PLANNING
-            logger.info(f"Transitioning to {self.state.value} for goal: {goal}")
+            logger.info("Transitioning to %s for goal: %s", self.state.value, goal)
 
             if task_id is None:
                 task_id = self.state_manager.create_task({
@@ -437,96 +523,132 @@ class ECFController:
                 })
             
             try:
-                await self.planner.generate_plan(
-                    goal,
-                    constraints=[],
-                    domain="general",
-                    task_id=task_id
+                # Goals of the form "<tool>: <argument>" need neither the planner
+                # nor tool selection; the registry builds the one-step plan.
+                direct_plan = self.registry.match_goal_to_direct_plan(goal)
+                cached_steps = None
+                if direct_plan is None and self.plan_cache is not None:
+                    cached_steps = await asyncio.to_thread(self.plan_cache.lookup, goal)
+                if direct_plan is not None:
+                    logger.info("Direct plan for goal: %s", goal)
+                    planned_steps = direct_plan
+                elif cached_steps:
+                    logger.info("Plan cache hit for goal: %s", goal)
+                    planned_steps = cached_steps
+                else:
+                    await self.planner.generate_plan(
+                        goal,
+                        constraints=[],
+                        domain="general",
+                        task_id=task_id
+                    )
+                    task_state = self.state_manager.load_task(task_id)
+                    planned_steps = task_state.get("next_steps", [])
+                # Cached templates carry the tools chosen last time; selection is
+                # only repeated if one of them is no longer registered.
+                needs_selection = direct_plan is None and not (
+                    cached_steps and all(
+                        isinstance(step, dict) and self.registry.get_tool(step.get("tool") or "")
+                        for step in cached_steps
+                    )
                 )
-                task_state = self.state_manager.load_task(task_id)
-                planned_steps = task_state.get("next_steps", [])
                 if len(planned_steps) > self.MAX_PLANNED_STEPS:
                     raise InvalidPlanError(
                         "Plan has too many steps: "
                         f"{len(planned_steps)} > MAX_PLANNED_STEPS={self.MAX_PLANNED_STEPS}"
                     )
-                for index, step in enumerate(planned_steps):
+                step_descriptions = []
+                for step in planned_steps:
                     step_description = step.get("description") if isinstance(step, dict) else None
                     if not step_description:
                         raise InvalidPlanError("Plan step missing description")
-                    selection = await self._select_tool_for_step(step_description, goal, task_id)
-                    tool_name = selection.get("tool")
-                    if not tool_name or tool_name == "none":
-                        raise InvalidPlanError(
-                            f"Plan step {index} not executable: no matching tool"
-                        )
-                    if not self.registry.get_tool(tool_name):
-                        raise InvalidPlanError(
-                            f"Plan step {index} not executable: tool '{tool_name}' not registered"
-                        )
-                    if isinstance(step, dict):
-                        step["tool"] = tool_name
-                        step["tool_params"] = selection.get("params", {})
+                    step_descriptions.append(step_description)
+                if needs_selection:
+                    # Tool selection for each step only depends on its description,
+                    # so all steps are submitted to the provider as one batch.
+                    selection_context = {"task_id": task_id, "goal": goal}
+                    selections = await self.executor.select_tools_batch(
+                        [(description, selection_context) for description in step_descriptions]
+                    )
+                    for index, (step, selection) in enumerate(zip(planned_steps, selections)):
+                        tool_name = selection.get("tool")
+                        if not tool_name or tool_name == "none":
+                            raise InvalidPlanError(
+                                f"Plan step {index} not executable: no matching tool"
+                            )
+                        if not self.registry.get_tool(tool_name):
+                            raise InvalidPlanError(
+                                f"Plan step {index} not executable: tool '{tool_name}' not registered"
+                            )
+                        if isinstance(step, dict):
+                            step["tool"] = tool_name
+                            step["tool_params"] = selection.get("params", {})
 
                 self.state_manager.update_task(task_id, {
                     "next_steps": planned_steps
                 })
 
-                self.trace_store.append_decision(
-                    task_id,
-                    "plan_accepted",
-                    {"goal": goal}
-                )
-                self.trace_store.append_validation(
-                    task_id,
-                    "plan_valid",
-                    "PASS",
-                    {"goal": goal}
-                )
+                with self._storage_worker.batch(self._trace_errors) as traces:
+                    traces.append_decision(
+                        task_id,
+                        "plan_accepted",
+                        {"goal": goal}
+                    )
+                    traces.append_validation(
+                        task_id,
+                        "plan_valid",
+                        "PASS",
+                        {"goal": goal}
+                    )
             except InvalidPlanError as e:
-                logger.error(f"Planning failed: {str(e)}")
+                logger.error("Planning failed: %s", e)
                 self.state = ControllerState.FAILED
                 self.last_error = str(e)
-                self.trace_store.append_decision(
-                    task_id,
-                    "plan_rejected",
-                    {"error": str(e), "goal": goal}
-                )
-                self.trace_store.append_validation(
-                    task_id,
-                    "plan_valid",
-                    "FAIL",
-                    {"error": str(e), "goal": goal}
-                )
-                self.state_manager.update_task(task_id, {
+                with self._storage_worker.batch(self._trace_errors) as traces:
+                    traces.append_decision(
+                        task_id,
+                        "plan_rejected",
+                        {"error": str(e), "goal": goal}
+                    )
+                    traces.append_validation(
+                        task_id,
+                        "plan_valid",
+                        "FAIL",
+                        {"error": str(e), "goal": goal}
+                    )
+                self.state_manager.finalize_task(task_id, {
                     "status": "FAILED",
                     "error": str(e),
                     "failure_cause": "planning_invalid"
-                })
-                self.state_manager.archive_task(task_id, reason="failed_plan")
+                }, reason="failed_plan")
                 return task_id
             
             # PHASE 2: EXECUTING
             self.state = ControllerState.EXECUTING
-            logger.info(f"Transitioning to {self.state.value} for task_id: {task_id}")
+            logger.info("Transitioning to %s for task_id: %s", self.state.value, task_id)
             
-            await self._execute_remaining_steps(task_id, goal)
+            await self._execute_remaining_steps(
+                task_id, goal, use_executor=direct_plan is None
+            )
             
             # PHASE 3: ARCHIVING
             if self.state != ControllerState.FAILED:
                 self.state = ControllerState.ARCHIVING
-                logger.info(f"Transitioning to {self.state.value}")
-                self.state_manager.update_task(task_id, {"status": "COMPLETED"})
-                self.state_manager.archive_task(task_id)
+                logger.info("Transitioning to %s", self.state.value)
+                self.state_manager.finalize_task(task_id, {"status": "COMPLETED"})
+                if self.plan_cache is not None and direct_plan is None:
+                    await asyncio.to_thread(self.plan_cache.put, goal, planned_steps)
                 self.state = ControllerState.COMPLETED
-                logger.info(f"Task {task_id} COMPLETED and ARCHIVED.")
+                logger.info("Task %s COMPLETED and ARCHIVED.", task_id)
             else:
-                logger.error(f"Task {task_id} halted in FAILED state.")
+                if cached_steps:
+                    await asyncio.to_thread(self.plan_cache.record_failure, goal)
+                logger.error("Task %s halted in FAILED state.", task_id)
                 
             return task_id or "UNKNOWN"
             
         except Exception as e:
-            logger.exception(f"Unexpected controller error: {str(e)}")
+            logger.exception("Unexpected controller error: %s", e)
             self.state = ControllerState.FAILED
             self.last_error = f"{type(e).__name__}: {e}"
             if task_id is None:
@@ -536,63 +658,104 @@ class ECFController:
                     "constraints": [],
                     "next_steps": []
                 })
-            self.trace_store.append_decision(
-                task_id,
-                "controller_error",
-                {"error": str(e)}
-            )
-            self.state_manager.update_task(task_id, {
+            with self._storage_worker.batch(self._trace_errors) as traces:
+                traces.append_decision(
+                    task_id,
+                    "controller_error",
+                    {"error": str(e)}
+                )
+            self.state_manager.finalize_task(task_id, {
                 "status": "FAILED",
                 "error": self.last_error,
                 "failure_cause": "controller_error"
-            })
-            self.state_manager.archive_task(task_id, reason="error")
+            }, reason="error")
             return task_id
-        finally:
+
+    async def _flush_traces(self) -> None:
+        """
+        Wait, off the event loop, for queued trace writes to commit. Failed
+        writes end up on trace_error rather than raising, so they never turn
+        a finished task into an error or mask the task's own exception.
+        """
+        try:
+            await asyncio.to_thread(self._storage_worker.flush)
+        except Exception as exc:
+            # Failure of a batch submitted by another user of the shared writer
+            logger.error("Trace flush reported a failed write: %s", exc)
+
+    async def aclose(self) -> None:
+        """
+        Wait for pending trace writes and, if this controller built it, close
+        the LLM client. The shared trace writer stays up for other controllers.
+        """
+        await self._flush_traces()
+        if self.executor.response_cache is not None:
+            self.executor.response_cache.close()
+        if self._owns_llm:
             await self.llm.close()
 
     async def _convert_plan_to_workflow_nodes(
         self,
         task_id: str,
         goal: str,
-        use_executor: bool = True
+        use_executor: bool = True,
+        task_state: Optional[Dict[str, Any]] = None
     ) -> List[str]:
         """Convert plan steps to WorkflowEngine nodes and return node IDs."""
-        task_state = self.state_manager.load_task(task_id)
+        if task_state is None:
+            task_state = self.state_manager.load_task(task_id)
         next_steps = task_state.get("next_steps", [])
         node_ids = []
+
+        # A stored tool that is still registered is trusted as-is, so plans
+        # accepted by run_task make no selection calls here. Steps persisted
+        # without a tool (e.g. older task files being resumed) or with one
+        # that has since been unregistered get one batched selection call.
+        unselected = []
+        for index, step in enumerate(next_steps):
+            if not isinstance(step, dict) or not step.get("description"):
+                continue
+            stored_tool = step.get("tool")
+            if stored_tool and self.registry.get_tool(stored_tool):
+                continue
+            if stored_tool:
+                logger.warning(
+                    "Step %d tool '%s' is not registered; selecting again", index, stored_tool
+                )
+            unselected.append(index)
+        selection_context = {"task_id": task_id, "goal": goal}
+        selections = dict(zip(unselected, await self.executor.select_tools_batch(
+            [(next_steps[index]["description"], selection_context) for index in unselected]
+        )))
+
+        # Resolve every step's tool once; node ids (and so the id mapping used
+        # for dependencies) are derived from the resolved tool name.
         id_mapping: Dict[str, str] = {}
+        executable: List[Tuple[Dict[str, Any], str, str, str, Dict[str, Any]]] = []
         for index, step in enumerate(next_steps):
             if not isinstance(step, dict):
                 continue
-            step_id = str(step.get("id")) if step.get("id") is not None else None
             tool_name = step.get("tool")
-            if not tool_name:
-                tool_name = "unknown"
-            if step_id:
-                id_mapping[step_id] = f"step_{index}_{tool_name}"
-        
-        for index, step in enumerate(next_steps):
-            step_description = step.get("description") if isinstance(step, dict) else None
-            if not step_description:
-                continue
-                
-            # Select tool for this step
-            tool_name = step.get("tool") if isinstance(step, dict) else None
-            tool_params = step.get("tool_params") if isinstance(step, dict) else None
-            if not tool_name:
-                selection = await self._select_tool_for_step(step_description, goal, task_id)
-                tool_name = selection.get("tool")
-                tool_params = selection.get("params", {})
+            tool_params = step.get("tool_params")
+            if index in selections:
+                tool_name = selections[index].get("tool")
+                tool_params = selections[index].get("params", {})
             if tool_params is None:
                 tool_params = {}
-            
+            node_id = f"step_{index}_{tool_name or 'unknown'}"
+            if step.get("id") is not None:
+                id_mapping[str(step.get("id"))] = node_id
+
+            step_description = step.get("description")
+            if not step_description:
+                continue
             if not tool_name or tool_name == "none":
-                logger.warning(f"Step {index} not executable: no matching tool")
+                logger.warning("Step %d not executable: no matching tool", index)
                 continue
-                
+            executable.append((step, node_id, step_description, tool_name, tool_params))
+
+        for step, node_id, step_description, tool_name, tool_params in executable:
             # Create a simple node that executes the tool
-            node_id = f"step_{index}_{tool_name}"
             dependencies = []
             for dep in step.get("dependencies", []):
                 dep_key = str(dep)
@@ -609,7 +772,7 @@ class ECFController:
             )
             self.workflow_engine.add_node(node)
             node_ids.append(node_id)
-            
+
         return node_ids
 
     async def _execute_with_workflow_engine(
@@ -620,14 +783,20 @@ class ECFController:
         use_executor: bool = True
     ) -> int:
         """Execute remaining steps using WorkflowEngine."""
+        # Nothing writes the task file while the workflow runs, so one read
+        # serves both node construction and the accounting loop below.
+        task_state = self.state_manager.load_task(task_id)
         # Convert plan steps to workflow nodes
-        node_ids = await self._convert_plan_to_workflow_nodes(task_id, goal, use_executor=use_executor)
+        node_ids = await self._convert_plan_to_workflow_nodes(
+            task_id, goal, use_executor=use_executor, task_state=task_state
+        )
         if not node_ids:
             logger.info("No executable steps found for workflow engine")
             return 0
             
-        # Create TaskContext for workflow execution
-        context = TaskContext(
+        # Borrow a TaskContext for workflow execution; the engine copies the
+        # infrastructure it needs, so the context is returned once it finishes
+        with self.workflow_engine.context_pool.acquire(
             memory_store=None,  # Not used in this phase
             tool_registry=self.registry,
             data={
@@ -636,103 +805,95 @@ class ECFController:
                 "workflow_id": f"workflow_{task_id}",
                 "start_time": None  # Will be set by WorkflowEngine
             }
-        )
-        
-        # Execute workflow
-        result = await self.workflow_engine.execute_workflow(context)
+        ) as context:
+            # Execute workflow
+            result = await self.workflow_engine.execute_workflow(context)
         
         if result["status"] == "completed":
             # Update task state based on workflow results
             executed_steps = len(node_ids)
             try:
-                for index, node_id in enumerate(node_ids):
-                    if max_steps is not None and index >= max_steps:
-                        break
-                    if index >= self.MAX_EXECUTED_STEPS:
-                        raise RuntimeError(
-                            f"MAX_EXECUTED_STEPS exceeded: {self.MAX_EXECUTED_STEPS}"
-                        )
+                # Each write returns the persisted state, which is handed back
+                # as ``current`` so the loop never re-reads the file. Step
+                # descriptions come from the plan as it was before the run,
+                # since advance_step pops next_steps as the loop goes.
+                planned_steps = task_state.get("next_steps", [])
+                # Tool-call traces for the whole run are committed together
+                with self._storage_worker.batch(self._trace_errors) as traces:
+                    for index, node_id in enumerate(node_ids):
+                        if max_steps is not None and index >= max_steps:
+                            break
+                        if index >= self.MAX_EXECUTED_STEPS:
+                            raise RuntimeError(
+                                f"MAX_EXECUTED_STEPS exceeded: {self.MAX_EXECUTED_STEPS}"
+                            )
                         
-                    # Get result for this node
-                    node_result = result.get("results", {}).get(node_id, {})
-                    tool_name = node_result.get("tool_name") or node_result.get("tool") or "unknown"
-                    tool_params = node_result.get("tool_params") or node_result.get("params") or {}
-                    status = node_result.get("status", "SUCCESS")
-                    error = node_result.get("error")
-                    if status == "FAILED":
-                        if tool_name == "none":
-                            raise RuntimeError("execution_step_failed: no_tool")
-                        raise RuntimeError(error or "tool execution failed")
-                    result_payload = node_result.get("result")
-                    resolved_payload = result_payload
-                    if isinstance(result_payload, dict) and {"result", "status", "tool"}.issubset(result_payload.keys()):
-                        resolved_payload = result_payload.get("result")
-                    artifact = resolved_payload
-                    if not isinstance(resolved_payload, dict):
-                        artifact = str(resolved_payload) if resolved_payload is not None else ""
+                        # Get result for this node
+                        node_result = result.get("results", {}).get(node_id, {})
+                        tool_name = node_result.get("tool_name") or node_result.get("tool") or "unknown"
+                        tool_params = node_result.get("tool_params") or node_result.get("params") or {}
+                        status = node_result.get("status", "SUCCESS")
+                        error = node_result.get("error")
+                        if status == "FAILED":
+                            if tool_name == "none":
+                                raise RuntimeError("execution_step_failed: no_tool")
+                            raise RuntimeError(error or "tool execution failed")
+                        result_payload = node_result.get("result")
+                        resolved_payload = result_payload
+                        if isinstance(result_payload, dict) and {"result", "status", "tool"}.issubset(result_payload.keys()):
+                            resolved_payload = result_payload.get("result")
+                        artifact = resolved_payload
+                        if not isinstance(resolved_payload, dict):
+                            artifact = str(resolved_payload) if resolved_payload is not None else ""
                     
-                    # Update task state
-                    task_state = self.state_manager.load_task(task_id)
-                    next_steps = task_state.get("next_steps", [])
-                    step_description = None
-                    if index < len(next_steps):
-                        step_description = next_steps[index].get("description") if isinstance(next_steps[index], dict) else None
-                    self.state_manager.update_task(task_id, {
-                        "current_step": {
-                            "index": index,
-                            "description": step_description
-                        }
-                    })
-                    self.trace_store.append_tool_call(
-                        task_id=task_id,
-                        step_index=index,
-                        tool_name=tool_name,
-                        params=tool_params,
-                        status=status,
-                        result=str(node_result.get("result")) if node_result.get("result") is not None else None,
-                        error=error
-                    )
-                    duration_ms_tool = None
-                    if isinstance(resolved_payload, dict):
-                        duration_ms_tool = resolved_payload.get("duration_ms")
-                    self.state_manager.complete_step(
-                        task_id,
-                        step_index=index,
-                        outcome="SUCCESS",
-                        artifact=artifact,
-                        tool_name=tool_name,
-                        tool_params=tool_params,
-                        started_at=node_result.get("started_at"),
-                        completed_at=node_result.get("completed_at"),
-                        duration_ms_tool=duration_ms_tool,
-                        duration_ms_wall=node_result.get("duration_ms_wall")
-                    )
-                    
-                    # Update next_steps to remove completed step
-                    task_state = self.state_manager.load_task(task_id)
-                    next_steps = task_state.get("next_steps", [])
-                    if next_steps:
-                        self.state_manager.update_task(task_id, {
-                            "next_steps": next_steps[1:]
-                        })
+                        # Update task state
+                        step_description = None
+                        if index < len(planned_steps) and isinstance(planned_steps[index], dict):
+                            step_description = planned_steps[index].get("description")
+                        traces.append_tool_call(
+                            task_id=task_id,
+                            step_index=index,
+                            tool_name=tool_name,
+                            params=tool_params,
+                            status=status,
+                            result=self.artifact_store.reference(node_result.get("result")),
+                            error=error
+                        )
+                        duration_ms_tool = None
+                        if isinstance(resolved_payload, dict):
+                            duration_ms_tool = resolved_payload.get("duration_ms")
+                        # The step has already run, so recording it and popping it
+                        # from next_steps is a single write.
+                        task_state = self.state_manager.advance_step(
+                            task_id,
+                            step_index=index,
+                            description=step_description,
+                            outcome="SUCCESS",
+                            artifact=artifact,
+                            tool_name=tool_name,
+                            tool_params=tool_params,
+                            started_at=node_result.get("started_at"),
+                            completed_at=node_result.get("completed_at"),
+                            duration_ms_tool=duration_ms_tool,
+                            duration_ms_wall=node_result.get("duration_ms_wall"),
+                            current=task_state
+                        )
             except RuntimeError as exc:
                 error_msg = str(exc)
-                logger.error(f"Workflow failed: {error_msg}")
+                logger.error("Workflow failed: %s", error_msg)
                 self.last_error = error_msg
                 if error_msg.startswith("execution_step_failed") or "MAX_EXECUTED_STEPS" in error_msg:
-                    self.state_manager.update_task(task_id, {
+                    self.state_manager.finalize_task(task_id, {
                         "status": "FAILED",
                         "error": self.last_error,
                         "failure_cause": "execution_step_failed"
-                    })
-                    self.state_manager.archive_task(task_id, reason="failed_execute")
+                    }, reason="failed_execute", current=task_state)
                 else:
-                    self.state_manager.update_task(task_id, {
+                    self.state_manager.finalize_task(task_id, {
                         "status": "FAILED",
                         "error": self.last_error,
                         "failure_cause": "controller_error"
-                    })
-                    self.state_manager.archive_task(task_id, reason="error")
+                    }, reason="error", current=task_state)
                 self.state = ControllerState.FAILED
                 return 0
 
@@ -740,14 +901,13 @@ class ECFController:
         else:
             # Workflow failed
             error_msg = result.get("error", "Workflow execution failed")
-            logger.error(f"Workflow failed: {error_msg}")
+            logger.error("Workflow failed: %s", error_msg)
             self.last_error = error_msg
-            self.state_manager.update_task(task_id, {
+            self.state_manager.finalize_task(task_id, {
                 "status": "FAILED",
                 "error": self.last_error,
                 "failure_cause": "execution_step_failed"
-            })
-            self.state_manager.archive_task(task_id, reason="failed_execute")
+            }, reason="failed_execute")
             self.state = ControllerState.FAILED
             return 0
 
@@ -774,35 +934,15 @@ class ECFController:
         if stt_language is not None:
             stt_params["language"] = stt_language
 
+        step_params = (
+            {"audio_file_path": audio_file_path, "threshold": threshold},
+            stt_params,
+            {"text": agent_text},
+            {"text": "--help", "voice": tts_voice}
+        )
         next_steps = [
-            {
-                "description": "Detect wake word from captured audio",
-                "tool": "voice_wake_word",
-                "tool_params": {
-                    "audio_file_path": audio_file_path,
-                    "threshold": threshold
-                }
-            },
-            {
-                "description": "Transcribe captured audio to text",
-                "tool": "voice_stt",
-                "tool_params": stt_params
-            },
-            {
-                "description": "Agent execution (deterministic text output)",
-                "tool": "text_output",
-                "tool_params": {
-                    "text": agent_text
-                }
-            },
-            {
-                "description": "Synthesize speech from agent output",
-                "tool": "voice_tts",
-                "tool_params": {
-                    "text": "--help",
-                    "voice": tts_voice
-                }
-            }
+            {"description": description, "tool": tool, "tool_params": params}
+            for (description, tool), params in zip(_VOICE_STEP_META, step_params)
         ]
 
         task_id = self.state_manager.create_task({
@@ -818,26 +958,46 @@ class ECFController:
             use_executor=False
         )
 
-        archive_path: Optional[Path] = None
-        if self.state != ControllerState.FAILED:
+        await self._finalize_lifecycle(self._finalize_voice_lifecycle, task_id)
+
+        return task_id
+
+    async def _finalize_lifecycle(
+        self,
+        finalize: Callable[..., None],
+        task_id: str,
+        *args: Any
+    ) -> None:
+        """
+        Run a lifecycle's archive/session step on a worker thread (it is
+        blocking file I/O) while keeping every state transition on the loop.
+        """
+        completed = self.state != ControllerState.FAILED
+        if completed:
             self.state = ControllerState.ARCHIVING
-            logger.info(f"Transitioning to {self.state.value}")
-            self.state_manager.update_task(task_id, {"status": "COMPLETED"})
-            archive_path = self.state_manager.archive_task(task_id)
+            logger.info("Transitioning to %s", self.state.value)
+        await asyncio.to_thread(finalize, task_id, completed, *args)
+        if completed:
             self.state = ControllerState.COMPLETED
-            logger.info(f"Voice lifecycle {task_id} COMPLETED and ARCHIVED.")
+
+    def _finalize_voice_lifecycle(self, task_id: str, completed: bool) -> None:
+        """Archive a finished voice lifecycle and write its session artifacts."""
+        archive_path: Optional[Path] = None
+        if completed:
+            archive_path = self.state_manager.finalize_task(task_id, {"status": "COMPLETED"})
+            logger.info("Voice lifecycle %s COMPLETED and ARCHIVED.", task_id)
         else:
-            logger.error(f"Voice lifecycle {task_id} halted in FAILED state.")
+            logger.error("Voice lifecycle %s halted in FAILED state.", task_id)
             try:
                 archive_path = self.state_manager.find_archived_task_path(task_id)
             except FileNotFoundError:
                 archive_path = None
 
         if archive_path:
-            session_path = self._write_voice_session(task_id, archive_path)
-            self._write_voice_session_metrics(session_path, archive_path)
-
-        return task_id
+            # Parsed once; the session and its metrics are built from the same state
+            task_state = loads(archive_path.read_bytes())
+            session = self._write_voice_session(task_id, archive_path, task_state)
+            self._write_voice_session_metrics(session, task_state, archive_path)
 
     def _build_voice_session(
         self,
@@ -847,14 +1007,16 @@ class ECFController:
     ) -> Dict[str, Any]:
         completed_steps = task_state.get("completed_steps", [])
         step_entries: List[Tuple[str, int]] = []
+        seen_keys: set[str] = set()
         for step in completed_steps:
             tool_name = step.get("tool_name") or "unknown"
             index = step.get("index")
             if index is None:
                 continue
             step_key = tool_name
-            if any(existing[0] == step_key for existing in step_entries):
+            if step_key in seen_keys:
                 step_key = f"{tool_name}_{index}"
+            seen_keys.add(step_key)
             step_entries.append((step_key, index))
 
         created_at = task_state.get("metadata", {}).get("created_at")
@@ -879,15 +1041,23 @@ class ECFController:
             }
         }
 
-    def _write_voice_session(self, task_id: str, archive_path: Path) -> Path:
-        task_state = json.loads(archive_path.read_text())
-        archive_dir = archive_path.parent
+    def _write_voice_session(
+        self,
+        task_id: str,
+        archive_path: Path,
+        task_state: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Write the VoiceSession artifact next to the archive and return it."""
         session = self._build_voice_session(task_id, archive_path, task_state)
-        return self.state_manager.write_voice_session(session, archive_dir)
+        self.state_manager.write_voice_session(session, archive_path.parent)
+        return session
 
-    def _write_voice_session_metrics(self, session_path: Path, archive_path: Path) -> Path:
-        session = json.loads(session_path.read_text())
-        task_state = json.loads(archive_path.read_text())
+    def _write_voice_session_metrics(
+        self,
+        session: Dict[str, Any],
+        task_state: Dict[str, Any],
+        archive_path: Path
+    ) -> Path:
         session_id = session.get("session_id")
         if not session_id:
             raise ValueError("VoiceSession metrics missing session_id")
@@ -938,12 +1108,26 @@ class ECFController:
 
         return self.state_manager.write_voice_session_metrics(session_id, metrics, archive_path.parent)
 
+    @staticmethod
+    def _load_step_tool_names(archive_file: Path) -> Tuple[Optional[str], ...]:
+        """
+        Tool name of each completed step in an archived task. Raises
+        FileNotFoundError if the archive is gone; unchanged archives are
+        served from a process-wide cache without being read again.
+        """
+        stat_result = archive_file.stat()
+        return _archive_step_tool_names(
+            str(archive_file), stat_result.st_mtime_ns, stat_result.st_size
+        )
+
     def replay_voice_session(self, session_id: str) -> Dict[str, Any]:
         """Validate a VoiceSession artifact without re-executing tools."""
         session = self.state_manager.load_voice_session(session_id)
         step_order = session.get("step_order", [])
         step_artifacts = session.get("step_artifacts", {})
         errors: List[str] = []
+        # Steps of one session normally share a single archive; read it once
+        archive_cache: Dict[str, Tuple[Optional[str], ...]] = {}
 
         for step_key in step_order:
             entry = step_artifacts.get(step_key)
@@ -955,20 +1139,22 @@ class ECFController:
             if archive_path is None or step_index is None:
                 errors.append(f"Invalid artifact reference for {step_key}")
                 continue
-            archive_file = Path(archive_path)
-            if not archive_file.exists():
-                errors.append(f"Archive file missing for {step_key}: {archive_path}")
-                continue
-            task_state = json.loads(archive_file.read_text())
-            completed_steps = task_state.get("completed_steps", [])
-            if not isinstance(step_index, int) or step_index >= len(completed_steps):
+            step_tool_names = archive_cache.get(archive_path)
+            if step_tool_names is None:
+                try:
+                    step_tool_names = self._load_step_tool_names(Path(archive_path))
+                except FileNotFoundError:
+                    errors.append(f"Archive file missing for {step_key}: {archive_path}")
+                    continue
+                archive_cache[archive_path] = step_tool_names
+            if not isinstance(step_index, int) or step_index >= len(step_tool_names):
                 errors.append(f"Completed step index invalid for {step_key}: {step_index}")
                 continue
-            recorded_tool = completed_steps[step_index].get("tool_name")
+            recorded_tool = step_tool_names[step_index]
             expected_tool = step_key
-            suffix = f"_{step_index}"
-            if step_key.endswith(suffix):
-                expected_tool = step_key[: -len(suffix)]
+            base, _, tail = step_key.rpartition("_")
+            if base and tail.isdecimal() and int(tail) == step_index:
+                expected_tool = base
             if recorded_tool != expected_tool:
                 errors.append(
                     f"Tool mismatch for {step_key}: recorded={recorded_tool} expected={expected_tool}"
@@ -1028,31 +1214,45 @@ class ECFController:
             use_executor=False
         )
 
-        task_state = self.state_manager.load_task(task_id)
-        completed_steps = task_state.get("completed_steps", [])
-        for step in completed_steps:
-            if step.get("tool_name") != "web_search":
-                continue
-            raw_result = step.get("artifact")
-            step["artifact"] = {
-                "query": query,
-                "provider": provider,
-                "max_results": max_results,
-                "result": raw_result
-            }
-        if completed_steps:
-            self.state_manager.update_task(task_id, {"completed_steps": completed_steps})
+        await self._finalize_lifecycle(
+            self._finalize_research_lifecycle, task_id, query, provider, max_results
+        )
+
+        return task_id
 
+    def _finalize_research_lifecycle(
+        self,
+        task_id: str,
+        completed: bool,
+        query: str,
+        provider: str,
+        max_results: int
+    ) -> None:
+        """Archive a finished research lifecycle and write its session artifacts."""
         archive_path: Optional[Path] = None
-        if self.state != ControllerState.FAILED:
-            self.state = ControllerState.ARCHIVING
-            logger.info(f"Transitioning to {self.state.value}")
-            self.state_manager.update_task(task_id, {"status": "COMPLETED"})
-            archive_path = self.state_manager.archive_task(task_id)
-            self.state = ControllerState.COMPLETED
-            logger.info(f"Research lifecycle {task_id} COMPLETED and ARCHIVED.")
+        if completed:
+            # The web_search artifact rewrite and the status change go into the
+            # archive in one write rather than an update followed by a finalize.
+            task_state = self.state_manager.load_task(task_id)
+            completed_steps = task_state.get("completed_steps", [])
+            for step in completed_steps:
+                if step.get("tool_name") != "web_search":
+                    continue
+                raw_result = step.get("artifact")
+                step["artifact"] = {
+                    "query": query,
+                    "provider": provider,
+                    "max_results": max_results,
+                    "result": raw_result
+                }
+            archive_path = self.state_manager.finalize_task(
+                task_id,
+                {"status": "COMPLETED", "completed_steps": completed_steps},
+                current=task_state
+            )
+            logger.info("Research lifecycle %s COMPLETED and ARCHIVED.", task_id)
         else:
-            logger.error(f"Research lifecycle {task_id} halted in FAILED state.")
+            logger.error("Research lifecycle %s halted in FAILED state.", task_id)
             try:
                 archive_path = self.state_manager.find_archived_task_path(task_id)
             except FileNotFoundError:
@@ -1061,8 +1261,6 @@ class ECFController:
         if archive_path:
             self._write_research_session(task_id, archive_path)
 
-        return task_id
-
     def _build_research_session(
         self,
         task_id: str,
@@ -1071,14 +1269,16 @@ class ECFController:
     ) -> Dict[str, Any]:
         completed_steps = task_state.get("completed_steps", [])
         step_entries: List[Tuple[str, int]] = []
+        seen_keys: set[str] = set()
         for step in completed_steps:
             tool_name = step.get("tool_name") or "unknown"
             index = step.get("index")
             if index is None:
                 continue
             step_key = tool_name
-            if any(existing[0] == step_key for existing in step_entries):
+            if step_key in seen_keys:
                 step_key = f"{tool_name}_{index}"
+            seen_keys.add(step_key)
             step_entries.append((step_key, index))
 
         created_at = task_state.get("metadata", {}).get("created_at")
@@ -1104,7 +1304,7 @@ class ECFController:
         }
 
     def _write_research_session(self, task_id: str, archive_path: Path) -> Path:
-        task_state = json.loads(archive_path.read_text())
+        task_state = loads(archive_path.read_bytes())
         archive_dir = archive_path.parent
         session = self._build_research_session(task_id, archive_path, task_state)
         return self.state_manager.write_research_session(session, archive_dir)
@@ -1115,6 +1315,8 @@ class ECFController:
         step_order = session.get("step_order", [])
         step_artifacts = session.get("step_artifacts", {})
         errors: List[str] = []
+        # Steps of one session normally share a single archive; read it once
+        archive_cache: Dict[str, Tuple[Optional[str], ...]] = {}
 
         for step_key in step_order:
             entry = step_artifacts.get(step_key)
@@ -1126,20 +1328,22 @@ class ECFController:
             if archive_path is None or step_index is None:
                 errors.append(f"Invalid artifact reference for {step_key}")
                 continue
-            archive_file = Path(archive_path)
-            if not archive_file.exists():
-                errors.append(f"Archive file missing for {step_key}: {archive_path}")
-                continue
-            task_state = json.loads(archive_file.read_text())
-            completed_steps = task_state.get("completed_steps", [])
-            if not isinstance(step_index, int) or step_index >= len(completed_steps):
+            step_tool_names = archive_cache.get(archive_path)
+            if step_tool_names is None:
+                try:
+                    step_tool_names = self._load_step_tool_names(Path(archive_path))
+                except FileNotFoundError:
+                    errors.append(f"Archive file missing for {step_key}: {archive_path}")
+                    continue
+                archive_cache[archive_path] = step_tool_names
+            if not isinstance(step_index, int) or step_index >= len(step_tool_names):
                 errors.append(f"Completed step index invalid for {step_key}: {step_index}")
                 continue
-            recorded_tool = completed_steps[step_index].get("tool_name")
+            recorded_tool = step_tool_names[step_index]
             expected_tool = step_key
-            suffix = f"_{step_index}"
-            if step_key.endswith(suffix):
-                expected_tool = step_key[: -len(suffix)]
+            base, _, tail = step_key.rpartition("_")
+            if base and tail.isdecimal() and int(tail) == step_index:
+                expected_tool = base
             if recorded_tool != expected_tool:
                 errors.append(
                     f"Tool mismatch for {step_key}: recorded={recorded_tool} expected={expected_tool}"
@@ -1164,29 +1368,21 @@ class ECFController:
         self.last_error = None
         self.state = ControllerState.EXECUTING
 
-        next_steps: List[Dict[str, Any]] = []
-        for index, turn in enumerate(turns):
-            user_text = turn.get("user")
-            assistant_text = turn.get("assistant")
-            if user_text is None or assistant_text is None:
-                raise ValueError("Each turn must include 'user' and 'assistant' text")
-
-            next_steps.extend([
-                {
-                    "description": f"Persist conversation user turn {index}",
-                    "tool": "text_output",
-                    "tool_params": {
-                        "text": user_text
-                    }
-                },
-                {
-                    "description": f"Persist conversation assistant turn {index}",
-                    "tool": "text_output",
-                    "tool_params": {
-                        "text": assistant_text
-                    }
+        if any(turn.get("user") is None or turn.get("assistant") is None for turn in turns):
+            raise ValueError("Each turn must include 'user' and 'assistant' text")
+
+        # Two steps per turn (user, then assistant), built in one pass
+        next_steps: List[Dict[str, Any]] = [
+            {
+                "description": f"Persist conversation {role} turn {index}",
+                "tool": "text_output",
+                "tool_params": {
+                    "text": turn[role]
                 }
-            ])
+            }
+            for index, turn in enumerate(turns)
+            for role in ("user", "assistant")
+        ]
 
         task_id = self.state_manager.create_task({
             "goal": "conversation_lifecycle",
@@ -1201,16 +1397,18 @@ class ECFController:
             use_executor=False
         )
 
+        await self._finalize_lifecycle(self._finalize_conversation_lifecycle, task_id)
+
+        return task_id
+
+    def _finalize_conversation_lifecycle(self, task_id: str, completed: bool) -> None:
+        """Archive a finished conversation lifecycle and write its session artifacts."""
         archive_path: Optional[Path] = None
-        if self.state != ControllerState.FAILED:
-            self.state = ControllerState.ARCHIVING
-            logger.info(f"Transitioning to {self.state.value}")
-            self.state_manager.update_task(task_id, {"status": "COMPLETED"})
-            archive_path = self.state_manager.archive_task(task_id)
-            self.state = ControllerState.COMPLETED
-            logger.info(f"Conversation lifecycle {task_id} COMPLETED and ARCHIVED.")
+        if completed:
+            archive_path = self.state_manager.finalize_task(task_id, {"status": "COMPLETED"})
+            logger.info("Conversation lifecycle %s COMPLETED and ARCHIVED.", task_id)
         else:
-            logger.error(f"Conversation lifecycle {task_id} halted in FAILED state.")
+            logger.error("Conversation lifecycle %s halted in FAILED state.", task_id)
             try:
                 archive_path = self.state_manager.find_archived_task_path(task_id)
             except FileNotFoundError:
@@ -1219,8 +1417,6 @@ class ECFController:
         if archive_path:
             self._write_conversation_session(task_id, archive_path)
 
-        return task_id
-
     def _build_conversation_session(
         self,
         task_id: str,
@@ -1229,6 +1425,7 @@ class ECFController:
     ) -> Dict[str, Any]:
         completed_steps = task_state.get("completed_steps", [])
         step_entries: List[Tuple[str, int]] = []
+        seen_keys: set[str] = set()
         for step in completed_steps:
             index = step.get("index")
             if index is None:
@@ -1236,8 +1433,9 @@ class ECFController:
             turn_index = index // 2
             role = "user" if index % 2 == 0 else "assistant"
             step_key = f"turn_{turn_index}_{role}"
-            if any(existing[0] == step_key for existing in step_entries):
+            if step_key in seen_keys:
                 step_key = f"{step_key}_{index}"
+            seen_keys.add(step_key)
             step_entries.append((step_key, index))
 
         created_at = task_state.get("metadata", {}).get("created_at")
@@ -1263,7 +1461,7 @@ class ECFController:
         }
 
     def _write_conversation_session(self, task_id: str, archive_path: Path) -> Path:
-        task_state = json.loads(archive_path.read_text())
+        task_state = loads(archive_path.read_bytes())
         archive_dir = archive_path.parent
         session = self._build_conversation_session(task_id, archive_path, task_state)
         return self.state_manager.write_conversation_session(session, archive_dir)
@@ -1274,6 +1472,8 @@ class ECFController:
         step_order = session.get("step_order", [])
         step_artifacts = session.get("step_artifacts", {})
         errors: List[str] = []
+        # Steps of one session normally share a single archive; read it once
+        archive_cache: Dict[str, Tuple[Optional[str], ...]] = {}
 
         for step_key in step_order:
             entry = step_artifacts.get(step_key)
@@ -1285,16 +1485,18 @@ class ECFController:
             if archive_path is None or step_index is None:
                 errors.append(f"Invalid artifact reference for {step_key}")
                 continue
-            archive_file = Path(archive_path)
-            if not archive_file.exists():
-                errors.append(f"Archive file missing for {step_key}: {archive_path}")
-                continue
-            task_state = json.loads(archive_file.read_text())
-            completed_steps = task_state.get("completed_steps", [])
-            if not isinstance(step_index, int) or step_index >= len(completed_steps):
+            step_tool_names = archive_cache.get(archive_path)
+            if step_tool_names is None:
+                try:
+                    step_tool_names = self._load_step_tool_names(Path(archive_path))
+                except FileNotFoundError:
+                    errors.append(f"Archive file missing for {step_key}: {archive_path}")
+                    continue
+                archive_cache[archive_path] = step_tool_names
+            if not isinstance(step_index, int) or step_index >= len(step_tool_names):
                 errors.append(f"Completed step index invalid for {step_key}: {step_index}")
                 continue
-            recorded_tool = completed_steps[step_index].get("tool_name")
+            recorded_tool = step_tool_names[step_index]
             if recorded_tool != "text_output":
                 errors.append(
                     f"Tool mismatch for {step_key}: recorded={recorded_tool} expected=text_output"
@@ -1,18 +1,49 @@
+import asyncio
 from abc import ABC, abstractmethod
+from typing import List, Optional
 
 class BaseLLMProvider(ABC):
     """Abstract base class for LLM providers."""
     
     @abstractmethod
-    async def generate(self, prompt: str, **kwargs) -> str:
+    async def generate(self, prompt: str, system_prompt: Optional[str] = None, **kwargs) -> str:
         """
         Generate a text response from the given prompt.
         
         Args:
             prompt: The input text prompt.
+            system_prompt: Optional static prefix sent as a separate system message so
+                providers with prompt caching can reuse it across calls.
             **kwargs: Additional provider-specific arguments (temperature, max_tokens, etc.)
             
         Returns:
             The generated text response.
         """
         pass
+
+    async def generate_batch(
+        self,
+        prompts: List[str],
+        system_prompt: Optional[str] = None,
+        max_concurrency: int = 8,
+        **kwargs
+    ) -> List[str]:
+        """
+        Generate responses for independent prompts concurrently.
+
+        The default implementation fans out over ``generate`` with a bounded
+        semaphore so continuous-batching servers (vLLM, TGI, Ollama) receive the
+        requests together. Results are returned in prompt order; the first
+        failure is raised after all requests settle.
+        """
+        semaphore = asyncio.Semaphore(max(1, max_concurrency))
+
+        async def _one(prompt: str) -> str:
+            async with semaphore:
+                return await self.generate(prompt, system_prompt=system_prompt, **kwargs)
+
+        results = await asyncio.gather(*(_one(p) for p in prompts), return_exceptions=True)
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+        return list(results)
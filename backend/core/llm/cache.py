@@ -0,0 +1,119 @@
+"""
+SQLite-backed cache for deterministic LLM answers (e.g. tool selections).
+"""
+import hashlib
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Iterable, Optional, Tuple
+
+# Keys per lookup query, well under SQLite's bound-parameter limit
+_LOOKUP_CHUNK = 500
+
+
+def response_cache_key(*parts: str) -> str:
+    """Stable sha256 key over the parts that determine a response."""
+    digest = hashlib.sha256()
+    for part in parts:
+        digest.update(part.encode("utf-8"))
+        digest.update(b"\x00")
+    return digest.hexdigest()
+
+
+class LLMResponseCache:
+    """
+    Key/value store of serialized responses with a fixed time-to-live.
+    Entries older than ``ttl_seconds`` are treated as misses and deleted
+    on the next write.
+    """
+
+    def __init__(self, db_path: str, ttl_seconds: float):
+        self.db_path = db_path
+        self.ttl_seconds = ttl_seconds
+        # Long-lived connection, opened on first use and shared by the
+        # threads asyncio.to_thread runs lookups on; _lock serializes its use.
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+        self._init_db()
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        conn.execute("PRAGMA busy_timeout=5000")
+        return conn
+
+    def _init_db(self) -> None:
+        Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
+        conn = self._connect()
+        try:
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS llm_cache (
+                    key TEXT PRIMARY KEY,
+                    value TEXT NOT NULL,
+                    created_at REAL NOT NULL
+                )
+                """
+            )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_llm_cache_created_at ON llm_cache (created_at)"
+            )
+            conn.commit()
+        finally:
+            conn.close()
+
+    def _connection(self) -> sqlite3.Connection:
+        # Caller holds _lock
+        if self._conn is None:
+            self._conn = self._connect()
+        return self._conn
+
+    def close(self) -> None:
+        """Close the connection; a later call reopens it."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def get(self, key: str) -> Optional[str]:
+        return self.get_many([key]).get(key)
+
+    def get_many(self, keys: Iterable[str]) -> Dict[str, str]:
+        """Return the unexpired values among ``keys``; misses are simply absent."""
+        keys = list(dict.fromkeys(keys))
+        found: Dict[str, str] = {}
+        if not keys:
+            return found
+        cutoff = time.time() - self.ttl_seconds
+        with self._lock:
+            conn = self._connection()
+            for start in range(0, len(keys), _LOOKUP_CHUNK):
+                chunk = keys[start:start + _LOOKUP_CHUNK]
+                placeholders = ",".join("?" * len(chunk))
+                found.update(conn.execute(
+                    f"SELECT key, value FROM llm_cache WHERE key IN ({placeholders}) AND created_at >= ?",
+                    (*chunk, cutoff)
+                ).fetchall())
+        return found
+
+    def set(self, key: str, value: str) -> None:
+        self.set_many([(key, value)])
+
+    def set_many(self, items: Iterable[Tuple[str, str]]) -> None:
+        """Store ``(key, value)`` pairs and drop expired entries, in one transaction."""
+        now = time.time()
+        rows = [(key, value, now) for key, value in items]
+        if not rows:
+            return
+        with self._lock:
+            conn = self._connection()
+            try:
+                conn.executemany(
+                    "INSERT OR REPLACE INTO llm_cache (key, value, created_at) VALUES (?, ?, ?)",
+                    rows
+                )
+                conn.execute("DELETE FROM llm_cache WHERE created_at < ?", (now - self.ttl_seconds,))
+                conn.commit()
+            except Exception:
+                conn.rollback()
+                raise
@@ -0,0 +1,27 @@
+"""
+Shared helpers for extracting JSON payloads from LLM responses.
+"""
+import re
+from typing import Any
+
+from backend.core.serialization import loads
+
+# Captures the body of the first ```json / ``` fence in one pass; an unterminated
+# fence runs to the end of the response.
+_FENCE_RE = re.compile(r"```(?:json)?\s*(.*?)(?:```|$)", re.DOTALL)
+
+
+def extract_json_body(response: str) -> str:
+    """Return the fenced JSON body if present, otherwise the response itself."""
+    match = _FENCE_RE.search(response)
+    return match.group(1).strip() if match else response
+
+
+def parse_json_response(response: str) -> Any:
+    """
+    Parse JSON from an LLM response, tolerating markdown fencing.
+
+    Raises:
+        json.JSONDecodeError: If the body is not valid JSON.
+    """
+    return loads(extract_json_body(response))
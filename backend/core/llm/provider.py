@@ -1,12 +1,16 @@
 import asyncio
 import logging
 from typing import Any, Dict, Optional
-from openai import AsyncOpenAI, APIError, APITimeoutError, APIConnectionError, RateLimitError
+import httpx
+from openai import AsyncOpenAI, DefaultAsyncHttpxClient, APIError, APITimeoutError, APIConnectionError, RateLimitError
 
 from backend.core.llm.base import BaseLLMProvider
 
 logger = logging.getLogger(__name__)
 
+# Keep idle connections around long enough to be reused across tasks
+_HTTP_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=32, keepalive_expiry=60.0)
+
 class LLMProviderError(Exception):
     """Base exception for LLM provider errors."""
     pass
@@ -33,23 +37,32 @@ class OpenAIProvider(BaseLLMProvider):
         self.client = AsyncOpenAI(
             api_key=api_key or "sk-no-key-required", # Default to template key if not provided
             base_url=base_url,
-            timeout=timeout
+            timeout=timeout,
+            http_client=DefaultAsyncHttpxClient(limits=_HTTP_LIMITS)
         )
         
         logger.info(f"OpenAIProvider initialized with model={model}, base_url={base_url}")
 
-    async def generate(self, prompt: str, **kwargs) -> str:
+    async def generate(self, prompt: str, system_prompt: Optional[str] = None, **kwargs) -> str:
         """
         Generate text response with exponential backoff retries.
+
+        A ``system_prompt`` is sent as a leading system message; keeping it
+        byte-identical across calls lets OpenAI-compatible servers apply
+        cached-input pricing to the shared prefix.
         """
         attempt = 0
         last_error = None
+
+        messages = [{"role": "user", "content": prompt}]
+        if system_prompt:
+            messages.insert(0, {"role": "system", "content": system_prompt})
         
         while attempt < self.max_retries:
             try:
                 response = await self.client.chat.completions.create(
                     model=self.model,
-                    messages=[{"role": "user", "content": prompt}],
+                    messages=messages,
                     **kwargs
                 )
                 
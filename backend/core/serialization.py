@@ -0,0 +1,68 @@
+"""
+JSON serialization helpers for JARVISv4.
+Uses orjson when available and falls back to the stdlib json module with
+equivalent compact output.
+"""
+import json
+from datetime import date, datetime, timezone
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional accelerator
+    orjson = None
+
+_ORJSON_OPTIONS = (
+    orjson.OPT_NON_STR_KEYS | orjson.OPT_NAIVE_UTC if orjson is not None else 0
+)
+
+
+def _default(obj: Any) -> Any:
+    # Mirrors orjson's OPT_NAIVE_UTC so both backends emit the same strings.
+    if isinstance(obj, datetime):
+        if obj.tzinfo is None:
+            obj = obj.replace(tzinfo=timezone.utc)
+        return obj.isoformat()
+    if isinstance(obj, date):
+        return obj.isoformat()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def dumps(obj: Any) -> str:
+    """
+    Serialize ``obj`` to a compact JSON string.
+
+    Datetimes are emitted as ISO 8601 strings, naive values treated as UTC.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=_ORJSON_OPTIONS).decode("utf-8")
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False, default=_default)
+
+
+def dumps_bytes(obj: Any, indent: bool = False) -> bytes:
+    """
+    Serialize ``obj`` to UTF-8 JSON bytes, compact unless ``indent`` is set
+    (two-space indentation, for files meant to be read by people).
+
+    Datetimes are emitted as ISO 8601 strings, naive values treated as UTC.
+    """
+    if orjson is not None:
+        option = _ORJSON_OPTIONS | orjson.OPT_INDENT_2 if indent else _ORJSON_OPTIONS
+        return orjson.dumps(obj, option=option)
+    if indent:
+        return json.dumps(obj, indent=2, ensure_ascii=False, default=_default).encode("utf-8")
+    return json.dumps(
+        obj, separators=(",", ":"), ensure_ascii=False, default=_default
+    ).encode("utf-8")
+
+
+def loads(data: Union[str, bytes]) -> Any:
+    """
+    Deserialize JSON from ``str`` or ``bytes``.
+
+    Raises:
+        json.JSONDecodeError: If the payload is not valid JSON.
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
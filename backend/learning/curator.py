@@ -8,6 +8,8 @@ import logging
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
+from backend.core.serialization import loads
+
 logger = logging.getLogger(__name__)
 
 class EpisodeCurator:
@@ -118,9 +120,9 @@ class EpisodeCurator:
         # Walk through all JSON files in the archive
         for json_file in self.archive_path.glob("**/*.json"):
             try:
-                with open(json_file, "r") as f:
-                    task_state = json.load(f)
-                    
+                # Archives are UTF-8 regardless of the platform's locale encoding
+                task_state = loads(json_file.read_bytes())
+
                 if not self.validate_admission(task_state):
                     continue
                     
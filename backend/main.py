@@ -4,6 +4,11 @@ import argparse
 import logging
 from typing import Optional
 
+try:
+    import uvloop
+except ImportError:  # Not available on Windows; fall back to the default loop
+    uvloop = None
+
 # Configure basic logging
 logging.basicConfig(
     level=logging.INFO,
@@ -21,7 +26,10 @@ async def run_goal(goal: str, settings, llm_timeout_seconds: float, llm_max_retr
     print(f"\n--- Starting ECF Task ---")
     print(f"Goal: {goal}")
     print(f"-------------------------\n")
-    task_id = await controller.run_task(goal)
+    try:
+        task_id = await controller.run_task(goal)
+    finally:
+        await controller.aclose()
     
     print(f"\n-------------------------")
     print(f"Task Processed: {task_id}")
@@ -41,7 +49,10 @@ async def run_resume(task_id: str, settings, llm_timeout_seconds: float, llm_max
     print(f"Task ID: {task_id}")
     print(f"-------------------------\n")
 
-    resumed_task_id = await controller.resume_task(task_id)
+    try:
+        resumed_task_id = await controller.resume_task(task_id)
+    finally:
+        await controller.aclose()
 
     print(f"\n-------------------------")
     print(f"Task Processed: {resumed_task_id}")
@@ -65,7 +76,7 @@ async def run_list_tasks(settings) -> int:
             f"next_steps={summary.get('next_steps')} "
             f"has_current_step={summary.get('has_current_step')}"
         )
-    await controller.llm.close()
+    await controller.aclose()
     return len(summaries)
 
 def _parse_args() -> argparse.Namespace:
@@ -165,6 +176,25 @@ async def _check_llm(settings, timeout: float, max_retries: int) -> bool:
     return False
 
 
+def _new_event_loop() -> asyncio.AbstractEventLoop:
+    """
+    Build the CLI event loop: uvloop when installed, and on Python 3.12+ an
+    eager task factory so tasks that finish without awaiting skip a trip
+    through the scheduler.
+    """
+    loop = uvloop.new_event_loop() if uvloop is not None else asyncio.new_event_loop()
+    eager_task_factory = getattr(asyncio, "eager_task_factory", None)
+    if eager_task_factory is not None:
+        loop.set_task_factory(eager_task_factory)
+    return loop
+
+
+def _run(coro):
+    """Run a coroutine to completion on the loop from _new_event_loop()."""
+    with asyncio.Runner(loop_factory=_new_event_loop) as runner:
+        return runner.run(coro)
+
+
 def main():
     args = _parse_args()
     
@@ -177,11 +207,11 @@ def main():
 
     try:
         if args.check_llm:
-            ok = asyncio.run(_check_llm(settings, args.llm_timeout_seconds, args.llm_max_retries))
+            ok = _run(_check_llm(settings, args.llm_timeout_seconds, args.llm_max_retries))
             sys.exit(0 if ok else 2)
 
         if args.list_tasks:
-            count = asyncio.run(run_list_tasks(settings))
+            count = _run(run_list_tasks(settings))
             print(f"TASK_SUMMARY_COUNT={count}")
             sys.exit(0)
 
@@ -191,20 +221,20 @@ def main():
             sys.exit(2)
 
         if args.resume_task_id:
-            ok = asyncio.run(_check_llm(settings, args.llm_timeout_seconds, args.llm_max_retries))
+            ok = _run(_check_llm(settings, args.llm_timeout_seconds, args.llm_max_retries))
             if not ok:
                 sys.exit(2)
-            asyncio.run(run_resume(
+            _run(run_resume(
                 args.resume_task_id,
                 settings,
                 args.llm_timeout_seconds,
                 args.llm_max_retries
             ))
         elif args.goal:
-            ok = asyncio.run(_check_llm(settings, args.llm_timeout_seconds, args.llm_max_retries))
+            ok = _run(_check_llm(settings, args.llm_timeout_seconds, args.llm_max_retries))
             if not ok:
                 sys.exit(2)
-            asyncio.run(run_goal(
+            _run(run_goal(
                 args.goal,
                 settings,
                 args.llm_timeout_seconds,
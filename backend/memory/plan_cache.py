@@ -0,0 +1,146 @@
+"""
+SQLite-backed cache of accepted plan templates, keyed by normalized goal.
+"""
+import sqlite3
+from datetime import datetime, UTC
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence
+
+from backend.core.serialization import dumps, loads
+
+
+def normalize_goal(goal: str) -> str:
+    """Case- and whitespace-insensitive cache key for a goal."""
+    return " ".join(goal.split()).casefold()
+
+
+def _template_key(goal: str, constraints: Optional[Sequence[str]]) -> str:
+    key = normalize_goal(goal)
+    if constraints:
+        key += "|" + dumps(sorted(constraints))
+    return key
+
+
+class PlanCache:
+    """
+    Stores the accepted step list (including the selected tools) for goals
+    that completed successfully, so a repeat of the same goal can skip both
+    the planner and tool selection. Templates whose runs fail more often than
+    they succeed are evicted.
+    """
+
+    def __init__(self, db_path: str):
+        self.db_path = db_path
+        self._init_db()
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.db_path)
+        conn.execute("PRAGMA busy_timeout=5000")
+        return conn
+
+    def _init_db(self) -> None:
+        Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
+        conn = self._connect()
+        try:
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS plan_cache (
+                    goal_key TEXT NOT NULL,
+                    domain TEXT NOT NULL,
+                    goal TEXT NOT NULL,
+                    steps TEXT NOT NULL,
+                    hits INTEGER NOT NULL DEFAULT 0,
+                    updated_at TEXT NOT NULL,
+                    PRIMARY KEY (goal_key, domain)
+                )
+                """
+            )
+            columns = {row[1] for row in conn.execute("PRAGMA table_info(plan_cache)")}
+            for column in ("success_count", "failure_count"):
+                if column not in columns:
+                    conn.execute(
+                        f"ALTER TABLE plan_cache ADD COLUMN {column} INTEGER NOT NULL DEFAULT 0"
+                    )
+            conn.commit()
+        finally:
+            conn.close()
+
+    def lookup(
+        self,
+        goal: str,
+        domain: str = "general",
+        constraints: Optional[Sequence[str]] = None
+    ) -> Optional[List[Dict[str, Any]]]:
+        """Return a copy of the cached steps for ``goal``, or None on a miss."""
+        key = _template_key(goal, constraints)
+        conn = self._connect()
+        try:
+            row = conn.execute(
+                "SELECT steps FROM plan_cache WHERE goal_key = ? AND domain = ?",
+                (key, domain)
+            ).fetchone()
+            if row is None:
+                return None
+            conn.execute(
+                "UPDATE plan_cache SET hits = hits + 1 WHERE goal_key = ? AND domain = ?",
+                (key, domain)
+            )
+            conn.commit()
+        finally:
+            conn.close()
+        return loads(row[0])
+
+    def put(
+        self,
+        goal: str,
+        steps: List[Dict[str, Any]],
+        domain: str = "general",
+        constraints: Optional[Sequence[str]] = None
+    ) -> None:
+        """Store (or refresh) the template for ``goal`` and count a success."""
+        template = [step for step in steps if isinstance(step, dict)]
+        conn = self._connect()
+        try:
+            conn.execute(
+                """
+                INSERT INTO plan_cache (goal_key, domain, goal, steps, updated_at, success_count)
+                VALUES (?, ?, ?, ?, ?, 1)
+                ON CONFLICT(goal_key, domain) DO UPDATE SET
+                    goal = excluded.goal,
+                    steps = excluded.steps,
+                    updated_at = excluded.updated_at,
+                    success_count = success_count + 1
+                """,
+                (
+                    _template_key(goal, constraints),
+                    domain,
+                    goal,
+                    dumps(template),
+                    datetime.now(UTC).isoformat()
+                )
+            )
+            conn.commit()
+        finally:
+            conn.close()
+
+    def record_failure(
+        self,
+        goal: str,
+        domain: str = "general",
+        constraints: Optional[Sequence[str]] = None
+    ) -> None:
+        """Count a failed run of a cached template; evict it once failures outnumber successes."""
+        key = _template_key(goal, constraints)
+        conn = self._connect()
+        try:
+            conn.execute(
+                "UPDATE plan_cache SET failure_count = failure_count + 1 WHERE goal_key = ? AND domain = ?",
+                (key, domain)
+            )
+            conn.execute(
+                "DELETE FROM plan_cache WHERE goal_key = ? AND domain = ? AND failure_count > success_count",
+                (key, domain)
+            )
+            conn.commit()
+        finally:
+            conn.close()
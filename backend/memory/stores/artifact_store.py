@@ -0,0 +1,73 @@
+"""
+Content-addressed, write-once blob store for large tool results.
+"""
+import hashlib
+from pathlib import Path
+from typing import Any, Optional
+
+from backend.core.serialization import dumps_bytes
+
+# Results up to this many bytes are kept inline in trace rows
+DEFAULT_INLINE_LIMIT = 4096
+REFERENCE_PREFIX = "sha256:"
+
+
+def _to_bytes(value: Any) -> bytes:
+    if isinstance(value, bytes):
+        return value
+    if isinstance(value, str):
+        return value.encode("utf-8")
+    try:
+        return dumps_bytes(value)
+    except TypeError:
+        return str(value).encode("utf-8")
+
+
+class ArtifactStore:
+    """
+    Stores blobs under ``base_path/<first two hex chars>/<sha256>``.
+    Identical payloads share one file, and existing files are never rewritten.
+    """
+
+    def __init__(self, base_path: Path, inline_limit: int = DEFAULT_INLINE_LIMIT):
+        self.base_path = Path(base_path)
+        self.inline_limit = inline_limit
+
+    def _blob_path(self, digest: str) -> Path:
+        return self.base_path / digest[:2] / digest
+
+    def put(self, value: Any) -> str:
+        """Persist ``value`` and return its sha256 hex digest."""
+        data = _to_bytes(value)
+        digest = hashlib.sha256(data).hexdigest()
+        blob = self._blob_path(digest)
+        if not blob.exists():
+            blob.parent.mkdir(parents=True, exist_ok=True)
+            temp_file = blob.with_suffix(".tmp")
+            temp_file.write_bytes(data)
+            temp_file.replace(blob)
+        return digest
+
+    def get(self, digest: str) -> bytes:
+        """Return the stored bytes for ``digest`` (with or without the prefix)."""
+        if digest.startswith(REFERENCE_PREFIX):
+            digest = digest[len(REFERENCE_PREFIX):]
+        blob = self._blob_path(digest)
+        if not blob.exists():
+            raise FileNotFoundError(f"Artifact not found: {digest}")
+        return blob.read_bytes()
+
+    def reference(self, value: Any) -> Optional[str]:
+        """
+        Text for a trace row: small results inline, larger ones as
+        ``sha256:<digest>`` pointing at a stored blob.
+        """
+        if value is None:
+            return None
+        if isinstance(value, str) and len(value) <= self.inline_limit // 4:
+            # Short enough that it fits the limit whatever its encoding
+            return value
+        data = _to_bytes(value)
+        if len(data) <= self.inline_limit:
+            return data.decode("utf-8", errors="replace")
+        return REFERENCE_PREFIX + self.put(data)
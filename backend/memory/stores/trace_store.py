@@ -1,24 +1,152 @@
 """
 SQLite-backed Tier-2 episodic trace store (append-only).
 """
-import json
+import logging
+import queue
 import sqlite3
+import threading
+import weakref
+from contextlib import contextmanager
 from datetime import datetime, UTC
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from backend.core.serialization import dumps
+
+logger = logging.getLogger(__name__)
+
+_SYNCHRONOUS_LEVELS = {"OFF", "NORMAL", "FULL", "EXTRA"}
+# Per-connection page cache (negative PRAGMA value means KiB) and mmap window
+_CACHE_SIZE_KIB = 20000
+_MMAP_SIZE_BYTES = 256 * 1024 * 1024
+
+_INSERT_DECISION = (
+    "INSERT INTO trace_decisions (task_id, timestamp, decision_type, payload) VALUES (?, ?, ?, ?)"
+)
+_INSERT_TOOL_CALL = """
+    INSERT INTO trace_tool_calls (
+        task_id, step_index, timestamp, tool_name, params, status, result, error
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+"""
+_INSERT_VALIDATION = (
+    "INSERT INTO trace_validations (task_id, timestamp, validation_type, status, details) VALUES (?, ?, ?, ?, ?)"
+)
+
+
+def _decision_row(task_id: str, decision_type: str, payload: Dict[str, Any]) -> Tuple[Any, ...]:
+    return (task_id, datetime.now(UTC).isoformat(), decision_type, dumps(payload))
+
+
+def _tool_call_row(
+    task_id: str,
+    step_index: int,
+    tool_name: Optional[str],
+    params: Dict[str, Any],
+    status: str,
+    result: Optional[str],
+    error: Optional[str]
+) -> Tuple[Any, ...]:
+    return (
+        task_id,
+        step_index,
+        datetime.now(UTC).isoformat(),
+        tool_name,
+        dumps(params),
+        status,
+        result,
+        error
+    )
+
+
+def _validation_row(
+    task_id: str,
+    validation_type: str,
+    status: str,
+    details: Dict[str, Any]
+) -> Tuple[Any, ...]:
+    return (task_id, datetime.now(UTC).isoformat(), validation_type, status, dumps(details))
+
+
+class TraceBatch:
+    """
+    Collects trace rows in memory; TraceStore.batch() writes them in one
+    transaction on exit. Mirrors TraceStore's append_* signatures.
+    """
+
+    def __init__(self) -> None:
+        self.pending: Dict[str, List[Tuple[Any, ...]]] = {}
+
+    def __len__(self) -> int:
+        return sum(len(rows) for rows in self.pending.values())
+
+    def _add(self, sql: str, row: Tuple[Any, ...]) -> None:
+        self.pending.setdefault(sql, []).append(row)
+
+    def append_decision(self, task_id: str, decision_type: str, payload: Dict[str, Any]) -> None:
+        self._add(_INSERT_DECISION, _decision_row(task_id, decision_type, payload))
+
+    def append_tool_call(
+        self,
+        task_id: str,
+        step_index: int,
+        tool_name: Optional[str],
+        params: Dict[str, Any],
+        status: str,
+        result: Optional[str],
+        error: Optional[str]
+    ) -> None:
+        self._add(
+            _INSERT_TOOL_CALL,
+            _tool_call_row(task_id, step_index, tool_name, params, status, result, error)
+        )
+
+    def append_validation(
+        self,
+        task_id: str,
+        validation_type: str,
+        status: str,
+        details: Dict[str, Any]
+    ) -> None:
+        self._add(_INSERT_VALIDATION, _validation_row(task_id, validation_type, status, details))
 
 
 class TraceStore:
     """Append-only trace store for decisions, tool calls, and validations."""
 
-    def __init__(self, db_path: str):
+    def __init__(self, db_path: str, synchronous: str = "NORMAL"):
         self.db_path = db_path
+        synchronous = synchronous.upper()
+        if synchronous not in _SYNCHRONOUS_LEVELS:
+            raise ValueError(f"Unsupported SQLite synchronous level: {synchronous}")
+        self.synchronous = synchronous
+        # Long-lived write connection, opened on first write and shared by
+        # the calling thread and StorageWorker; _lock serializes its use.
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
         self._init_db()
 
+    def _connect(self) -> sqlite3.Connection:
+        """
+        Open a connection tuned for append-heavy use. The database runs in WAL
+        mode, so synchronous=NORMAL only fsyncs at checkpoints, and writers
+        wait on busy_timeout instead of failing when another process holds
+        the lock. The write connection is long-lived, so a larger page cache
+        and memory-mapped reads pay off across batches.
+        """
+        conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        conn.execute("PRAGMA busy_timeout=5000")
+        conn.execute(f"PRAGMA synchronous={self.synchronous}")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        conn.execute(f"PRAGMA cache_size=-{_CACHE_SIZE_KIB}")
+        conn.execute(f"PRAGMA mmap_size={_MMAP_SIZE_BYTES}")
+        return conn
+
     def _init_db(self) -> None:
         Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         try:
+            # journal_mode is persistent, so it only needs setting once
+            conn.execute("PRAGMA journal_mode=WAL")
             conn.execute(
                 """
                 CREATE TABLE IF NOT EXISTS trace_decisions (
@@ -61,17 +189,43 @@ class TraceStore:
         finally:
             conn.close()
 
-    def append_decision(self, task_id: str, decision_type: str, payload: Dict[str, Any]) -> None:
-        timestamp = datetime.now(UTC).isoformat()
-        conn = sqlite3.connect(self.db_path)
+    def _write(self, pending: Dict[str, List[Tuple[Any, ...]]]) -> None:
+        """Insert the given rows, grouped by statement, in a single transaction."""
+        with self._lock:
+            if self._conn is None:
+                self._conn = self._connect()
+            conn = self._conn
+            try:
+                for sql, rows in pending.items():
+                    conn.executemany(sql, rows)
+                conn.commit()
+            except Exception:
+                conn.rollback()
+                raise
+
+    def close(self) -> None:
+        """Close the write connection; a later write reopens it."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    @contextmanager
+    def batch(self) -> Iterator[TraceBatch]:
+        """
+        Buffer appends and commit them together when the block exits.
+        Rows are written even if the block raises, since they describe work
+        that already happened.
+        """
+        trace_batch = TraceBatch()
         try:
-            conn.execute(
-                "INSERT INTO trace_decisions (task_id, timestamp, decision_type, payload) VALUES (?, ?, ?, ?)",
-                (task_id, timestamp, decision_type, json.dumps(payload))
-            )
-            conn.commit()
+            yield trace_batch
         finally:
-            conn.close()
+            if trace_batch.pending:
+                self._write(trace_batch.pending)
+
+    def append_decision(self, task_id: str, decision_type: str, payload: Dict[str, Any]) -> None:
+        self._write({_INSERT_DECISION: [_decision_row(task_id, decision_type, payload)]})
 
     def append_tool_call(
         self,
@@ -83,29 +237,11 @@ class TraceStore:
         result: Optional[str],
         error: Optional[str]
     ) -> None:
-        timestamp = datetime.now(UTC).isoformat()
-        conn = sqlite3.connect(self.db_path)
-        try:
-            conn.execute(
-                """
-                INSERT INTO trace_tool_calls (
-                    task_id, step_index, timestamp, tool_name, params, status, result, error
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-                """,
-                (
-                    task_id,
-                    step_index,
-                    timestamp,
-                    tool_name,
-                    json.dumps(params),
-                    status,
-                    result,
-                    error
-                )
-            )
-            conn.commit()
-        finally:
-            conn.close()
+        self._write({
+            _INSERT_TOOL_CALL: [
+                _tool_call_row(task_id, step_index, tool_name, params, status, result, error)
+            ]
+        })
 
     def append_validation(
         self,
@@ -114,13 +250,189 @@ class TraceStore:
         status: str,
         details: Dict[str, Any]
     ) -> None:
-        timestamp = datetime.now(UTC).isoformat()
-        conn = sqlite3.connect(self.db_path)
-        try:
-            conn.execute(
-                "INSERT INTO trace_validations (task_id, timestamp, validation_type, status, details) VALUES (?, ?, ?, ?, ?)",
-                (task_id, timestamp, validation_type, status, json.dumps(details))
+        self._write({_INSERT_VALIDATION: [_validation_row(task_id, validation_type, status, details)]})
+
+
+_STOP = object()
+# A queued batch and the list its write failures are reported to
+_Submission = Tuple[Dict[str, List[Tuple[Any, ...]]], Optional[List[BaseException]]]
+
+
+class StorageWorker:
+    """
+    Background writer for a TraceStore. submit() hands a batch to a single
+    daemon thread and returns at once; the thread drains whatever has queued
+    up and commits it in one transaction. flush() blocks until everything
+    submitted before it is on disk. A failed write is logged and appended to
+    the ``errors`` list given with its batch, or, without one, re-raised by
+    the next flush(). The thread exits, closing the store's
+    connection, once it has been idle for ``idle_timeout`` seconds; the next
+    submit() starts it again.
+    """
+
+    def __init__(self, store: TraceStore, idle_timeout: float = 5.0) -> None:
+        self.store = store
+        self.idle_timeout = idle_timeout
+        self._queue: "queue.SimpleQueue[Any]" = queue.SimpleQueue()
+        self._thread: Optional[threading.Thread] = None
+        # Guards _thread; queue puts happen under it so an idle thread never
+        # exits with work still queued.
+        self._start_lock = threading.Lock()
+        # First failed write (of a batch without an errors list) since the
+        # last flush(), re-raised by flush()
+        self._error: Optional[BaseException] = None
+
+    def _ensure_started(self) -> None:
+        # Caller holds _start_lock. Started on first use so controllers that
+        # never trace cost no thread.
+        if self._thread is None:
+            self._thread = threading.Thread(
+                target=self._run,
+                name="trace-storage-worker",
+                daemon=True
             )
-            conn.commit()
+            self._thread.start()
+
+    def submit(
+        self,
+        pending: Dict[str, List[Tuple[Any, ...]]],
+        errors: Optional[List[BaseException]] = None
+    ) -> None:
+        if not pending:
+            return
+        with self._start_lock:
+            self._queue.put((pending, errors))
+            self._ensure_started()
+
+    @contextmanager
+    def batch(self, errors: Optional[List[BaseException]] = None) -> Iterator[TraceBatch]:
+        """Same contract as TraceStore.batch(), but the write happens off-thread."""
+        trace_batch = TraceBatch()
+        try:
+            yield trace_batch
         finally:
-            conn.close()
\ No newline at end of file
+            self.submit(trace_batch.pending, errors)
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait for queued writes; returns False if the timeout expired first.
+
+        Raises:
+            Exception: The first write failure since the previous flush among
+                batches submitted without an errors list, so callers learn
+                that trace rows were lost.
+        """
+        done = threading.Event()
+        with self._start_lock:
+            running = self._thread is not None
+            if running:
+                self._queue.put(done)
+        if running and not done.wait(timeout):
+            return False
+        error, self._error = self._error, None
+        if error is not None:
+            raise error
+        return True
+
+    def close(self) -> None:
+        """Write anything still queued and stop the thread."""
+        with self._start_lock:
+            thread, self._thread = self._thread, None
+            if thread is not None:
+                self._queue.put(_STOP)
+        if thread is not None:
+            thread.join()
+
+    def _run(self) -> None:
+        stopping = False
+        while not stopping:
+            try:
+                items = [self._queue.get(timeout=self.idle_timeout)]
+            except queue.Empty:
+                with self._start_lock:
+                    if self._queue.empty():
+                        if self._thread is threading.current_thread():
+                            self._thread = None
+                        break
+                continue
+            while True:
+                try:
+                    items.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            submissions: List[_Submission] = []
+            waiters: List[threading.Event] = []
+            for item in items:
+                if item is _STOP:
+                    stopping = True
+                elif isinstance(item, threading.Event):
+                    waiters.append(item)
+                else:
+                    submissions.append(item)
+            if submissions:
+                self._write_submissions(submissions)
+            for waiter in waiters:
+                waiter.set()
+        self.store.close()
+
+    def _write_submissions(self, submissions: List[_Submission]) -> None:
+        """
+        Commit everything queued in one transaction. If that fails, retry each
+        submission in its own transaction so one bad batch cannot take rows
+        from unrelated runs down with it.
+        """
+        merged: Dict[str, List[Tuple[Any, ...]]] = {}
+        for pending, _ in submissions:
+            for sql, rows in pending.items():
+                merged.setdefault(sql, []).extend(rows)
+        try:
+            self.store._write(merged)
+            return
+        except Exception as exc:
+            if len(submissions) == 1:
+                self._record_failure(*submissions[0], exc)
+                return
+        for pending, errors in submissions:
+            try:
+                self.store._write(pending)
+            except Exception as exc:
+                self._record_failure(pending, errors, exc)
+
+    def _record_failure(
+        self,
+        pending: Dict[str, List[Tuple[Any, ...]]],
+        errors: Optional[List[BaseException]],
+        error: Exception
+    ) -> None:
+        """Log a failed batch and hand the exception to its submitter."""
+        logger.error(
+            "Failed to write %d trace rows",
+            sum(len(rows) for rows in pending.values()),
+            exc_info=error
+        )
+        if errors is not None:
+            errors.append(error)
+        elif self._error is None:
+            self._error = error
+
+
+# One worker (thread + write connection) per trace database per process
+_SHARED_WORKERS: "weakref.WeakValueDictionary[Tuple[str, str], StorageWorker]" = (
+    weakref.WeakValueDictionary()
+)
+_SHARED_WORKERS_LOCK = threading.Lock()
+
+
+def shared_storage_worker(db_path: str, synchronous: str = "NORMAL") -> StorageWorker:
+    """
+    Return the process-wide StorageWorker for ``db_path``. The TraceStore
+    behind it (schema and WAL setup) is built on first use, or again if the
+    database file has been removed since.
+    """
+    key = (str(Path(db_path).resolve()), synchronous.upper())
+    with _SHARED_WORKERS_LOCK:
+        worker = _SHARED_WORKERS.get(key)
+        if worker is None or not Path(db_path).exists():
+            worker = StorageWorker(TraceStore(db_path, synchronous=synchronous))
+            _SHARED_WORKERS[key] = worker
+        return worker
@@ -1,9 +1,11 @@
-import json
 import logging
+import os
 import uuid
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from backend.core.serialization import dumps_bytes, loads
 
 logger = logging.getLogger(__name__)
 
@@ -34,6 +36,23 @@ class WorkingStateManager:
             task_ids.append(task_file.stem)
         return sorted(task_ids)
 
+    def iter_active_task_paths(self) -> Iterator[Tuple[Path, os.stat_result]]:
+        """
+        Yield (path, stat) for non-archived task files in task_id order,
+        without reading them.
+        """
+        with os.scandir(self.base_path) as entries:
+            task_entries = sorted(
+                (entry for entry in entries
+                 if entry.is_file() and entry.name.startswith("task_") and entry.name.endswith(".json")),
+                key=lambda entry: entry.name[:-len(".json")]
+            )
+        for entry in task_entries:
+            try:
+                yield Path(entry.path), entry.stat()
+            except FileNotFoundError:
+                continue
+
     def list_archived_task_paths(self) -> List[Path]:
         """List archived task files stored under the archive directory."""
         if not self.archive_path.exists():
@@ -95,8 +114,7 @@ class WorkingStateManager:
         
         self._validate_state(state)
         
-        with open(task_file, "w") as f:
-            json.dump(state, f, indent=2)
+        task_file.write_bytes(dumps_bytes(state, indent=True))
         
         logger.info(f"Created task {task_id} at {task_file}")
         return task_id
@@ -107,15 +125,24 @@ class WorkingStateManager:
         if not task_file.exists():
             raise FileNotFoundError(f"Task file not found: {task_file}")
             
-        with open(task_file, "r") as f:
-            state = json.load(f)
+        state = loads(task_file.read_bytes())
             
         self._validate_state(state)
         return state
 
-    def update_task(self, task_id: str, updates: Dict[str, Any]) -> Dict[str, Any]:
-        """Update task state (atomic operation)."""
-        state = self.load_task(task_id)
+    def update_task(
+        self,
+        task_id: str,
+        updates: Dict[str, Any],
+        current: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """
+        Update task state (atomic operation).
+        
+        Callers that already hold the latest state (as returned by a previous
+        update) can pass it as ``current`` to skip re-reading the task file.
+        """
+        state = dict(current) if current is not None else self.load_task(task_id)
         state.update(updates)
         
         self._validate_state(state)
@@ -125,8 +152,7 @@ class WorkingStateManager:
         
         try:
             # Atomic write
-            with open(temp_file, "w") as f:
-                json.dump(state, f, indent=2)
+            temp_file.write_bytes(dumps_bytes(state, indent=True))
             temp_file.replace(task_file)
         except Exception as e:
             if temp_file.exists():
@@ -146,10 +172,11 @@ class WorkingStateManager:
         started_at: Optional[str] = None,
         completed_at: Optional[str] = None,
         duration_ms_tool: Optional[float] = None,
-        duration_ms_wall: Optional[float] = None
+        duration_ms_wall: Optional[float] = None,
+        current: Optional[Dict[str, Any]] = None
     ) -> Dict[str, Any]:
-        """Mark current step as completed."""
-        state = self.load_task(task_id)
+        """Mark current step as completed. ``current`` is as for update_task."""
+        state = dict(current) if current is not None else self.load_task(task_id)
         
         if not state.get("current_step"):
             raise ValueError(f"No active step to complete for task {task_id}")
@@ -157,9 +184,83 @@ class WorkingStateManager:
         if state["current_step"].get("index") != step_index:
             logger.warning(f"Completing step {step_index} but current_step index is {state['current_step'].get('index')}")
 
-        completed_step = {
+        completed_step = self._completed_step_record(
+            step_index,
+            state["current_step"].get("description"),
+            outcome,
+            artifact=artifact,
+            tool_name=tool_name,
+            tool_params=tool_params,
+            started_at=started_at,
+            completed_at=completed_at,
+            duration_ms_tool=duration_ms_tool,
+            duration_ms_wall=duration_ms_wall
+        )
+        
+        state["completed_steps"] = state["completed_steps"] + [completed_step]
+        state["current_step"] = None
+        state["status"] = "IN_PROGRESS"
+        
+        return self.update_task(task_id, state, current=state)
+
+    def advance_step(
+        self,
+        task_id: str,
+        step_index: int,
+        description: Optional[str],
+        outcome: str,
+        artifact: Optional[str] = None,
+        tool_name: Optional[str] = None,
+        tool_params: Optional[Dict[str, Any]] = None,
+        started_at: Optional[str] = None,
+        completed_at: Optional[str] = None,
+        duration_ms_tool: Optional[float] = None,
+        duration_ms_wall: Optional[float] = None,
+        current: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """
+        Record a finished step and pop it from next_steps in a single write.
+        
+        Equivalent to setting current_step, calling complete_step and then
+        dropping the head of next_steps, for callers that only learn about a
+        step after it has run. ``current`` is as for update_task.
+        """
+        state = current if current is not None else self.load_task(task_id)
+        completed_step = self._completed_step_record(
+            step_index,
+            description,
+            outcome,
+            artifact=artifact,
+            tool_name=tool_name,
+            tool_params=tool_params,
+            started_at=started_at,
+            completed_at=completed_at,
+            duration_ms_tool=duration_ms_tool,
+            duration_ms_wall=duration_ms_wall
+        )
+        return self.update_task(task_id, {
+            "completed_steps": state["completed_steps"] + [completed_step],
+            "current_step": None,
+            "next_steps": state.get("next_steps", [])[1:],
+            "status": "IN_PROGRESS"
+        }, current=state)
+
+    @staticmethod
+    def _completed_step_record(
+        step_index: int,
+        description: Optional[str],
+        outcome: str,
+        artifact: Optional[str] = None,
+        tool_name: Optional[str] = None,
+        tool_params: Optional[Dict[str, Any]] = None,
+        started_at: Optional[str] = None,
+        completed_at: Optional[str] = None,
+        duration_ms_tool: Optional[float] = None,
+        duration_ms_wall: Optional[float] = None
+    ) -> Dict[str, Any]:
+        return {
             "index": step_index,
-            "description": state["current_step"].get("description"),
+            "description": description,
             "outcome": outcome,
             "artifact": artifact,
             "tool_name": tool_name,
@@ -169,12 +270,6 @@ class WorkingStateManager:
             "duration_ms_tool": duration_ms_tool,
             "duration_ms_wall": duration_ms_wall
         }
-        
-        state["completed_steps"].append(completed_step)
-        state["current_step"] = None
-        state["status"] = "IN_PROGRESS"
-        
-        return self.update_task(task_id, state)
 
     def archive_task(self, task_id: str, reason: str = "completed") -> Path:
         """Move completed task to archive."""
@@ -191,6 +286,52 @@ class WorkingStateManager:
         logger.info(f"Archived task {task_id} to {archive_file}")
         return archive_file
 
+    def finalize_task(
+        self,
+        task_id: str,
+        updates: Dict[str, Any],
+        reason: str = "completed",
+        current: Optional[Dict[str, Any]] = None
+    ) -> Path:
+        """
+        Apply terminal ``updates`` and archive the task with a single write.
+        
+        Same end state as update_task followed by archive_task, but the final
+        state is written straight into the archive directory instead of being
+        rewritten in place and then moved. ``current`` is as for update_task.
+        """
+        task_file = self.base_path / f"{task_id}.json"
+        if not task_file.exists():
+            raise FileNotFoundError(f"Task file not found: {task_file}")
+
+        state = dict(current) if current is not None else self.load_task(task_id)
+        state.update(updates)
+        self._validate_state(state)
+
+        archive_dir = self.archive_path / datetime.now().strftime("%Y-%m")
+        archive_dir.mkdir(parents=True, exist_ok=True)
+        archive_file = archive_dir / f"{task_id}_{reason}.json"
+        temp_file = archive_file.with_suffix(".tmp")
+
+        try:
+            temp_file.write_bytes(dumps_bytes(state, indent=True))
+            temp_file.replace(archive_file)
+        except Exception as e:
+            if temp_file.exists():
+                temp_file.unlink()
+            raise e
+        task_file.unlink()
+
+        logger.info("Archived task %s to %s", task_id, archive_file)
+        return archive_file
+
+    @staticmethod
+    def _write_artifact(path: Path, payload: Dict[str, Any]) -> None:
+        """Atomically write an indented JSON session artifact."""
+        temp_file = path.with_suffix(".tmp")
+        temp_file.write_bytes(dumps_bytes(payload, indent=True))
+        temp_file.replace(path)
+
     def write_voice_session(self, session: Dict[str, Any], archive_dir: Path) -> Path:
         """Write a VoiceSession artifact alongside archived tasks."""
         session_id = session.get("session_id")
@@ -199,8 +340,7 @@ class WorkingStateManager:
 
         archive_dir.mkdir(parents=True, exist_ok=True)
         session_path = archive_dir / f"{session_id}.json"
-        with open(session_path, "w") as f:
-            json.dump(session, f, indent=2)
+        self._write_artifact(session_path, session)
         logger.info(f"Wrote voice session artifact to {session_path}")
         return session_path
 
@@ -211,8 +351,7 @@ class WorkingStateManager:
 
         archive_dir.mkdir(parents=True, exist_ok=True)
         metrics_path = archive_dir / f"{session_id}_metrics.json"
-        with open(metrics_path, "w") as f:
-            json.dump(metrics, f, indent=2)
+        self._write_artifact(metrics_path, metrics)
         logger.info(f"Wrote voice session metrics to {metrics_path}")
         return metrics_path
 
@@ -220,8 +359,7 @@ class WorkingStateManager:
         """Load a VoiceSession artifact from archive."""
         session_name = f"{session_id}.json"
         for session_path in self.archive_path.glob(f"**/{session_name}"):
-            with open(session_path, "r") as f:
-                return json.load(f)
+            return loads(session_path.read_bytes())
         raise FileNotFoundError(f"Voice session artifact not found: {session_id}")
 
     def write_research_session(self, session: Dict[str, Any], archive_dir: Path) -> Path:
@@ -232,8 +370,7 @@ class WorkingStateManager:
 
         archive_dir.mkdir(parents=True, exist_ok=True)
         session_path = archive_dir / f"{session_id}.json"
-        with open(session_path, "w") as f:
-            json.dump(session, f, indent=2)
+        self._write_artifact(session_path, session)
         logger.info(f"Wrote research session artifact to {session_path}")
         return session_path
 
@@ -241,8 +378,7 @@ class WorkingStateManager:
         """Load a ResearchSession artifact from archive."""
         session_name = f"{session_id}.json"
         for session_path in self.archive_path.glob(f"**/{session_name}"):
-            with open(session_path, "r") as f:
-                return json.load(f)
+            return loads(session_path.read_bytes())
         raise FileNotFoundError(f"Research session artifact not found: {session_id}")
 
     def write_conversation_session(self, session: Dict[str, Any], archive_dir: Path) -> Path:
@@ -253,8 +389,7 @@ class WorkingStateManager:
 
         archive_dir.mkdir(parents=True, exist_ok=True)
         session_path = archive_dir / f"{session_id}.json"
-        with open(session_path, "w") as f:
-            json.dump(session, f, indent=2)
+        self._write_artifact(session_path, session)
         logger.info(f"Wrote conversation session artifact to {session_path}")
         return session_path
 
@@ -262,6 +397,5 @@ class WorkingStateManager:
         """Load a ConversationSession artifact from archive."""
         session_name = f"{session_id}.json"
         for session_path in self.archive_path.glob(f"**/{session_name}"):
-            with open(session_path, "r") as f:
-                return json.load(f)
+            return loads(session_path.read_bytes())
         raise FileNotFoundError(f"Conversation session artifact not found: {session_id}")
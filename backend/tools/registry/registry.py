@@ -2,8 +2,10 @@
 Deterministic tool registry for JARVISv4.
 Manages tool discovery, metadata for LLMs, and schema-validated execution.
 """
+import json
 import logging
-from typing import Dict, Any, List, Optional
+import re
+from typing import Dict, Any, List, Optional, Tuple
 from jsonschema import validate, ValidationError
 
 from backend.tools.base import BaseTool, ToolDefinition
@@ -11,6 +13,10 @@ from backend.tools.base import BaseTool, ToolDefinition
 logger = logging.getLogger(__name__)
 
 
+# "<tool_name>: <argument>" goals that map straight onto one tool call
+_DIRECT_GOAL_PATTERN = re.compile(r"^\s*([A-Za-z_]\w*)\s*:\s*(\S.*?)\s*$", re.DOTALL)
+
+
 class ToolNotFoundError(ValueError):
     """Raised when a requested tool is not registered."""
 
@@ -29,27 +35,93 @@ class ToolRegistry:
 
     def __init__(self):
         self._tools: Dict[str, BaseTool] = {}
+        self._version = 0
+        self._definitions_cache: Optional[Tuple[int, List[Dict[str, Any]]]] = None
+        self._definitions_json_cache: Optional[Tuple[int, str]] = None
+
+    @property
+    def version(self) -> int:
+        """Monotonic counter bumped on every (un)registration; used to invalidate caches."""
+        return self._version
 
     def register_tool(self, tool: BaseTool):
         """Register a tool with its full definition."""
         name = tool.definition.name
         self._tools[name] = tool
+        self._version += 1
         logger.info(f"Registered tool: {name}")
 
+    def unregister_tool(self, name: str) -> None:
+        """Remove a registered tool."""
+        if self._tools.pop(name, None) is None:
+            raise ToolNotFoundError(f"Tool '{name}' not found")
+        self._version += 1
+        logger.info("Unregistered tool: %s", name)
+
     def list_tools(self) -> List[str]:
         """List names of all registered tools."""
         return list(self._tools.keys())
 
     def get_tool_definitions(self) -> List[Dict[str, Any]]:
-        """Return a list of tool definitions for LLM prompting."""
-        return [
-            {
-                "name": t.definition.name,
-                "description": t.definition.description,
-                "parameters": t.definition.parameters
-            }
-            for t in self._tools.values()
-        ]
+        """
+        Return a list of tool definitions for LLM prompting.
+        The list is memoized per registry version; treat it as read-only.
+        """
+        cached = self._definitions_cache
+        if cached is None or cached[0] != self._version:
+            definitions = [
+                {
+                    "name": t.definition.name,
+                    "description": t.definition.description,
+                    "parameters": t.definition.parameters
+                }
+                for t in self._tools.values()
+            ]
+            cached = self._definitions_cache = (self._version, definitions)
+        return cached[1]
+
+    def get_tool_definitions_json(self) -> str:
+        """Return the tool definitions as indented JSON, memoized per registry version."""
+        cached = self._definitions_json_cache
+        if cached is None or cached[0] != self._version:
+            cached = self._definitions_json_cache = (
+                self._version,
+                json.dumps(self.get_tool_definitions(), indent=2)
+            )
+        return cached[1]
+
+    def match_goal_to_direct_plan(self, goal: str) -> Optional[List[Dict[str, Any]]]:
+        """
+        Return a one-step plan for goals written as ``<tool_name>: <argument>``
+        when the named tool takes exactly one required string parameter, or
+        None when the goal needs the planner.
+        """
+        match = _DIRECT_GOAL_PATTERN.match(goal)
+        if not match:
+            return None
+        tool_name, argument = match.groups()
+        tool = self._tools.get(tool_name)
+        if tool is None:
+            return None
+        schema = tool.definition.parameters
+        required = schema.get("required", [])
+        if len(required) != 1:
+            return None
+        param = required[0]
+        if schema.get("properties", {}).get(param, {}).get("type") != "string":
+            return None
+        params = {param: argument}
+        try:
+            validate(instance=params, schema=schema)
+        except ValidationError:
+            return None
+        return [{
+            "id": "1",
+            "description": goal.strip(),
+            "dependencies": [],
+            "tool": tool_name,
+            "tool_params": params
+        }]
 
     def get_tool(self, name: str) -> Optional[BaseTool]:
         """Retrieve a tool by name."""
@@ -68,16 +140,16 @@ class ToolRegistry:
         try:
             validate(instance=kwargs, schema=tool.definition.parameters)
         except ValidationError as e:
-            logger.error(f"Validation error for tool {name}: {str(e)}")
+            logger.error("Validation error for tool %s: %s", name, e)
             raise ToolParameterValidationError(
                 f"Invalid parameters for tool '{name}': {e.message}"
             )
 
-        logger.info(f"Calling tool: {name}")
+        logger.info("Calling tool: %s", name)
         try:
             return await tool.execute(**kwargs)
         except Exception as e:
-            logger.error(f"Tool execution failed for {name}: {str(e)}")
+            logger.error("Tool execution failed for %s: %s", name, e)
             raise ToolExecutionError(
                 f"Tool '{name}' execution failed: {e}"
             ) from e
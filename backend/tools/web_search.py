@@ -110,7 +110,7 @@ class WebSearchTool(BaseTool):
 
         cache_key = f"web_search:{target_provider}:{max_results}:{query}"
         if self.cache:
-            cached_payload = self.cache.get_json(cache_key)
+            cached_payload = await self.cache.get_json(cache_key)
             if cached_payload is not None:
                 return json.dumps(cached_payload, indent=2)
 
@@ -127,7 +127,7 @@ class WebSearchTool(BaseTool):
             return "No results found for the query."
 
         if self.cache:
-            self.cache.set_json(cache_key, results)
+            await self.cache.set_json(cache_key, results)
 
         # 5. Privacy Redaction (Outbound)
         # Redact snippets in results to ensure no PII is returned to the agent context
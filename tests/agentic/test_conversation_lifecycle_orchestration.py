@@ -1,13 +1,14 @@
 import json
 import pytest
 
-from backend.core.controller import ECFController
+from backend.core.controller import ECFController, _archive_step_tool_names
 
 
 @pytest.mark.asyncio
 async def test_conversation_lifecycle_orchestration(tmp_path, monkeypatch):
     tasks_path = tmp_path / "tasks"
     monkeypatch.setenv("WORKING_STORAGE_PATH", str(tasks_path))
+    monkeypatch.setenv("BUDGET_DB_PATH", str(tmp_path / "budget.db"))
     monkeypatch.setenv("LLM_BASE_URL", "http://mock-llm/v1")
     monkeypatch.setenv("LLM_MODEL", "test-model")
 
@@ -56,6 +57,20 @@ async def test_conversation_lifecycle_orchestration(tmp_path, monkeypatch):
         assert "archive_path" in entry
         assert "completed_step_index" in entry
 
+    archive_reads = []
+    load_tool_names = controller._load_step_tool_names
+    monkeypatch.setattr(
+        controller,
+        "_load_step_tool_names",
+        lambda archive_file: archive_reads.append(archive_file) or load_tool_names(archive_file)
+    )
     replay_result = controller.replay_conversation_session(session_id)
     assert replay_result["status"] == "COMPLETED"
-    assert replay_result["validated_steps"] == len(session["step_order"])
\ No newline at end of file
+    assert replay_result["validated_steps"] == len(session["step_order"])
+    # Every step references the same archive, which is read once per replay
+    assert len(archive_reads) == 1
+
+    # A second replay of the unchanged archive is served from the parse cache
+    hits_before = _archive_step_tool_names.cache_info().hits
+    assert controller.replay_conversation_session(session_id)["status"] == "COMPLETED"
+    assert _archive_step_tool_names.cache_info().hits == hits_before + 1
\ No newline at end of file
@@ -12,6 +12,7 @@ from backend.memory.working_state import WorkingStateManager
 async def test_replay_inflight_artifact_after_crash(tmp_path, monkeypatch):
     tasks_path = tmp_path / "tasks"
     monkeypatch.setenv("WORKING_STORAGE_PATH", str(tasks_path))
+    monkeypatch.setenv("BUDGET_DB_PATH", str(tmp_path / "budget.db"))
     monkeypatch.setenv("LLM_BASE_URL", "http://mock-llm/v1")
     monkeypatch.setenv("LLM_MODEL", "test-model")
 
@@ -9,6 +9,7 @@ from backend.core.controller import ECFController
 @pytest.mark.asyncio
 async def test_deterministic_text_output_tool_e2e(tmp_path, monkeypatch):
     monkeypatch.setenv("WORKING_STORAGE_PATH", str(tmp_path / "tasks"))
+    monkeypatch.setenv("BUDGET_DB_PATH", str(tmp_path / "budget.db"))
     monkeypatch.setenv("LLM_BASE_URL", "http://mock-llm/v1")
     monkeypatch.setenv("LLM_MODEL", "test-model")
 
@@ -35,6 +35,7 @@ async def test_deterministic_voice_execution(tmp_path, monkeypatch):
     # Setup environment
     tasks_path = tmp_path / "tasks"
     monkeypatch.setenv("WORKING_STORAGE_PATH", str(tasks_path))
+    monkeypatch.setenv("BUDGET_DB_PATH", str(tmp_path / "budget.db"))
     monkeypatch.setenv("LLM_BASE_URL", "http://mock-llm/v1") 
     monkeypatch.setenv("LLM_MODEL", "test-model")
 
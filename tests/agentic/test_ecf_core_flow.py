@@ -28,6 +28,7 @@ class IntegrationTemplateTool(BaseTool):
 async def test_ecf_first_flight_e2e(tmp_path, monkeypatch, caplog):
     # Setup isolated environment for the test
     monkeypatch.setenv("WORKING_STORAGE_PATH", str(tmp_path / "tasks"))
+    monkeypatch.setenv("BUDGET_DB_PATH", str(tmp_path / "budget.db"))
     monkeypatch.setenv("LLM_BASE_URL", "http://mock-llm/v1")
     monkeypatch.setenv("LLM_MODEL", "test-model")
     
@@ -81,6 +82,7 @@ async def test_ecf_first_flight_e2e(tmp_path, monkeypatch, caplog):
 @pytest.mark.asyncio
 async def test_orchestrate_task_batch_terminates_on_failure_via_analytics(tmp_path, monkeypatch):
     monkeypatch.setenv("WORKING_STORAGE_PATH", str(tmp_path / "tasks"))
+    monkeypatch.setenv("BUDGET_DB_PATH", str(tmp_path / "budget.db"))
     monkeypatch.setenv("LLM_BASE_URL", "http://mock-llm/v1")
     monkeypatch.setenv("LLM_MODEL", "test-model")
 
@@ -128,6 +130,8 @@ async def test_orchestrate_task_batch_terminates_on_failure_via_analytics(tmp_pa
     assert result["stop_reason"] == "failure_detected"
     assert result["task_ids"]
     assert len(result["task_ids"]) == 3
+    # Per-goal controllers borrow the batch controller's client and leave it open
+    assert not controller.llm.client.is_closed()
 
     decisions = result["decisions"]
     assert [decision["action"] for decision in decisions] == ["continue", "continue", "stop"]
@@ -8,6 +8,7 @@ from backend.core.controller import ECFController
 async def test_research_lifecycle_orchestration(tmp_path, monkeypatch):
     tasks_path = tmp_path / "tasks"
     monkeypatch.setenv("WORKING_STORAGE_PATH", str(tasks_path))
+    monkeypatch.setenv("BUDGET_DB_PATH", str(tmp_path / "budget.db"))
     monkeypatch.setenv("LLM_BASE_URL", "http://mock-llm/v1")
     monkeypatch.setenv("LLM_MODEL", "test-model")
 
@@ -32,6 +32,7 @@ class IntegrationTemplateTool(BaseTool):
 async def test_resume_task_after_restart(tmp_path, monkeypatch):
     tasks_path = tmp_path / "tasks"
     monkeypatch.setenv("WORKING_STORAGE_PATH", str(tasks_path))
+    monkeypatch.setenv("BUDGET_DB_PATH", str(tmp_path / "budget.db"))
 
     state_manager = WorkingStateManager(tasks_path)
     task_id = state_manager.create_task({
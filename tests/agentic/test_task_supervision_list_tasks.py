@@ -10,6 +10,7 @@ from backend.memory.working_state import WorkingStateManager
 async def test_task_supervision_list_tasks(tmp_path, monkeypatch, capsys):
     tasks_path = tmp_path / "tasks"
     monkeypatch.setenv("WORKING_STORAGE_PATH", str(tasks_path))
+    monkeypatch.setenv("BUDGET_DB_PATH", str(tmp_path / "budget.db"))
 
     state_manager = WorkingStateManager(tasks_path)
     active_task_id = state_manager.create_task({
@@ -21,6 +21,7 @@ async def test_controller_workflow_engine_integration():
         # Setup controller with test settings
         settings = Settings(
             working_storage_path=temp_path,
+            budget_db_path=temp_path / "budget.db",
             llm_model="test-model",
             llm_api_key="test-key",
             llm_base_url="http://test-llm/v1"
@@ -65,6 +66,7 @@ async def test_controller_workflow_engine_deterministic_output():
         # Setup controller with test settings
         settings = Settings(
             working_storage_path=temp_path,
+            budget_db_path=temp_path / "budget.db",
             llm_model="test-model",
             llm_api_key="test-key",
             llm_base_url="http://test-llm/v1"
@@ -105,6 +107,7 @@ async def test_controller_workflow_engine_error_handling():
         # Setup controller with test settings
         settings = Settings(
             working_storage_path=temp_path,
+            budget_db_path=temp_path / "budget.db",
             llm_model="test-model",
             llm_api_key="test-key",
             llm_base_url="http://test-llm/v1"
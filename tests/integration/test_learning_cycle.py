@@ -38,6 +38,7 @@ async def test_full_learning_cycle(tmp_path, monkeypatch):
     storage_root = tmp_path / "tasks"
     archive_dir = storage_root / "archive"
     monkeypatch.setenv("WORKING_STORAGE_PATH", str(storage_root))
+    monkeypatch.setenv("BUDGET_DB_PATH", str(tmp_path / "budget.db"))
     monkeypatch.setenv("LLM_BASE_URL", "http://mock-llm/v1")
     monkeypatch.setenv("LLM_MODEL", "test-model")
     
@@ -91,12 +92,10 @@ async def test_full_learning_cycle(tmp_path, monkeypatch):
 
     # 3. MIX
     # Blend the newly curated data with the basal anchor set.
-    basal_path = Path("data/training/basal_set.json")
-    # Create a dummy basal set if it doesn't exist for some reason, though it should be in repo
-    if not basal_path.exists():
-         basal_path.parent.mkdir(parents=True, exist_ok=True)
-         with open(basal_path, "w") as f:
-             json.dump([{"instruction": "Basal", "input": "", "output": ""}] * 5, f)
+    basal_path = tmp_path / "training" / "basal_set.json"
+    basal_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(basal_path, "w") as f:
+        json.dump([{"instruction": "Basal", "input": "", "output": ""}] * 5, f)
 
     mixer = DatasetMixer(basal_path=basal_path)
     mixed_file = tmp_path / "mixed_payload.json"
@@ -0,0 +1,68 @@
+import importlib
+
+import pytest
+from fastapi.testclient import TestClient
+
+from backend.core.config import settings as settings_module
+
+
+@pytest.fixture
+def load_app(tmp_path, monkeypatch):
+    """Import backend.api.app fresh, since API_PREFIX is read at import time."""
+    monkeypatch.setenv("WORKING_STORAGE_PATH", str(tmp_path / "tasks"))
+    monkeypatch.setenv("BUDGET_DB_PATH", str(tmp_path / "budget.db"))
+    monkeypatch.setenv("LLM_BASE_URL", "http://mock-llm/v1")
+    monkeypatch.setenv("LLM_API_KEY", "test-key")
+
+    def _load(api_prefix=None):
+        if api_prefix is None:
+            monkeypatch.delenv("API_PREFIX", raising=False)
+        else:
+            monkeypatch.setenv("API_PREFIX", api_prefix)
+        settings_module.get_settings.cache_clear()
+        import backend.api.app as app_module
+        return importlib.reload(app_module).app
+
+    yield _load
+    settings_module.get_settings.cache_clear()
+
+
+@pytest.mark.parametrize("payload", [
+    {"goal": ""},
+    {"goal": "   \n"},
+    {"goal": "Write a report", "priority": "high"},
+])
+def test_create_task_rejects_blank_goal_and_unknown_fields(load_app, payload):
+    with TestClient(load_app()) as client:
+        response = client.post("/v1/tasks", json=payload)
+
+    assert response.status_code == 422
+    assert isinstance(response.json()["detail"], list)
+
+
+def test_routes_served_with_and_without_api_prefix(load_app):
+    with TestClient(load_app("api/")) as client:
+        assert client.get("/healthz").json() == {"status": "ok"}
+        assert client.get("/api/healthz").json() == {"status": "ok"}
+
+        paths = client.get("/openapi.json").json()["paths"]
+        assert {"/healthz", "/v1/tasks", "/api/healthz", "/api/v1/tasks"} <= set(paths)
+
+
+def test_openapi_without_prefix_lists_plain_paths_only(load_app):
+    with TestClient(load_app()) as client:
+        paths = client.get("/openapi.json").json()["paths"]
+
+    assert "/healthz" in paths
+    assert not any(path.startswith("/api/") for path in paths)
+
+
+def test_lifespan_shares_settings_and_llm_and_closes_it_on_shutdown(load_app):
+    app = load_app()
+    with TestClient(app):
+        llm = app.state.llm
+        assert app.state.settings is settings_module.get_settings()
+        assert llm.client.base_url.host == "mock-llm"
+        assert not llm.client.is_closed()
+
+    assert llm.client.is_closed()
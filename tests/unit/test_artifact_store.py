@@ -0,0 +1,25 @@
+from backend.memory.stores.artifact_store import ArtifactStore
+
+
+def test_reference_inlines_small_results_and_hashes_large_ones(tmp_path):
+    store = ArtifactStore(tmp_path / "artifacts", inline_limit=64)
+
+    assert store.reference(None) is None
+    assert store.reference("short") == "short"
+    assert store.reference({"a": 1}) == '{"a":1}'
+    assert not (tmp_path / "artifacts").exists()
+
+    large = "x" * 500
+    ref = store.reference(large)
+    assert ref.startswith("sha256:")
+    assert store.get(ref) == large.encode("utf-8")
+    # Identical payloads resolve to the same single blob
+    assert store.reference(large) == ref
+    assert len(list((tmp_path / "artifacts").rglob("*"))) == 2  # shard dir + blob
+
+
+def test_put_handles_non_json_values(tmp_path):
+    store = ArtifactStore(tmp_path)
+
+    digest = store.put({1, 2})
+    assert store.get(digest) == str({1, 2}).encode("utf-8")
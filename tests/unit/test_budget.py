@@ -79,3 +79,67 @@ def test_persistence(temp_settings):
     service2 = BudgetService(temp_settings)
     status = service2.get_status()
     assert status["llm"]["spend"] == 2.5
+
+def test_record_spend_many(temp_settings):
+    service = BudgetService(temp_settings)
+    service.record_spend_many([("llm", 1.0, "a"), ("llm", 2.0, None), ("storage", 0.5, "b")])
+
+    status = service.get_status()
+    assert status["llm"]["spend"] == 3.0
+    assert status["storage"]["spend"] == 0.5
+    service.close()
+
+def test_current_spend_includes_other_process_writes(temp_settings):
+    import subprocess
+    import sys
+
+    service = BudgetService(temp_settings)
+    service.record_spend("llm", 4.0)
+
+    # A separate process (e.g. another uvicorn worker or the CLI) on the same database
+    script = (
+        "from backend.core.budget import BudgetService\n"
+        "from backend.core.config.settings import Settings\n"
+        f"settings = Settings(budget_enforcement_level='block', budget_db_path={str(temp_settings.budget_db_path)!r})\n"
+        "BudgetService(settings).record_spend('llm', 5.0)\n"
+    )
+    subprocess.run([sys.executable, "-c", script], check=True, cwd=Path(__file__).resolve().parents[2])
+
+    assert service._get_current_spend("llm") == 9.0
+    assert service.check_availability("llm", 1.0) is True
+    assert service.check_availability("llm", 1.5) is False
+    assert service.get_status()["llm"]["spend"] == 9.0
+    service.close()
+
+def test_legacy_events_migrated_and_rollup_maintained_by_trigger(temp_settings):
+    import sqlite3
+    from datetime import datetime, UTC
+
+    # Pre-rollup database with an existing event
+    today = datetime.now(UTC).date().isoformat()
+    with sqlite3.connect(temp_settings.budget_db_path) as conn:
+        conn.execute(
+            "CREATE TABLE budget_events (id INTEGER PRIMARY KEY AUTOINCREMENT, "
+            "timestamp TEXT NOT NULL, category TEXT NOT NULL, cost REAL NOT NULL, item_id TEXT)"
+        )
+        conn.execute(
+            "INSERT INTO budget_events (timestamp, category, cost) VALUES (?, 'llm', 2.0)",
+            (f"{today}T00:00:01+00:00",)
+        )
+    conn.close()
+
+    service = BudgetService(temp_settings)
+    service.record_spend("llm", 1.5)
+    service.record_spend_many([("storage", 0.5, None)])
+
+    rows = dict(service._conn.execute(
+        "SELECT category, total FROM budget_daily WHERE date = ?", (today,)
+    ).fetchall())
+    assert rows == {"llm": 3.5, "storage": 0.5}
+
+    # Legacy ISO timestamps were migrated to epoch milliseconds
+    columns = {row[1] for row in service._conn.execute("PRAGMA table_info(budget_events)")}
+    assert "timestamp" not in columns and "timestamp_ms" in columns
+    migrated_ms = service._conn.execute("SELECT timestamp_ms FROM budget_events WHERE id = 1").fetchone()[0]
+    assert migrated_ms == int(datetime.fromisoformat(f"{today}T00:00:01+00:00").timestamp() * 1000)
+    service.close()
@@ -5,7 +5,9 @@ from backend.core.controller import ECFController
 from backend.main import _resolve_settings
 
 
-def test_cli_llm_overrides(monkeypatch):
+def test_cli_llm_overrides(tmp_path, monkeypatch):
+    monkeypatch.setenv("WORKING_STORAGE_PATH", str(tmp_path / "tasks"))
+    monkeypatch.setenv("BUDGET_DB_PATH", str(tmp_path / "budget.db"))
     monkeypatch.setenv("LLM_BASE_URL", "http://localhost:1/v1")
     monkeypatch.setenv("LLM_MODEL", "gpt-4o")
 
@@ -41,4 +43,31 @@ def test_cli_llm_overrides(monkeypatch):
     assert captured["timeout"] == 7.0
     assert captured["max_retries"] == 0
     assert controller.settings.llm_base_url == "http://localhost:11434/v1"
-    assert controller.settings.llm_model == "llama3.1:8b"
\ No newline at end of file
+    assert controller.settings.llm_model == "llama3.1:8b"
+
+def test_cli_run_uses_uvloop_when_installed():
+    import asyncio
+
+    from backend import main as cli
+
+    async def loop_name():
+        return type(asyncio.get_running_loop()).__module__
+
+    module = cli._run(loop_name())
+    if cli.uvloop is None:
+        assert module.startswith("asyncio")
+    else:
+        assert module.startswith("uvloop")
+
+
+def test_cli_loop_uses_eager_task_factory_when_available():
+    import asyncio
+
+    from backend import main as cli
+
+    loop = cli._new_event_loop()
+    try:
+        expected = getattr(asyncio, "eager_task_factory", None)
+        assert loop.get_task_factory() is expected
+    finally:
+        loop.close()
@@ -1,5 +1,6 @@
 import os
-from backend.core.config import load_settings, Settings
+import pytest
+from backend.core.config import get_settings, load_settings, reload_settings, Settings
 
 def test_default_settings():
     settings = load_settings()
@@ -13,3 +14,22 @@ def test_env_override(monkeypatch):
     settings = load_settings()
     assert settings.app_name == "TestApp"
     assert settings.debug is True
+
+def test_budget_limits_parsed_without_eval(monkeypatch):
+    monkeypatch.setenv("BUDGET_LIMITS", '{"search": 10, "llm": 2.5}')
+    assert load_settings().budget_limits == {"search": 10, "llm": 2.5}
+
+    monkeypatch.setenv("BUDGET_LIMITS", "{'search': 10}")
+    assert load_settings().budget_limits == {"search": 10}
+
+    monkeypatch.setenv("BUDGET_LIMITS", "__import__('os').getcwd()")
+    with pytest.raises(ValueError, match="BUDGET_LIMITS"):
+        load_settings()
+
+def test_get_settings_is_cached_until_reload(monkeypatch):
+    monkeypatch.setenv("APP_NAME", "CachedApp")
+    first = reload_settings()
+    monkeypatch.setenv("APP_NAME", "ChangedApp")
+    assert get_settings() is first
+    assert reload_settings().app_name == "ChangedApp"
+    get_settings.cache_clear()
@@ -30,3 +30,26 @@ async def test_execute_workflow_functional():
     result = await engine.execute_workflow(context)
     assert result["status"] == "failed"  # No nodes to execute
     assert "No starting nodes found in workflow" in result["error"]
+
+def test_workflow_types_to_dict_use_legacy_strings():
+    from backend.controller import WorkflowState, NodeStatus
+    node = WorkflowNode(id="n1", type=NodeType.TOOL_CALL, description="A node", dependencies=["n0"])
+    assert node.to_dict() == {
+        "id": "n1",
+        "type": "tool_call",
+        "description": "A node",
+        "dependencies": ["n0"],
+        "conditions": None,
+    }
+    state = WorkflowState(workflow_id="wf", status=NodeStatus.COMPLETED)
+    state_dict = state.to_dict()
+    assert state_dict["status"] == "completed"
+    assert state_dict["start_time"] == state.start_time.isoformat()
+
+def test_enum_wire_names_round_trip():
+    from backend.controller import NodeStatus
+    for member in NodeType:
+        assert NodeType.from_wire(member.to_wire()) is member
+    for member in NodeStatus:
+        assert NodeStatus.from_wire(member.to_wire()) is member
+    assert NodeType.LLM_WORKER.to_wire() == "llm_worker"
@@ -70,3 +70,28 @@ def test_validate_admission_failure(tmp_path):
     dataset = curator.curate_dataset()
     
     assert len(dataset) == 0
+
+def test_curate_dataset_reads_utf8_archives(tmp_path):
+    archive_dir = tmp_path / "archive_utf8"
+    archive_dir.mkdir()
+    task = {
+        "task_id": "task_utf8",
+        "goal": "Résumé naïve café — 東京",
+        "status": "COMPLETED",
+        "domain": "testing",
+        "constraints": [],
+        "completed_steps": [
+            {"index": 0, "description": "Say ¡hola!", "outcome": "SUCCESS", "tool_name": "text_output"}
+        ],
+        "next_steps": [],
+        "metadata": {}
+    }
+    # Archives are written as raw UTF-8, not ASCII-escaped
+    (archive_dir / "task_utf8_completed.json").write_bytes(
+        json.dumps(task, ensure_ascii=False).encode("utf-8")
+    )
+
+    dataset = EpisodeCurator(archive_path=archive_dir).curate_dataset()
+
+    planner_example = next(ex for ex in dataset if ex["metadata"]["agent"] == "planner")
+    assert json.loads(planner_example["input"])["goal"] == task["goal"]
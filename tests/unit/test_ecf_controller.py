@@ -26,6 +26,7 @@ def controller_settings(tmp_path):
     return Settings(
         app_name="TestApp",
         working_storage_path=tmp_path,
+        budget_db_path=tmp_path / "budget.db",
         llm_model="test-model",
         llm_base_url="http://mock-llm/v1"
     )
@@ -115,6 +116,7 @@ async def test_controller_execution_failure(controller_settings):
         
         task_id = await controller.run_task("Failing Task")
         assert controller.state == ControllerState.FAILED
+        assert controller.failed is True
         
         archive_dir = controller_settings.working_storage_path / "archive"
         archived = list(archive_dir.rglob("*failed_plan.json"))
@@ -280,10 +282,212 @@ async def test_controller_fails_when_max_executed_steps_exceeded(controller_sett
     assert task_id.startswith("task_")
 
 
+@pytest.mark.asyncio
+async def test_controller_multi_step_accounting_reads_task_file_once(controller_settings):
+    controller = ECFController(settings=controller_settings)
+    controller.registry.register_tool(StandardTestTool())
+
+    valid_plan = {
+        "tasks": [
+            {"id": "1", "description": "First step", "dependencies": [], "estimated_duration": "1m"},
+            {"id": "2", "description": "Second step", "dependencies": ["1"], "estimated_duration": "1m"}
+        ]
+    }
+    selection = {"tool": "standard_test_tool", "params": {"val": "multi"}, "rationale": "Matches request"}
+
+    original_load = controller.state_manager.load_task
+    loads = []
+
+    def counting_load(task_id):
+        loads.append(task_id)
+        return original_load(task_id)
+
+    async with respx.mock(base_url="http://mock-llm/v1") as respx_mock:
+        respx_mock.post("/chat/completions").mock(side_effect=[
+            Response(200, json={"choices": [{"message": {"content": json.dumps(valid_plan)}}]}),
+            *[Response(200, json={"choices": [{"message": {"content": json.dumps(selection)}}]})] * 4
+        ])
+        original_execute = controller._execute_with_workflow_engine
+
+        async def execute_counting(*args, **kwargs):
+            controller.state_manager.load_task = counting_load
+            try:
+                return await original_execute(*args, **kwargs)
+            finally:
+                controller.state_manager.load_task = original_load
+
+        controller._execute_with_workflow_engine = execute_counting
+        await controller.run_task("Multi step")
+
+    assert controller.state == ControllerState.COMPLETED
+    # A single read serves node construction and the accounting loop
+    assert len(loads) == 1
+
+    archived = list((controller_settings.working_storage_path / "archive").rglob("*.json"))
+    with open(archived[0], "r") as f:
+        archived_state = json.load(f)
+    assert [step["index"] for step in archived_state["completed_steps"]] == [0, 1]
+    assert [step["description"] for step in archived_state["completed_steps"]] == [
+        "First step",
+        "Second step"
+    ]
+    assert archived_state["next_steps"] == []
+
+
+@pytest.mark.asyncio
+async def test_controller_keeps_llm_client_open_until_aclose(controller_settings):
+    controller = ECFController(settings=controller_settings)
+
+    async with respx.mock(base_url="http://mock-llm/v1") as respx_mock:
+        respx_mock.post("/chat/completions").mock(return_value=Response(200, json={
+            "choices": [{"message": {"content": "Not JSON"}}]
+        }))
+        await controller.run_task("First")
+        await controller.run_task("Second")
+        assert respx_mock.calls.call_count == 2
+
+    assert not controller.llm.client.is_closed()
+    await controller.aclose()
+    assert controller.llm.client.is_closed()
+
+
+@pytest.mark.asyncio
+async def test_controller_leaves_shared_llm_open_on_aclose(controller_settings):
+    shared = ECFController(settings=controller_settings).llm
+    controller = ECFController(settings=controller_settings, llm=shared)
+    assert controller.llm is shared
+    assert controller.executor.llm is shared
+
+    await controller.aclose()
+    assert not shared.client.is_closed()
+    await shared.close()
+
+
+@pytest.mark.asyncio
+async def test_controller_plan_cache_skips_planner_for_repeated_goal(tmp_path):
+    settings = Settings(
+        working_storage_path=tmp_path,
+        budget_db_path=tmp_path / "budget.db",
+        llm_model="test-model",
+        llm_base_url="http://mock-llm/v1",
+        plan_cache_enabled=True
+    )
+    controller = ECFController(settings=settings)
+    controller.registry.register_tool(StandardTestTool())
+
+    valid_plan = {
+        "tasks": [
+            {"id": "1", "description": "Run standard_test_tool", "dependencies": [], "estimated_duration": "1m"}
+        ]
+    }
+    selection = {"tool": "standard_test_tool", "params": {"val": "cached"}, "rationale": "Matches request"}
+    plan_response = Response(200, json={"choices": [{"message": {"content": json.dumps(valid_plan)}}]})
+    selection_response = Response(200, json={"choices": [{"message": {"content": json.dumps(selection)}}]})
+
+    async with respx.mock(base_url="http://mock-llm/v1") as respx_mock:
+        respx_mock.post("/chat/completions").mock(side_effect=[
+            # Second run makes no calls: the template carries the selected
+            # tools and the execution-time selection is cached by the executor
+            plan_response, selection_response, selection_response
+        ])
+        await controller.run_task("Cached goal")
+        assert controller.state == ControllerState.COMPLETED
+        await controller.run_task("  cached   GOAL ")
+        assert controller.state == ControllerState.COMPLETED
+        assert respx_mock.calls.call_count == 3
+
+    cached_step = controller.plan_cache.lookup("cached goal")[0]
+    assert cached_step["description"] == "Run standard_test_tool"
+    assert cached_step["tool"] == "standard_test_tool"
+
+
+@pytest.mark.asyncio
+async def test_controller_direct_plan_skips_llm(controller_settings):
+    controller = ECFController(settings=controller_settings)
+
+    async with respx.mock(base_url="http://mock-llm/v1", assert_all_called=False) as respx_mock:
+        route = respx_mock.post("/chat/completions")
+        task_id = await controller.run_task("text_output: Hello, direct world")
+        assert route.call_count == 0
+
+    assert controller.state == ControllerState.COMPLETED
+    archived = next((controller_settings.working_storage_path / "archive").rglob(f"{task_id}_*.json"))
+    with open(archived, "r") as f:
+        archived_state = json.load(f)
+    step = archived_state["completed_steps"][0]
+    assert step["tool_name"] == "text_output"
+    assert step["tool_params"] == {"text": "Hello, direct world"}
+
+
+@pytest.mark.asyncio
+async def test_controller_trace_write_failure_keeps_task_outcome(controller_settings, monkeypatch):
+    controller = ECFController(settings=controller_settings)
+
+    def failing_write(pending):
+        raise sqlite3.OperationalError("disk I/O error")
+
+    monkeypatch.setattr(controller.trace_store, "_write", failing_write)
+    task_id = await controller.run_task("text_output: Hello, traced world")
+
+    assert task_id.startswith("task_")
+    assert controller.state == ControllerState.COMPLETED
+    assert isinstance(controller.trace_error, sqlite3.OperationalError)
+
+    monkeypatch.undo()
+    await controller.run_task("text_output: Hello again")
+    assert controller.trace_error is None
+
+
+@pytest.mark.asyncio
+async def test_workflow_nodes_link_dependencies_of_newly_selected_steps(controller_settings):
+    controller = ECFController(settings=controller_settings)
+    task_id = controller.state_manager.create_task({
+        "goal": "Resume unselected",
+        "next_steps": [
+            {"id": "1", "description": "First", "dependencies": []},
+            {"id": "2", "description": "Second", "dependencies": ["1"]}
+        ]
+    })
+    selection = {"tool": "text_output", "params": {"text": "x"}, "rationale": "Matches"}
+
+    async with respx.mock(base_url="http://mock-llm/v1") as respx_mock:
+        respx_mock.post("/chat/completions").mock(return_value=Response(
+            200, json={"choices": [{"message": {"content": json.dumps(selection)}}]}
+        ))
+        node_ids = await controller._convert_plan_to_workflow_nodes(task_id, "Resume unselected")
+
+    assert node_ids == ["step_0_text_output", "step_1_text_output"]
+    assert controller.workflow_engine.get_node("step_1_text_output").dependencies == ["step_0_text_output"]
+
+
+@pytest.mark.asyncio
+async def test_workflow_nodes_only_reselect_unregistered_stored_tools(controller_settings):
+    controller = ECFController(settings=controller_settings)
+    task_id = controller.state_manager.create_task({
+        "goal": "Stored tools",
+        "next_steps": [
+            {"id": "1", "description": "Kept", "tool": "text_output", "tool_params": {"text": "a"}},
+            {"id": "2", "description": "Stale", "tool": "removed_tool", "tool_params": {}}
+        ]
+    })
+    selection = {"tool": "text_output", "params": {"text": "b"}, "rationale": "Matches"}
+
+    async with respx.mock(base_url="http://mock-llm/v1") as respx_mock:
+        route = respx_mock.post("/chat/completions").mock(return_value=Response(
+            200, json={"choices": [{"message": {"content": json.dumps(selection)}}]}
+        ))
+        node_ids = await controller._convert_plan_to_workflow_nodes(task_id, "Stored tools")
+        assert route.call_count == 1
+
+    assert node_ids == ["step_0_text_output", "step_1_text_output"]
+    assert controller.workflow_engine.get_node("step_1_text_output").tool_params == {"text": "b"}
+
+
 def test_task_outcome_analytics_counts_failed_by_cause_deterministic(tmp_path):
     settings = Settings(
         app_name="TestApp",
         working_storage_path=tmp_path,
+        budget_db_path=tmp_path / "budget.db",
         llm_model="test-model",
         llm_base_url="http://mock-llm/v1"
     )
@@ -343,3 +547,57 @@ def test_task_outcome_analytics_counts_failed_by_cause_deterministic(tmp_path):
         "execution_step_failed": 1,
         "unknown": 1
     }
+
+    # Unchanged task files are parsed once and reused by later passes
+    controller.state_manager.load_task = MagicMock(side_effect=AssertionError("re-read"))
+    assert len(controller.list_task_summaries()) == 4
+    assert controller.summarize_task_outcomes() == summary
+
+
+def test_task_file_cache_rereads_same_mtime_rewrite_and_returns_copies(controller_settings):
+    import os
+
+    controller = ECFController(settings=controller_settings)
+    path = controller_settings.working_storage_path / "task_cached.json"
+    path.write_text(json.dumps({"status": "IN_PROGRESS", "completed_steps": []}))
+    mtime_ns = path.stat().st_mtime_ns
+    loads = {"count": 0}
+
+    def loader():
+        loads["count"] += 1
+        return json.loads(path.read_text())
+
+    first = controller._read_task_file(path, loader)
+    first["completed_steps"].append({"tool_name": "mutated"})
+    assert controller._read_task_file(path, loader)["completed_steps"] == []
+    assert loads["count"] == 1
+
+    # Rewritten within the same timestamp tick: only the size gives it away
+    path.write_text(json.dumps({"status": "COMPLETED", "completed_steps": []}))
+    os.utime(path, ns=(mtime_ns, mtime_ns))
+    assert controller._read_task_file(path, loader)["status"] == "COMPLETED"
+    assert loads["count"] == 2
+
+
+@pytest.mark.asyncio
+async def test_lifecycle_state_transitions_stay_on_event_loop_thread(controller_settings):
+    import threading
+
+    transitions = []
+
+    class RecordingController(ECFController):
+        @property
+        def state(self):
+            return self._state
+
+        @state.setter
+        def state(self, value):
+            transitions.append((value, threading.current_thread()))
+            self._state = value
+
+    controller = RecordingController(settings=controller_settings)
+    await controller.run_conversation_lifecycle([{"user": "hello", "assistant": "hi"}])
+
+    assert controller.state == ControllerState.COMPLETED
+    assert ControllerState.ARCHIVING in [state for state, _ in transitions]
+    assert {thread for _, thread in transitions} == {threading.current_thread()}
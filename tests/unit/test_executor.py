@@ -2,10 +2,11 @@ import pytest
 import json
 import respx
 from httpx import Response
-from backend.agents.executor.executor import ExecutorAgent
+from backend.agents.executor.executor import ExecutorAgent, EXECUTOR_SYSTEM_PROMPT
 from backend.tools.registry.registry import ToolRegistry
 from backend.tools.base import BaseTool, ToolDefinition
 from backend.core.llm.provider import OpenAIProvider
+from backend.core.llm.cache import LLMResponseCache
 
 class MockTool(BaseTool):
     @property
@@ -100,3 +101,138 @@ async def test_executor_invalid_parameters(llm_provider, registry):
         assert "Invalid parameters" in result["error"]
         
     await llm_provider.close()
+
+
+@pytest.mark.asyncio
+async def test_executor_caches_system_prompt_until_registry_changes(llm_provider, registry):
+    agent = ExecutorAgent(llm_client=llm_provider, registry=registry)
+
+    first = agent.get_system_prompt()
+    assert agent.get_system_prompt() is first
+    assert first == EXECUTOR_SYSTEM_PROMPT.format(
+        tool_definitions=json.dumps(registry.get_tool_definitions(), indent=2)
+    )
+    assert '"name": "test_tool"' in first
+
+    class OtherTool(MockTool):
+        @property
+        def definition(self):
+            return ToolDefinition(name="other_tool", description="Another tool", parameters={"type": "object"})
+
+    registry.register_tool(OtherTool())
+    rebuilt = agent.get_system_prompt()
+    assert rebuilt is not first
+    assert '"name": "other_tool"' in rebuilt
+
+    mock_selection = {"tool": "test_tool", "params": {"input": "x"}, "rationale": "ok"}
+    async with respx.mock(base_url="http://mock-llm/v1") as respx_mock:
+        route = respx_mock.post("/chat/completions").mock(return_value=Response(200, json={
+            "choices": [{"message": {"content": json.dumps(mock_selection)}}]
+        }))
+
+        await agent.execute_step("Run the test tool")
+
+        messages = json.loads(route.calls.last.request.content)["messages"]
+        assert messages[0] == {"role": "system", "content": rebuilt}
+        assert messages[1]["role"] == "user"
+        assert messages[1]["content"].startswith("Task Step: Run the test tool")
+
+    await llm_provider.close()
+
+
+@pytest.mark.asyncio
+async def test_executor_execute_steps_batch_preserves_order(llm_provider, registry):
+    agent = ExecutorAgent(llm_client=llm_provider, registry=registry)
+
+    def respond(request):
+        content = json.loads(request.content)["messages"][-1]["content"]
+        value = "first" if "Step one" in content else "second"
+        selection = {"tool": "test_tool", "params": {"input": value}, "rationale": "ok"}
+        return Response(200, json={"choices": [{"message": {"content": json.dumps(selection)}}]})
+
+    async with respx.mock(base_url="http://mock-llm/v1") as respx_mock:
+        respx_mock.post("/chat/completions").mock(side_effect=respond)
+
+        results = await agent.execute_steps_batch([("Step one", None), ("Step two", {"k": "v"})])
+
+    assert [r["result"] for r in results] == ["Executed with first", "Executed with second"]
+    await llm_provider.close()
+
+
+@pytest.mark.asyncio
+async def test_executor_reuses_selection_until_registry_changes(llm_provider, registry):
+    agent = ExecutorAgent(llm_client=llm_provider, registry=registry)
+    mock_selection = {"tool": "test_tool", "params": {"input": "cached"}, "rationale": "ok"}
+
+    async with respx.mock(base_url="http://mock-llm/v1") as respx_mock:
+        route = respx_mock.post("/chat/completions").mock(return_value=Response(200, json={
+            "choices": [{"message": {"content": json.dumps(mock_selection)}}]
+        }))
+
+        first = await agent.execute_step("Run cached step", {"k": "v"})
+        second = await agent.execute_step("Run cached step", {"k": "v"})
+        assert first == second
+        assert route.call_count == 1
+
+        # Batch selection only sends the steps that miss the cache
+        await agent.select_tools_batch([("Run cached step", {"k": "v"}), ("Other step", None)])
+        assert route.call_count == 2
+
+        registry.unregister_tool("test_tool")
+        registry.register_tool(MockTool())
+        await agent.execute_step("Run cached step", {"k": "v"})
+        assert route.call_count == 3
+
+    await llm_provider.close()
+
+
+@pytest.mark.asyncio
+async def test_executor_response_cache_survives_new_agent(llm_provider, registry, tmp_path):
+    cache = LLMResponseCache(str(tmp_path / "llm_cache.db"), ttl_seconds=60)
+    mock_selection = {"tool": "test_tool", "params": {"input": "disk"}, "rationale": "ok"}
+
+    async with respx.mock(base_url="http://mock-llm/v1") as respx_mock:
+        route = respx_mock.post("/chat/completions").mock(return_value=Response(200, json={
+            "choices": [{"message": {"content": json.dumps(mock_selection)}}]
+        }))
+
+        first_agent = ExecutorAgent(llm_client=llm_provider, registry=registry, response_cache=cache)
+        assert await first_agent.select_tool("Persisted step") == mock_selection
+
+        second_agent = ExecutorAgent(llm_client=llm_provider, registry=registry, response_cache=cache)
+        assert await second_agent.select_tool("Persisted step") == mock_selection
+        assert route.call_count == 1
+
+    expired = LLMResponseCache(str(tmp_path / "llm_cache.db"), ttl_seconds=-1)
+    assert expired.get(first_agent._response_cache_key(first_agent.build_user_prompt("Persisted step"))) is None
+    await llm_provider.close()
+
+
+@pytest.mark.asyncio
+async def test_executor_batch_reads_disk_cache_in_one_lookup(llm_provider, registry, tmp_path):
+    cache = LLMResponseCache(str(tmp_path / "llm_cache.db"), ttl_seconds=60)
+    cached_selection = {"tool": "test_tool", "params": {"input": "disk"}, "rationale": "ok"}
+    fresh_selection = {"tool": "test_tool", "params": {"input": "llm"}, "rationale": "ok"}
+    seeder = ExecutorAgent(llm_client=llm_provider, registry=registry, response_cache=cache)
+    cache.set_many([
+        (seeder._response_cache_key(seeder.build_user_prompt(step)), json.dumps(cached_selection))
+        for step in ("Step A", "Step B")
+    ])
+
+    lookups = []
+    get_many = cache.get_many
+    cache.get_many = lambda keys: lookups.append(list(keys)) or get_many(keys)
+
+    agent = ExecutorAgent(llm_client=llm_provider, registry=registry, response_cache=cache)
+    async with respx.mock(base_url="http://mock-llm/v1") as respx_mock:
+        route = respx_mock.post("/chat/completions").mock(return_value=Response(200, json={
+            "choices": [{"message": {"content": json.dumps(fresh_selection)}}]
+        }))
+        selections = await agent.select_tools_batch([("Step A", None), ("Step C", None), ("Step B", None)])
+        assert route.call_count == 1
+
+    assert selections == [cached_selection, fresh_selection, cached_selection]
+    assert len(lookups) == 1 and len(lookups[0]) == 3
+    stored = cache.get(agent._response_cache_key(agent.build_user_prompt("Step C")))
+    assert json.loads(stored) == fresh_selection
+    await llm_provider.close()
@@ -0,0 +1,21 @@
+import json
+
+import pytest
+
+from backend.core.llm.parsing import extract_json_body, parse_json_response
+
+
+def test_extract_json_body_handles_fences():
+    assert extract_json_body('```json\n{"a": 1}\n```') == '{"a": 1}'
+    assert extract_json_body('Here you go:\n```\n{"a": 2}\n```\nThanks') == '{"a": 2}'
+    assert extract_json_body('```json\n{"a": 3}') == '{"a": 3}'
+    assert extract_json_body('{"a": 4}') == '{"a": 4}'
+
+
+def test_parse_json_response_returns_dict():
+    assert parse_json_response('```json\n{"tool": "x", "params": {}}\n```') == {"tool": "x", "params": {}}
+
+
+def test_parse_json_response_raises_json_decode_error():
+    with pytest.raises(json.JSONDecodeError):
+        parse_json_response("not json")
@@ -0,0 +1,40 @@
+import sqlite3
+import time
+
+from backend.core.llm.cache import LLMResponseCache, response_cache_key
+
+
+def test_response_cache_reuses_one_connection_until_closed(tmp_path):
+    cache = LLMResponseCache(str(tmp_path / "llm_cache.db"), ttl_seconds=60)
+
+    cache.set("k1", "v1")
+    conn = cache._conn
+    assert cache.get("k1") == "v1"
+    assert cache._conn is conn
+
+    cache.close()
+    assert cache._conn is None
+    assert cache.get("k1") == "v1"
+
+
+def test_response_cache_get_many_returns_only_unexpired_hits(tmp_path):
+    cache = LLMResponseCache(str(tmp_path / "llm_cache.db"), ttl_seconds=60)
+    cache.set_many([("a", "1"), ("b", "2")])
+
+    assert cache.get_many(["a", "missing", "b", "a"]) == {"a": "1", "b": "2"}
+    assert cache.get_many([]) == {}
+    assert response_cache_key("x", "y") != response_cache_key("xy")
+
+
+def test_response_cache_set_deletes_expired_rows(tmp_path):
+    db_path = tmp_path / "llm_cache.db"
+    cache = LLMResponseCache(str(db_path), ttl_seconds=60)
+    cache.set("stale", "old")
+    with sqlite3.connect(db_path) as conn:
+        conn.execute("UPDATE llm_cache SET created_at = ?", (time.time() - 120,))
+    assert cache.get("stale") is None
+
+    cache.set("fresh", "new")
+    with sqlite3.connect(db_path) as conn:
+        keys = [row[0] for row in conn.execute("SELECT key FROM llm_cache")]
+    assert keys == ["fresh"]
@@ -1,7 +1,7 @@
 import pytest
 
 from backend.controller.engine.engine import WorkflowEngine
-from backend.controller.engine.types import TaskContext
+from backend.controller.engine.types import NodeType, TaskContext
 from backend.controller.nodes.memory_op import MemoryWriteNode
 from backend.memory.stores.in_memory import InMemoryStore
 
@@ -40,3 +40,15 @@ async def test_memory_write_node_execution():
     assert saved.id == fixed_id
     assert saved.content == "Test execution content"
     assert saved.metadata == {"source": "unit_test"}
+
+
+def test_builtin_nodes_are_slotted():
+    from backend.controller.nodes.callable import CallableNode
+    from backend.controller.nodes.memory_op import MemoryReadNode
+
+    callable_node = CallableNode("c", NodeType.TOOL_CALL, "callable", lambda ctx, res: {})
+    read_node = MemoryReadNode("r", "read")
+    for node in (callable_node, read_node):
+        assert not hasattr(node, "__dict__")
+    callable_node.dependencies = ["r"]
+    assert callable_node.dependencies == ["r"]
@@ -0,0 +1,40 @@
+import sqlite3
+
+from backend.memory.plan_cache import PlanCache, normalize_goal
+
+
+def test_plan_cache_roundtrip_normalizes_goal(tmp_path):
+    cache = PlanCache(str(tmp_path / "plan_cache.db"))
+    assert cache.lookup("Write a report") is None
+
+    steps = [
+        {"id": "1", "description": "Draft", "dependencies": [], "tool": "text_output", "tool_params": {"text": "x"}}
+    ]
+    cache.put("Write a report", steps)
+
+    assert normalize_goal("  write   A REPORT\n") == "write a report"
+    assert cache.lookup("  write   A REPORT\n") == steps
+    assert cache.lookup("Write a report", domain="research") is None
+    assert cache.lookup("Write a report", constraints=["short"]) is None
+
+
+def test_plan_cache_put_replaces_existing_template(tmp_path):
+    cache = PlanCache(str(tmp_path / "plan_cache.db"))
+    cache.put("goal", [{"id": "1", "description": "old"}])
+    cache.put("goal", [{"id": "1", "description": "new"}])
+
+    assert cache.lookup("goal") == [{"id": "1", "description": "new"}]
+
+
+def test_plan_cache_evicts_templates_that_mostly_fail(tmp_path):
+    db_path = tmp_path / "plan_cache.db"
+    cache = PlanCache(str(db_path))
+    cache.put("goal", [{"id": "1", "description": "step"}], constraints=["b", "a"])
+
+    cache.record_failure("goal", constraints=["a", "b"])
+    assert cache.lookup("goal", constraints=["a", "b"]) is not None
+
+    cache.record_failure("goal", constraints=["a", "b"])
+    assert cache.lookup("goal", constraints=["a", "b"]) is None
+    with sqlite3.connect(db_path) as conn:
+        assert conn.execute("SELECT COUNT(*) FROM plan_cache").fetchone()[0] == 0
@@ -119,3 +119,22 @@ async def test_planner_markdown_parsing(llm_provider, state_manager):
         assert len(state["next_steps"]) == 1
         
     await llm_provider.close()
+
+
+def test_planner_validate_plan_accepts_long_chains(llm_provider, state_manager):
+    planner = PlannerAgent(llm_client=llm_provider, state_manager=state_manager)
+    # Deeper than the default recursion limit; the iterative sort must cope.
+    tasks = [{"id": "0", "description": "Task 0", "dependencies": []}]
+    tasks += [
+        {"id": str(i), "description": f"Task {i}", "dependencies": [str(i - 1)]}
+        for i in range(1, 5000)
+    ]
+    plan = {"tasks": list(reversed(tasks))}
+
+    planner._validate_plan(plan)
+    assert list(plan) == ["tasks"]
+
+    # Closing the chain into a loop must still be caught
+    plan["tasks"][-1]["dependencies"] = ["4999"]
+    with pytest.raises(InvalidPlanError, match="circular"):
+        planner._validate_plan(plan)
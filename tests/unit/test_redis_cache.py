@@ -1,36 +1,91 @@
-from typing import Optional
+from typing import Any, Optional
+
+import pytest
 
 from backend.core.cache.redis_cache import RedisCache
 
 
+class FakePipeline:
+    def __init__(self, client: "FakeRedisClient") -> None:
+        self.client = client
+        self.ops: list[tuple[str, tuple[Any, ...]]] = []
+
+    async def __aenter__(self) -> "FakePipeline":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        self.ops.clear()
+
+    def get(self, key: str) -> None:
+        self.ops.append(("get", (key,)))
+
+    def setex(self, key: str, ttl_seconds: int, value: bytes) -> None:
+        self.ops.append(("setex", (key, ttl_seconds, value)))
+
+    async def execute(self) -> list[Any]:
+        self.client.pipeline_executes += 1
+        results = []
+        for op, args in self.ops:
+            if op == "get":
+                results.append(self.client.storage.get(args[0]))
+            else:
+                key, _, value = args
+                self.client.storage[key] = value
+                results.append(True)
+        return results
+
+
 class FakeRedisClient:
     def __init__(self) -> None:
-        self.storage: dict[str, str] = {}
-        self.last_setex: Optional[tuple[str, int, str]] = None
+        self.storage: dict[str, bytes] = {}
+        self.last_setex: Optional[tuple[str, int, bytes]] = None
         self.get_calls = 0
+        self.pipeline_executes = 0
 
-    def get(self, key: str) -> Optional[str]:
+    async def get(self, key: str) -> Optional[bytes]:
         self.get_calls += 1
         return self.storage.get(key)
 
-    def setex(self, key: str, ttl_seconds: int, value: str) -> None:
+    async def setex(self, key: str, ttl_seconds: int, value: bytes) -> None:
         self.last_setex = (key, ttl_seconds, value)
         self.storage[key] = value
 
+    def pipeline(self, transaction: bool = True) -> FakePipeline:
+        assert transaction is False
+        return FakePipeline(self)
 
-def test_redis_cache_roundtrip_json() -> None:
+
+@pytest.mark.asyncio
+async def test_redis_cache_roundtrip_json() -> None:
     fake_client = FakeRedisClient()
     cache = RedisCache("redis://example:6379/0", client=fake_client)
 
     payload = {"title": "Cached Result", "url": "http://cached"}
-    cache.set_json("web_search:duckduckgo:5:test", payload, ttl_seconds=120)
+    await cache.set_json("web_search:duckduckgo:5:test", payload, ttl_seconds=120)
 
     assert fake_client.last_setex is not None
     key, ttl, stored_value = fake_client.last_setex
     assert key == "web_search:duckduckgo:5:test"
     assert ttl == 120
-    assert stored_value == '{"title": "Cached Result", "url": "http://cached"}'
+    assert stored_value == b'{"title":"Cached Result","url":"http://cached"}'
 
-    loaded = cache.get_json("web_search:duckduckgo:5:test")
+    loaded = await cache.get_json("web_search:duckduckgo:5:test")
     assert loaded == payload
-    assert fake_client.get_calls == 1
\ No newline at end of file
+    assert fake_client.get_calls == 1
+
+
+@pytest.mark.asyncio
+async def test_redis_cache_batch_ops_use_single_pipeline() -> None:
+    fake_client = FakeRedisClient()
+    cache = RedisCache("redis://example:6379/0", client=fake_client)
+
+    await cache.mset_json({"a": {"n": 1}, "b": [1, 2]}, ttl_seconds=60)
+    assert fake_client.pipeline_executes == 1
+
+    values = await cache.mget_json(["a", "missing", "b"])
+    assert values == [{"n": 1}, None, [1, 2]]
+    assert fake_client.pipeline_executes == 2
+    assert fake_client.get_calls == 0
+
+    assert await cache.mget_json([]) == []
+    assert fake_client.pipeline_executes == 2
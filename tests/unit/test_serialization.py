@@ -0,0 +1,44 @@
+from backend.core.serialization import dumps, dumps_bytes, loads
+
+
+def test_dumps_is_compact_and_handles_non_str_keys():
+    assert dumps({"a": [1, 2], "b": None}) == '{"a":[1,2],"b":null}'
+    assert dumps({1: "x"}) == '{"1":"x"}'
+
+
+def test_loads_accepts_str_and_bytes():
+    assert loads('{"task_id": "t1"}') == {"task_id": "t1"}
+    assert loads(b'{"task_id": "t1"}') == {"task_id": "t1"}
+
+
+def test_dumps_bytes_emits_utf8_and_iso_datetimes():
+    from datetime import datetime
+
+    assert dumps_bytes({"a": 1}) == b'{"a":1}'
+    payload = loads(dumps_bytes({"start_time": datetime(2026, 1, 2, 3, 4, 5)}))
+    assert payload["start_time"].startswith("2026-01-02T03:04:05")
+
+
+def test_dumps_bytes_indent_matches_stdlib_layout():
+    import json
+
+    payload = {"task_id": "t1", "next_steps": [{"description": "a"}], "current_step": None}
+    assert loads(dumps_bytes(payload, indent=True)) == payload
+    assert dumps_bytes(payload, indent=True).decode() == json.dumps(payload, indent=2)
+
+
+def test_stdlib_fallback_matches_orjson_output(monkeypatch):
+    from datetime import date, datetime, timezone
+
+    from backend.core import serialization
+
+    payload = {
+        "naive": datetime(2026, 1, 2, 3, 4, 5),
+        "aware": datetime(2026, 1, 2, 3, 4, 5, 123456, tzinfo=timezone.utc),
+        "day": date(2026, 1, 2),
+        "text": "café",
+    }
+    accelerated = (serialization.dumps(payload), serialization.dumps_bytes(payload))
+    monkeypatch.setattr(serialization, "orjson", None)
+    assert (serialization.dumps(payload), serialization.dumps_bytes(payload)) == accelerated
+    assert loads(accelerated[0])["naive"] == "2026-01-02T03:04:05+00:00"
@@ -71,3 +71,40 @@ async def test_tool_registry_execution_error():
 
     with pytest.raises(ToolExecutionError, match="Tool 'echo' execution failed: boom"):
         await registry.call_tool("echo", message="hi")
+
+
+def test_tool_definitions_memoized_per_version():
+    registry = ToolRegistry()
+    registry.register_tool(MockEchoTool())
+
+    definitions = registry.get_tool_definitions()
+    definitions_json = registry.get_tool_definitions_json()
+    assert registry.get_tool_definitions() is definitions
+    assert registry.get_tool_definitions_json() is definitions_json
+    assert '"name": "echo"' in definitions_json
+
+    version = registry.version
+    registry.unregister_tool("echo")
+    assert registry.version == version + 1
+    assert registry.get_tool_definitions() == []
+    assert registry.get_tool_definitions_json() == "[]"
+
+    with pytest.raises(ToolNotFoundError):
+        registry.unregister_tool("echo")
+
+
+def test_match_goal_to_direct_plan():
+    registry = ToolRegistry()
+    registry.register_tool(MockEchoTool())
+
+    plan = registry.match_goal_to_direct_plan("echo:  hello there ")
+    assert plan == [{
+        "id": "1",
+        "description": "echo:  hello there",
+        "dependencies": [],
+        "tool": "echo",
+        "tool_params": {"message": "hello there"}
+    }]
+    assert registry.match_goal_to_direct_plan("Echo the greeting") is None
+    assert registry.match_goal_to_direct_plan("unknown: hello") is None
+    assert registry.match_goal_to_direct_plan("echo:   ") is None
@@ -0,0 +1,146 @@
+import sqlite3
+
+import pytest
+
+from backend.memory.stores.trace_store import (
+    StorageWorker,
+    TraceBatch,
+    TraceStore,
+    shared_storage_worker,
+)
+
+
+def _counts(db_path):
+    with sqlite3.connect(db_path) as conn:
+        return tuple(
+            conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+            for table in ("trace_decisions", "trace_tool_calls", "trace_validations")
+        )
+
+
+def test_batch_commits_on_exit(tmp_path):
+    db_path = tmp_path / "traces.db"
+    store = TraceStore(str(db_path))
+
+    with store.batch() as traces:
+        traces.append_decision("t1", "plan_accepted", {"goal": "g"})
+        traces.append_tool_call("t1", 0, "tool", {"a": 1}, "SUCCESS", "ok", None)
+        traces.append_tool_call("t1", 1, "tool", {}, "SUCCESS", None, None)
+        traces.append_validation("t1", "plan_valid", "PASS", {"goal": "g"})
+        assert len(traces) == 4
+        assert _counts(db_path) == (0, 0, 0)
+
+    assert _counts(db_path) == (1, 2, 1)
+
+
+def test_batch_flushes_when_block_raises(tmp_path):
+    db_path = tmp_path / "traces.db"
+    store = TraceStore(str(db_path))
+
+    with pytest.raises(RuntimeError):
+        with store.batch() as traces:
+            traces.append_tool_call("t1", 0, "tool", {}, "SUCCESS", None, None)
+            raise RuntimeError("step failed")
+
+    assert _counts(db_path) == (0, 1, 0)
+
+
+def test_connections_use_wal_and_configured_synchronous(tmp_path):
+    store = TraceStore(str(tmp_path / "traces.db"), synchronous="full")
+    conn = store._connect()
+    try:
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        assert conn.execute("PRAGMA synchronous").fetchone()[0] == 2  # FULL
+        assert conn.execute("PRAGMA busy_timeout").fetchone()[0] == 5000
+        assert conn.execute("PRAGMA cache_size").fetchone()[0] == -20000
+    finally:
+        conn.close()
+
+    with pytest.raises(ValueError, match="synchronous"):
+        TraceStore(str(tmp_path / "other.db"), synchronous="fast; DROP TABLE x")
+
+
+def test_storage_worker_writes_off_thread_and_flushes(tmp_path):
+    db_path = tmp_path / "traces.db"
+    store = TraceStore(str(db_path))
+    worker = StorageWorker(store)
+
+    assert worker.flush(timeout=1) is True  # nothing started yet
+
+    for step in range(3):
+        with worker.batch() as traces:
+            traces.append_tool_call("t1", step, "tool", {}, "SUCCESS", None, None)
+    with worker.batch() as traces:
+        traces.append_decision("t1", "plan_accepted", {"goal": "g"})
+
+    assert worker.flush(timeout=5) is True
+    assert _counts(db_path) == (1, 3, 0)
+
+    with worker.batch() as traces:
+        traces.append_validation("t1", "plan_valid", "PASS", {})
+    worker.close()
+    assert _counts(db_path) == (1, 3, 1)
+    assert worker._thread is None
+
+
+def test_storage_worker_isolates_failed_batch_and_reports_it(tmp_path):
+    db_path = tmp_path / "traces.db"
+    store = TraceStore(str(db_path))
+    worker = StorageWorker(store)
+
+    good, bad, other = TraceBatch(), TraceBatch(), TraceBatch()
+    good.append_decision("t1", "plan_accepted", {})
+    bad.append_decision("t2", None, {})  # violates NOT NULL
+    other.append_validation("t3", "plan_valid", "PASS", {})
+    # Queue all three before the thread starts so they share one drain
+    for trace_batch in (good, bad, other):
+        worker._queue.put((trace_batch.pending, None))
+    worker._ensure_started()
+
+    with pytest.raises(sqlite3.IntegrityError):
+        worker.flush(timeout=5)
+    assert _counts(db_path) == (1, 0, 1)
+    assert worker.flush(timeout=5) is True
+    worker.close()
+
+
+def test_storage_worker_stops_when_idle_and_restarts_on_submit(tmp_path):
+    db_path = tmp_path / "traces.db"
+    worker = StorageWorker(TraceStore(str(db_path)), idle_timeout=0.05)
+
+    with worker.batch() as traces:
+        traces.append_decision("t1", "plan_accepted", {})
+    thread = worker._thread
+    assert worker.flush(timeout=5) is True
+    thread.join(timeout=5)
+    assert not thread.is_alive()
+    assert worker._thread is None
+    assert worker.store._conn is None
+
+    with worker.batch() as traces:
+        traces.append_decision("t1", "plan_rejected", {})
+    assert worker.flush(timeout=5) is True
+    assert _counts(db_path) == (2, 0, 0)
+    worker.close()
+
+
+def test_shared_storage_worker_is_one_per_database(tmp_path):
+    first = shared_storage_worker(str(tmp_path / "a" / "traces.db"))
+    assert shared_storage_worker(str(tmp_path / "a" / "traces.db")) is first
+    assert shared_storage_worker(str(tmp_path / "b" / "traces.db")) is not first
+
+
+def test_writes_reuse_one_connection_until_closed(tmp_path):
+    db_path = tmp_path / "traces.db"
+    store = TraceStore(str(db_path))
+
+    store.append_decision("t1", "plan_accepted", {})
+    conn = store._conn
+    store.append_validation("t1", "plan_valid", "PASS", {})
+    assert store._conn is conn
+
+    store.close()
+    assert store._conn is None
+    store.append_decision("t1", "plan_rejected", {})
+    assert _counts(db_path) == (2, 0, 1)
+    store.close()
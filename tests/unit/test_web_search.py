@@ -5,14 +5,15 @@ from backend.tools.web_search import WebSearchTool
 from backend.core.config.settings import Settings
 
 @pytest.fixture
-def mock_settings():
+def mock_settings(tmp_path):
     return Settings(
         privacy_secret_key="test-secret",
         privacy_salt="test-salt",
         privacy_redaction_level="partial",
         budget_enforcement_level="none",
         search_bing_api_key="fake-bing",
-        search_tavily_api_key="fake-tavily"
+        search_tavily_api_key="fake-tavily",
+        budget_db_path=tmp_path / "budget.db"
     )
 
 @pytest.mark.asyncio
@@ -90,12 +91,13 @@ async def test_web_search_uses_cache(mock_settings):
         budget_enforcement_level=mock_settings.budget_enforcement_level,
         search_bing_api_key=mock_settings.search_bing_api_key,
         search_tavily_api_key=mock_settings.search_tavily_api_key,
+        budget_db_path=mock_settings.budget_db_path,
         redis_url="redis://localhost:6379/0"
     )
 
     with patch('backend.tools.web_search.RedisCache') as mock_cache_class:
         mock_cache = mock_cache_class.return_value
-        mock_cache.get_json.return_value = cached_results
+        mock_cache.get_json = AsyncMock(return_value=cached_results)
 
         with patch('backend.tools.web_search.load_settings', return_value=cache_settings):
             tool = WebSearchTool()
@@ -107,5 +109,5 @@ async def test_web_search_uses_cache(mock_settings):
                 result = await tool.execute(query="cache test", provider="duckduckgo")
 
                 assert json.loads(result) == cached_results
-                mock_cache.get_json.assert_called_once()
+                mock_cache.get_json.assert_awaited_once()
                 mock_ddg.search.assert_not_called()
@@ -6,7 +6,7 @@ import pytest
 import asyncio
 from unittest.mock import Mock, AsyncMock
 from backend.controller.engine.engine import WorkflowEngine
-from backend.controller.engine.types import WorkflowNode, WorkflowState, TaskContext, NodeStatus, NodeType
+from backend.controller.engine.types import WorkflowNode, WorkflowState, TaskContext, TaskContextPool, NodeStatus, NodeType
 from backend.controller.nodes.base import BaseNode
 
 
@@ -239,3 +239,178 @@ class TestWorkflowEngine:
         result = await engine.execute_workflow(context)
         assert result["status"] == "failed"
         assert "No starting nodes found in workflow" in result["error"]
+
+    @pytest.mark.asyncio
+    async def test_execute_workflow_fails_on_unschedulable_nodes(self):
+        """Test that nodes with unknown dependencies fail the workflow instead of being skipped."""
+        engine = WorkflowEngine()
+        engine.add_node(MockNode("a", NodeType.ROUTER, "Node A"))
+        node_b = MockNode("b", NodeType.ROUTER, "Node B")
+        node_b.dependencies = ["missing"]
+        engine.add_node(node_b)
+
+        context = TaskContext(
+            memory_store=Mock(),
+            tool_registry=Mock(),
+            data={}
+        )
+
+        result = await engine.execute_workflow(context)
+        assert result["status"] == "failed"
+        assert "can never run" in result["error"]
+        assert result["error"].endswith(": b")
+        assert engine.state.completed_nodes == []
+
+    @pytest.mark.asyncio
+    async def test_execute_workflow_runs_independent_nodes_concurrently(self):
+        """Test that sibling nodes in the same wave overlap instead of serializing."""
+        engine = WorkflowEngine()
+        both_started = asyncio.Event()
+        started = []
+
+        class RendezvousNode(MockNode):
+            async def execute(self, context: TaskContext, results: dict) -> dict:
+                started.append(self.id)
+                if len(started) == 2:
+                    both_started.set()
+                await asyncio.wait_for(both_started.wait(), timeout=1.0)
+                return await super().execute(context, results)
+
+        engine.add_node(RendezvousNode("left", NodeType.TOOL_CALL, "Left"))
+        engine.add_node(RendezvousNode("right", NodeType.TOOL_CALL, "Right"))
+        joined = MockNode("join", NodeType.END, "Join")
+        joined.dependencies = ["left", "right"]
+        engine.add_node(joined)
+
+        result = await engine.execute_workflow(TaskContext(memory_store=None, data={}))
+        assert result["status"] == "completed"
+        assert set(result["results"]) == {"left", "right", "join"}
+        assert engine.state.completed_nodes[-1] == "join"
+
+    @pytest.mark.asyncio
+    async def test_execute_workflow_diamond_runs_join_once_after_both_branches(self):
+        """Test that a join node waits for every dependency and executes once."""
+        engine = WorkflowEngine()
+        order = []
+
+        class RecordingNode(MockNode):
+            async def execute(self, context: TaskContext, results: dict) -> dict:
+                order.append(self.id)
+                return await super().execute(context, results)
+
+        for node_id, deps in (("a", []), ("b", []), ("c", ["a"]), ("d", ["b", "c"])):
+            node = RecordingNode(node_id, NodeType.TOOL_CALL, node_id)
+            node.dependencies = deps
+            engine.add_node(node)
+
+        assert engine._dependents["a"] == ["c"]
+        assert engine._in_degree["d"] == 2
+
+        result = await engine.execute_workflow(TaskContext(memory_store=None, data={}))
+        assert result["status"] == "completed"
+        assert sorted(order) == ["a", "b", "c", "d"]
+        assert order[-1] == "d"
+
+    @pytest.mark.asyncio
+    async def test_execute_workflow_max_parallel_bounds_wave_concurrency(self):
+        """Test that max_parallel caps in-flight nodes and bookkeeping stays in wave order."""
+        engine = WorkflowEngine(max_parallel=2)
+        in_flight = {"now": 0, "peak": 0}
+
+        class SlowNode(MockNode):
+            async def execute(self, context: TaskContext, results: dict) -> dict:
+                in_flight["now"] += 1
+                in_flight["peak"] = max(in_flight["peak"], in_flight["now"])
+                # Later nodes finish first to exercise deterministic bookkeeping
+                await asyncio.sleep(0.01 * (5 - int(self.id[-1])))
+                in_flight["now"] -= 1
+                return await super().execute(context, results)
+
+        for index in range(5):
+            engine.add_node(SlowNode(f"n{index}", NodeType.TOOL_CALL, f"Node {index}"))
+
+        result = await engine.execute_workflow(TaskContext(memory_store=None, data={}))
+        assert result["status"] == "completed"
+        assert in_flight["peak"] == 2
+        assert engine.state.completed_nodes == [f"n{index}" for index in range(5)]
+
+    @pytest.mark.asyncio
+    async def test_node_context_reused_only_when_node_runs_alone(self):
+        """Test that chains share one node context while concurrent siblings get their own."""
+        engine = WorkflowEngine()
+        seen, infra = {}, {}
+
+        class ContextNode(MockNode):
+            async def execute(self, context: TaskContext, results: dict) -> dict:
+                seen[self.id] = (context, context.data["node_id"])
+                infra[self.id] = (context.memory_store, context.tool_registry)
+                await asyncio.sleep(0)
+                assert context.data["node_id"] == self.id
+                return await super().execute(context, results)
+
+        for node_id, deps in (("a", []), ("b", []), ("c", ["a", "b"]), ("d", ["c"])):
+            node = ContextNode(node_id, NodeType.TOOL_CALL, node_id)
+            node.dependencies = deps
+            engine.add_node(node)
+
+        store, registry = Mock(), Mock()
+        result = await engine.execute_workflow(TaskContext(memory_store=store, tool_registry=registry, data={}))
+        assert result["status"] == "completed"
+        assert all(mem is store and reg is registry for mem, reg in infra.values())
+        assert seen["a"][0] is not seen["b"][0]
+        assert seen["c"][0] is seen["d"][0]
+        assert {name: node_id for name, (_, node_id) in seen.items()} == {n: n for n in "abcd"}
+        # Wave contexts went back to the pool, reset
+        assert len(engine.context_pool) == 2
+        assert seen["a"][0].data == {} and seen["a"][0].memory_store is None
+
+    @pytest.mark.asyncio
+    async def test_reused_node_context_does_not_leak_data_between_nodes(self):
+        """Test that data one node stores in its context is not seen by the next node."""
+        engine = WorkflowEngine()
+        seen = {}
+
+        class ScratchNode(MockNode):
+            async def execute(self, context: TaskContext, results: dict) -> dict:
+                seen[self.id] = dict(context.data)
+                context.data["scratch"] = self.id
+                return await super().execute(context, results)
+
+        for node_id, deps in (("a", []), ("b", ["a"])):
+            node = ScratchNode(node_id, NodeType.TOOL_CALL, node_id)
+            node.dependencies = deps
+            engine.add_node(node)
+
+        result = await engine.execute_workflow(TaskContext(memory_store=None, data={}))
+        assert result["status"] == "completed"
+        assert seen["b"] == {"node_id": "b", "node_type": NodeType.TOOL_CALL}
+        assert engine.node_results["a"]["context_data"]["scratch"] == "a"
+
+    @pytest.mark.asyncio
+    async def test_execute_workflow_single_start_fans_out_to_every_dependent(self):
+        """Test that a single root with several dependents executes all of them."""
+        engine = WorkflowEngine()
+        for node_id, deps in (("root", []), ("left", ["root"]), ("right", ["root"])):
+            node = MockNode(node_id, NodeType.TOOL_CALL, node_id)
+            node.dependencies = deps
+            engine.add_node(node)
+
+        assert engine._execution_levels() == [["root"], ["left", "right"]]
+        assert engine._execution_levels() is engine._execution_levels()
+
+        result = await engine.execute_workflow(TaskContext(memory_store=None, data={}))
+        assert result["status"] == "completed"
+        assert set(result["results"]) == {"root", "left", "right"}
+
+    def test_task_context_pool_recycles_and_caps(self):
+        """Test that pooled contexts are reset on release and the free list is bounded."""
+        pool = TaskContextPool(max_size=1)
+        store = Mock()
+        with pool.acquire(memory_store=store, data={"k": 1}) as first:
+            assert first.memory_store is store and first.data == {"k": 1}
+            with pool.acquire() as second:
+                assert second is not first
+        assert len(pool) == 1
+        with pool.acquire() as reused:
+            assert reused is second or reused is first
+            assert reused.data == {} and reused.memory_store is None
@@ -164,3 +164,31 @@ async def test_workflow_sequence_error_propagation_keeps_prior_results():
         await engine.execute_sequence(["ok_node", "fail_node"], context)
 
     assert engine.node_results == {"ok_node": {"status": "ok"}}
+
+
+@pytest.mark.asyncio
+async def test_callable_node_sync_funcs_inline_or_offloaded():
+    import threading
+
+    loop_thread = threading.get_ident()
+
+    def sync_func(context, results):
+        return {"thread": threading.get_ident()}
+
+    inline_node = CallableNode(
+        id="inline_node",
+        node_type=NodeType.TOOL_CALL,
+        description="Inline",
+        func=sync_func
+    )
+    offload_node = CallableNode(
+        id="offload_node",
+        node_type=NodeType.TOOL_CALL,
+        description="Offload",
+        func=sync_func,
+        run_in_executor=True
+    )
+    context = TaskContext(memory_store=None, data={})
+
+    assert (await inline_node.execute(context, {}))["thread"] == loop_thread
+    assert (await offload_node.execute(context, {}))["thread"] != loop_thread
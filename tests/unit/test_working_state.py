@@ -72,6 +72,29 @@ def test_complete_step(manager):
     assert state["completed_steps"][0]["outcome"] == "success"
     assert state["completed_steps"][0]["artifact"] == "file://test.txt"
 
+def test_advance_step_records_and_pops_in_one_write(manager, monkeypatch):
+    task_id = manager.create_task({
+        "goal": "Advance",
+        "next_steps": [{"description": "first"}, {"description": "second"}]
+    })
+    state = manager.load_task(task_id)
+
+    writes = []
+    original_update = manager.update_task
+    monkeypatch.setattr(manager, "update_task", lambda *a, **k: writes.append(a) or original_update(*a, **k))
+
+    state = manager.advance_step(task_id, step_index=0, description="first", outcome="SUCCESS", artifact="ok", current=state)
+
+    assert len(writes) == 1
+    persisted = manager.load_task(task_id)
+    assert persisted == state
+    assert persisted["next_steps"] == [{"description": "second"}]
+    assert persisted["current_step"] is None
+    assert persisted["status"] == "IN_PROGRESS"
+    assert persisted["completed_steps"][0]["description"] == "first"
+    assert persisted["completed_steps"][0]["artifact"] == "ok"
+
+
 def test_archive_task(manager, temp_task_dir):
     task_id = manager.create_task({"goal": "Archive Test"})
     archive_file = manager.archive_task(task_id, reason="finished")
@@ -81,6 +104,34 @@ def test_archive_task(manager, temp_task_dir):
     assert "archive" in str(archive_file)
     assert "finished" in archive_file.name
 
+def test_finalize_task_writes_terminal_state_into_archive(manager, temp_task_dir):
+    task_id = manager.create_task({"goal": "Finalize Test"})
+    archive_file = manager.finalize_task(
+        task_id,
+        {"status": "FAILED", "failure_cause": "planning_invalid"},
+        reason="failed_plan"
+    )
+
+    assert not (temp_task_dir / f"{task_id}.json").exists()
+    assert archive_file.name == f"{task_id}_failed_plan.json"
+    assert not list(archive_file.parent.glob("*.tmp"))
+    archived = json.loads(archive_file.read_text())
+    assert archived["status"] == "FAILED"
+    assert archived["failure_cause"] == "planning_invalid"
+
+    with pytest.raises(FileNotFoundError):
+        manager.finalize_task(task_id, {"status": "COMPLETED"})
+
+def test_iter_active_task_paths_lists_unarchived_tasks_in_order(manager):
+    first = manager.create_task({"goal": "One"})
+    second = manager.create_task({"goal": "Two"})
+    archived = manager.create_task({"goal": "Three"})
+    manager.archive_task(archived)
+
+    listed = [(path.stem, stat.st_size > 0) for path, stat in manager.iter_active_task_paths()]
+
+    assert listed == [(task_id, True) for task_id in sorted([first, second])]
+
 def test_validation_failure(manager):
     task_id = manager.create_task({"goal": "Validation Test"})
     